@@ -0,0 +1,74 @@
+import argparse
+import sys
+import time
+from typing import Dict, List
+
+from benchmarks.puzzle_generator import generate_corpus
+from src.Models.kakuro_model import KakuroModel
+from src.Services.kakuro_service import KakuroService
+from src.Solvers.backtracking_solver import BacktrackingSolver
+from src.Types.types import PuzzleGrid
+
+
+def run(puzzle: PuzzleGrid, backjumping: bool, time_limit: float) -> Dict[str, float]:
+    """
+    Solves one puzzle and reports the search effort.
+
+    :param puzzle: Puzzle grid, it is not modified.
+    :param backjumping: Whether to use conflict-directed backjumping.
+    :param time_limit: Limit in seconds for the solve.
+    :return: Nodes, backjumps, nogood prunes, elapsed seconds and whether the solve finished.
+    """
+    solver = BacktrackingSolver(backjumping=backjumping)
+    kakuro_service = KakuroService(KakuroModel([list(row) for row in puzzle]))
+
+    started = time.perf_counter()
+    solver.solve(kakuro_service, time_limit=time_limit)
+
+    return {
+        "nodes": solver.nodes,
+        "backjumps": solver.backjumps,
+        "prunes": solver.nogood_prunes,
+        "elapsed": time.perf_counter() - started,
+        "finished": not solver.timed_out,
+    }
+
+
+def main() -> int:
+    """
+    Compares chronological backtracking with backjumping on a generated corpus.
+
+    :return: 0 if both modes finished every puzzle, 1 otherwise.
+    """
+    parser = argparse.ArgumentParser(description="Compare chronological backtracking and backjumping node counts.")
+    parser.add_argument("--count", type=int, default=20, help="number of puzzles")
+    parser.add_argument("--size", type=int, default=10, help="height and width of each puzzle")
+    parser.add_argument("--black-ratio", type=float, default=0.25)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--time-limit", type=float, default=30.0, help="limit per solve in seconds")
+    arguments = parser.parse_args()
+
+    corpus = generate_corpus(arguments.count, arguments.size, arguments.size, arguments.black_ratio, arguments.seed)
+    totals: Dict[bool, List[Dict[str, float]]] = {False: [], True: []}
+
+    print(f"{'puzzle':>6} {'chrono nodes':>13} {'bj nodes':>10} {'backjumps':>10} {'prunes':>7} {'chrono s':>9} {'bj s':>7}")
+    for index, puzzle in enumerate(corpus):
+        chronological = run(puzzle, False, arguments.time_limit)
+        backjumping = run(puzzle, True, arguments.time_limit)
+        totals[False].append(chronological)
+        totals[True].append(backjumping)
+
+        print(f"{index:>6} {chronological['nodes']:>13} {backjumping['nodes']:>10} {backjumping['backjumps']:>10} "
+              f"{backjumping['prunes']:>7} {chronological['elapsed']:>9.3f} {backjumping['elapsed']:>7.3f}")
+
+    for backjumping, results in totals.items():
+        name = "backjumping" if backjumping else "chronological"
+        unfinished = sum(not result["finished"] for result in results)
+        print(f"{name:>13}: {sum(result['nodes'] for result in results):>10} nodes, "
+              f"{sum(result['elapsed'] for result in results):8.2f} s, {unfinished} timed out")
+
+    return 0 if all(result["finished"] for results in totals.values() for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,55 @@
+import argparse
+import sys
+import time
+
+from benchmarks.puzzle_generator import generate_corpus
+from src.Models.kakuro_model import KakuroModel
+from src.Services.difficulty_rater import TECHNIQUES, DifficultyRater
+from src.Services.kakuro_service import KakuroService
+from src.Solvers.backtracking_solver import BacktrackingSolver
+
+
+def main() -> int:
+    """
+    Measures the rating throughput of each technique level and compares the ratings with the
+    backtracking nodes a full solve of the same puzzles needs.
+
+    :return: 0
+    """
+    parser = argparse.ArgumentParser(description="Rate a generated corpus and compare the ratings with solve effort.")
+    parser.add_argument("--count", type=int, default=500, help="number of puzzles")
+    parser.add_argument("--size", type=int, default=7, help="height and width of each puzzle")
+    parser.add_argument("--black-ratio", type=float, default=0.4)
+    parser.add_argument("--solve", type=int, default=100, help="number of puzzles also solved")
+    parser.add_argument("--time-limit", type=float, default=5)
+    arguments = parser.parse_args()
+
+    corpus = generate_corpus(arguments.count, arguments.size, arguments.size, arguments.black_ratio)
+    ratings = []
+
+    print(f"{'max level':>13} {'puzzles/s':>10} {'solved by logic':>16}")
+    for max_level in range(1, len(TECHNIQUES) - 1):
+        rater = DifficultyRater(max_level)
+        started = time.perf_counter()
+        ratings = [rater.rate(KakuroService(KakuroModel(puzzle))) for puzzle in corpus]
+        elapsed = time.perf_counter() - started
+        print(f"{TECHNIQUES[max_level]:>13} {len(corpus) / elapsed:>10.0f} "
+              f"{sum(not rating.remaining for rating in ratings):>16}")
+
+    solver = BacktrackingSolver()
+    nodes = {}
+    for puzzle, rating in list(zip(corpus, ratings))[:arguments.solve]:
+        kakuro_service = KakuroService(KakuroModel([list(row) for row in puzzle]))
+        solver.solve(kakuro_service, time_limit=arguments.time_limit)
+        nodes.setdefault(rating.technique, []).append(solver.nodes)
+
+    print(f"\n{'rated':>13} {'puzzles':>8} {'mean nodes':>11}")
+    for technique in TECHNIQUES:
+        if technique in nodes:
+            print(f"{technique:>13} {len(nodes[technique]):>8} {sum(nodes[technique]) / len(nodes[technique]):>11.1f}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
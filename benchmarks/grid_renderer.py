@@ -0,0 +1,75 @@
+import argparse
+import io
+import sys
+import time
+
+from benchmarks.puzzle_generator import generate_corpus
+from src.Services.grid_renderer import FORMATS, FORMAT_PRETTY, GridRenderer, format_clue
+from src.Types.types import PuzzleGrid
+
+
+def render_concatenated(grid: PuzzleGrid, stream: io.StringIO) -> None:
+    """
+    The former KakuroService.print_grid: one string concatenation and format call per cell.
+    """
+    for row in grid:
+        row_str = ""
+
+        for cell in row:
+            if cell == 'X':
+                row_str += " ███ "
+            elif isinstance(cell, tuple):
+                clue_text = format_clue(cell)
+                row_str += f"{clue_text:^5}"
+            else:
+                val = str(cell) if cell is not None else '.'
+                row_str += f"  {val}  "
+
+        print(row_str, file=stream)
+
+
+def main() -> int:
+    """
+    Measures the grids rendered per second by the former print_grid and by each GridRenderer format.
+
+    :return: 0
+    """
+    parser = argparse.ArgumentParser(description="Compare print_grid string building with GridRenderer.")
+    parser.add_argument("--count", type=int, default=2000, help="number of grids")
+    parser.add_argument("--distinct", type=int, default=20, help="number of distinct grids, repeated up to --count")
+    parser.add_argument("--size", type=int, default=30, help="height and width of each grid")
+    arguments = parser.parse_args()
+
+    corpus = generate_corpus(arguments.distinct, arguments.size, arguments.size, 0.3)
+    for grid in corpus:
+        for row_index, row in enumerate(grid):
+            for column, cell in enumerate(row):
+                if cell is None:
+                    row[column] = (row_index + column) % 9 + 1
+    grids = (corpus * (arguments.count // len(corpus) + 1))[:arguments.count]
+
+    stream = io.StringIO()
+    started = time.perf_counter()
+    for grid in grids:
+        render_concatenated(grid, stream)
+    elapsed = time.perf_counter() - started
+    print(f"{'print_grid':>12} {len(grids) / elapsed:>10.0f} grids/s")
+
+    expected = stream.getvalue()
+
+    for output_format in FORMATS:
+        stream = io.StringIO()
+        renderer = GridRenderer(output_format)
+        started = time.perf_counter()
+        renderer.write_all(grids, stream)
+        elapsed = time.perf_counter() - started
+        print(f"{output_format:>12} {len(grids) / elapsed:>10.0f} grids/s")
+
+        if output_format == FORMAT_PRETTY:
+            assert stream.getvalue().replace("\n\n", "\n") == expected
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,93 @@
+import argparse
+import http.client
+import json
+import socket
+import statistics
+import sys
+import threading
+import time
+from typing import List, Optional
+from urllib.parse import urlparse
+
+from src.Loaders.kakuro_loader import load_puzzle_from_path
+
+DEFAULT_PUZZLE = [
+    ["X", [21, None], [6, None], [5, None], [10, None]],
+    [[None, 21], 9, None, None, None],
+    [[None, 6], None, [4, 4], None, None],
+    [[None, 7], None, None, [7, 1], None],
+    [[None, 14], None, None, None, None],
+]
+
+
+def run_client(url: str, path: str, body: bytes, stop_at: float, latencies: List[float], errors: List[int]) -> None:
+    """
+    Sends requests over one keep-alive connection until stop_at.
+    """
+    target = urlparse(url)
+    connection = http.client.HTTPConnection(target.hostname, target.port, timeout=60)
+    connection.connect()
+    # http.client writes headers and body separately; without TCP_NODELAY every
+    # request waits on the server's delayed ACK.
+    connection.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    while time.monotonic() < stop_at:
+        started = time.monotonic()
+        connection.request("POST", path, body=body, headers={"Content-Type": "application/json"})
+        response = connection.getresponse()
+        response.read()
+        latencies.append(time.monotonic() - started)
+        if response.status != 200:
+            errors.append(response.status)
+
+    connection.close()
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Measures requests per second of a running HTTP solving service.
+    """
+    parser = argparse.ArgumentParser(description="Load generator for src.Server.http_server.")
+    parser.add_argument("--url", default="http://127.0.0.1:8080")
+    parser.add_argument("--endpoint", default="/solve", choices=["/solve", "/validate", "/count-solutions"])
+    parser.add_argument("--engine", default="backtracking")
+    parser.add_argument("--puzzle", help="puzzle JSON file, defaults to a small built-in puzzle")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=10.0, help="seconds")
+    arguments = parser.parse_args(argv)
+
+    puzzle = load_puzzle_from_path(arguments.puzzle) if arguments.puzzle else DEFAULT_PUZZLE
+    body = json.dumps({"puzzle": puzzle, "engine": arguments.engine}).encode("utf-8")
+
+    latencies: List[float] = []
+    errors: List[int] = []
+    stop_at = time.monotonic() + arguments.duration
+    clients = [
+        threading.Thread(target=run_client, args=(arguments.url, arguments.endpoint, body, stop_at, latencies, errors))
+        for _ in range(arguments.concurrency)
+    ]
+
+    started = time.monotonic()
+    for client in clients:
+        client.start()
+    for client in clients:
+        client.join()
+    elapsed = time.monotonic() - started
+
+    latencies.sort()
+    print(f"requests:    {len(latencies)} ({len(errors)} errors)")
+    print(f"throughput:  {len(latencies) / elapsed:.1f} requests/s")
+    if latencies:
+        print(f"latency p50: {statistics.median(latencies) * 1000:.2f} ms")
+        print(f"latency p95: {latencies[int(len(latencies) * 0.95) - 1] * 1000:.2f} ms")
+
+    target = urlparse(arguments.url)
+    connection = http.client.HTTPConnection(target.hostname, target.port, timeout=60)
+    connection.request("GET", "/metrics")
+    print(json.dumps(json.loads(connection.getresponse().read()), indent=2))
+
+    return 1 if errors else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,65 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+from typing import List
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+BASELINE = "pass"
+
+PURE_PYTHON_STARTUP = """
+from src.Loaders.kakuro_loader import parse_puzzle
+from src.Models.kakuro_model import KakuroModel
+from src.Services.kakuro_service import KakuroService
+from src.Solvers.solver_registry import create_solver
+
+puzzle = parse_puzzle([["X", [3, None], [4, None]], [[None, 3], None, None], [[None, 4], None, None]])
+create_solver("backtracking").solve(KakuroService(KakuroModel(puzzle)))
+"""
+
+
+def measure(code: str, repeat: int) -> List[float]:
+    """
+    Measures the wall time of fresh interpreters running a snippet.
+
+    :param code: Python source to run.
+    :param repeat: Number of interpreter runs.
+    :return: Wall times in milliseconds.
+    """
+    timings = []
+
+    for _ in range(repeat):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, "-c", code], cwd=ROOT, check=True)
+        timings.append((time.perf_counter() - started) * 1000)
+
+    return timings
+
+
+def main() -> int:
+    """
+    Reports how much a cold start of the pure-Python solving path adds on top of a bare interpreter.
+
+    :return: 0 if the median overhead is within the budget, 1 otherwise.
+    """
+    parser = argparse.ArgumentParser(description="Measure cold-start time of the pure-Python solver path.")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--budget-ms", type=float, default=50.0, help="allowed median overhead in milliseconds")
+    arguments = parser.parse_args()
+
+    baseline = statistics.median(measure(BASELINE, arguments.repeat))
+    startup = statistics.median(measure(PURE_PYTHON_STARTUP, arguments.repeat))
+    overhead = startup - baseline
+
+    print(f"bare interpreter:        {baseline:7.1f} ms")
+    print(f"import, build and solve: {startup:7.1f} ms")
+    print(f"overhead:                {overhead:7.1f} ms (budget {arguments.budget_ms:.0f} ms)")
+
+    return 0 if overhead <= arguments.budget_ms else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
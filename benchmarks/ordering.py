@@ -0,0 +1,53 @@
+import argparse
+import itertools
+import sys
+import time
+from typing import Dict, List, Tuple
+
+from benchmarks.puzzle_generator import generate_corpus
+from src.Models.kakuro_model import KakuroModel
+from src.Services.kakuro_service import KakuroService
+from src.Solvers.backtracking_solver import BacktrackingSolver
+from src.Solvers.ordering import VALUE_ORDERINGS, VARIABLE_ORDERINGS
+
+
+def main() -> int:
+    """
+    Compares every variable and value ordering pair on a generated corpus.
+
+    :return: 0 if every solve finished within the time limit, 1 otherwise.
+    """
+    parser = argparse.ArgumentParser(description="Compare backtracking ordering heuristics.")
+    parser.add_argument("--count", type=int, default=20, help="number of puzzles")
+    parser.add_argument("--size", type=int, default=10, help="height and width of each puzzle")
+    parser.add_argument("--black-ratio", type=float, default=0.25)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--time-limit", type=float, default=10.0, help="limit per solve in seconds")
+    parser.add_argument("--backjumping", action="store_true", help="search with conflict-directed backjumping")
+    arguments = parser.parse_args()
+
+    corpus = generate_corpus(arguments.count, arguments.size, arguments.size, arguments.black_ratio, arguments.seed)
+    results: Dict[Tuple[str, str], List[Tuple[int, float, bool]]] = {}
+
+    for variable_ordering, value_ordering in itertools.product(VARIABLE_ORDERINGS, VALUE_ORDERINGS):
+        solver = BacktrackingSolver(backjumping=arguments.backjumping)
+        runs = results.setdefault((variable_ordering, value_ordering), [])
+
+        for puzzle in corpus:
+            kakuro_service = KakuroService(KakuroModel([list(row) for row in puzzle]))
+            started = time.perf_counter()
+            solver.solve(kakuro_service, time_limit=arguments.time_limit,
+                         variable_ordering=variable_ordering, value_ordering=value_ordering)
+            runs.append((solver.nodes, time.perf_counter() - started, not solver.timed_out))
+
+    print(f"{'variable ordering':>22} {'value ordering':>14} {'nodes':>10} {'max nodes':>10} {'seconds':>8} {'timeouts':>8}")
+    for (variable_ordering, value_ordering), runs in results.items():
+        print(f"{variable_ordering:>22} {value_ordering:>14} {sum(run[0] for run in runs):>10} "
+              f"{max(run[0] for run in runs):>10} {sum(run[1] for run in runs):>8.2f} "
+              f"{sum(not run[2] for run in runs):>8}")
+
+    return 0 if all(run[2] for runs in results.values() for run in runs) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
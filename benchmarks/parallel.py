@@ -0,0 +1,47 @@
+import argparse
+import sys
+import time
+
+from benchmarks.puzzle_generator import generate_corpus
+from src.Models.kakuro_model import KakuroModel
+from src.Services.kakuro_service import KakuroService
+from src.Solvers.backtracking_solver import BacktrackingSolver
+from src.Solvers.parallel_solver import ParallelBacktrackingSolver
+
+
+def main() -> int:
+    """
+    Compares the sequential and the parallel backtracking solver puzzle by puzzle.
+
+    :return: 0 if both solvers agree on every puzzle, 1 otherwise.
+    """
+    parser = argparse.ArgumentParser(description="Compare sequential and subtree-parallel backtracking.")
+    parser.add_argument("--count", type=int, default=10, help="number of puzzles")
+    parser.add_argument("--size", type=int, default=10, help="height and width of each puzzle")
+    parser.add_argument("--black-ratio", type=float, default=0.25)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--split-depth", type=int, default=4)
+    parser.add_argument("--time-limit", type=float, default=30.0, help="limit per solve in seconds")
+    arguments = parser.parse_args()
+
+    corpus = generate_corpus(arguments.count, arguments.size, arguments.size, arguments.black_ratio, arguments.seed)
+    agree = True
+
+    print(f"{'puzzle':>6} {'sequential s':>13} {'parallel s':>11} {'subtrees':>9}")
+    for index, puzzle in enumerate(corpus):
+        results = []
+        for solver in (BacktrackingSolver(), ParallelBacktrackingSolver(arguments.workers, arguments.split_depth)):
+            kakuro_service = KakuroService(KakuroModel([list(row) for row in puzzle]))
+            started = time.perf_counter()
+            solved = solver.solve(kakuro_service, time_limit=arguments.time_limit)
+            results.append((solved, time.perf_counter() - started, solver.timed_out))
+
+        agree = agree and (results[0][0] == results[1][0] or results[0][2] or results[1][2])
+        print(f"{index:>6} {results[0][1]:>13.3f} {results[1][1]:>11.3f} {solver.subtrees:>9}")
+
+    return 0 if agree else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,140 @@
+import random
+from typing import List, Optional
+
+from src.Types.types import PuzzleGrid
+
+MAX_RUN_LENGTH = 9
+
+
+def generate_layout(height: int, width: int, black_ratio: float, rng: random.Random) -> List[List[bool]]:
+    """
+    Generates a random block layout: True for white cells, False for black ones.
+
+    The first row and column are black, and runs are kept between 2 and MAX_RUN_LENGTH cells
+    by blackening single cells and splitting long runs.
+
+    :param height: Number of rows, including the clue row.
+    :param width: Number of columns, including the clue column.
+    :param black_ratio: Probability of an inner cell being black.
+    :param rng: Random number generator.
+    :return: 2D list of booleans.
+    """
+    white = [[row > 0 and column > 0 and rng.random() >= black_ratio for column in range(width)] for row in range(height)]
+
+    changed = True
+    while changed:
+        changed = False
+        for lines in (white, [list(column) for column in zip(*white)]):
+            for index, line in enumerate(lines):
+                start = None
+                for position in range(len(line) + 1):
+                    if position < len(line) and line[position]:
+                        if start is None:
+                            start = position
+                        continue
+                    if start is not None:
+                        length = position - start
+                        if length == 1 or length > MAX_RUN_LENGTH:
+                            cut = start if length == 1 else start + rng.randint(2, MAX_RUN_LENGTH)
+                            if lines is white:
+                                white[index][cut] = False
+                            else:
+                                white[cut][index] = False
+                            changed = True
+                        start = None
+
+    return white
+
+
+def fill_layout(white: List[List[bool]], rng: random.Random) -> Optional[List[List[int]]]:
+    """
+    Fills the white cells with digits so that no run repeats a digit.
+
+    :param white: Layout from generate_layout.
+    :param rng: Random number generator.
+    :return: 2D list of digits (0 on black cells), or None if no filling was found.
+    """
+    cells = [(row, column) for row in range(len(white)) for column in range(len(white[0])) if white[row][column]]
+    values = [[0] * len(white[0]) for _ in white]
+
+    def run_digits(row: int, column: int) -> set:
+        used = set()
+        for d_row, d_column in ((1, 0), (-1, 0), (0, 1), (0, -1)):
+            r, c = row + d_row, column + d_column
+            while 0 <= r < len(white) and 0 <= c < len(white[0]) and white[r][c]:
+                used.add(values[r][c])
+                r, c = r + d_row, c + d_column
+        return used
+
+    def fill(index: int) -> bool:
+        if index == len(cells):
+            return True
+        row, column = cells[index]
+        digits = [digit for digit in range(1, 10) if digit not in run_digits(row, column)]
+        rng.shuffle(digits)
+        for digit in digits:
+            values[row][column] = digit
+            if fill(index + 1):
+                return True
+        values[row][column] = 0
+        return False
+
+    return values if fill(0) else None
+
+
+def generate_puzzle(height: int, width: int, black_ratio: float = 0.25, seed: Optional[int] = None) -> PuzzleGrid:
+    """
+    Generates a random Kakuro puzzle with at least one solution.
+
+    The solution is not necessarily unique, which is fine for benchmarking search effort.
+
+    :param height: Number of rows, including the clue row.
+    :param width: Number of columns, including the clue column.
+    :param black_ratio: Probability of an inner cell being black.
+    :param seed: Seed making the puzzle reproducible.
+    :return: Puzzle grid with empty white cells.
+    """
+    rng = random.Random(seed)
+
+    while True:
+        white = generate_layout(height, width, black_ratio, rng)
+        values = fill_layout(white, rng)
+        if values is not None and any(any(line) for line in white):
+            break
+
+    grid: PuzzleGrid = []
+    for row in range(height):
+        line = []
+        for column in range(width):
+            if white[row][column]:
+                line.append(None)
+                continue
+
+            down = right = None
+            if row + 1 < height and white[row + 1][column]:
+                down, r = 0, row + 1
+                while r < height and white[r][column]:
+                    down, r = down + values[r][column], r + 1
+            if column + 1 < width and white[row][column + 1]:
+                right, c = 0, column + 1
+                while c < width and white[row][c]:
+                    right, c = right + values[row][c], c + 1
+
+            line.append('X' if down is None and right is None else (down, right))
+        grid.append(line)
+
+    return grid
+
+
+def generate_corpus(count: int, height: int, width: int, black_ratio: float = 0.25, seed: int = 0) -> List[PuzzleGrid]:
+    """
+    Generates a reproducible list of puzzles.
+
+    :param count: Number of puzzles.
+    :param height: Number of rows of each puzzle.
+    :param width: Number of columns of each puzzle.
+    :param black_ratio: Probability of an inner cell being black.
+    :param seed: Seed of the first puzzle, the following ones use the next seeds.
+    :return: List of puzzle grids.
+    """
+    return [generate_puzzle(height, width, black_ratio, seed + index) for index in range(count)]
\ No newline at end of file
@@ -0,0 +1,65 @@
+import argparse
+import json
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+
+from benchmarks.puzzle_generator import generate_corpus
+from src.Cache.puzzle_fingerprint import puzzle_fingerprint
+from src.Cache.results_sink import SqliteResultsSink
+from src.Models.kakuro_model import KakuroModel
+from src.Services.kakuro_service import KakuroService
+from src.Solvers.backtracking_solver import BacktrackingSolver
+
+
+def main() -> int:
+    """
+    Compares writing solve results one committed row at a time with SqliteResultsSink.
+
+    :return: 0
+    """
+    parser = argparse.ArgumentParser(description="Compare per-row result writes with the batched SQLite sink.")
+    parser.add_argument("--count", type=int, default=200, help="number of distinct puzzles")
+    parser.add_argument("--repeat", type=int, default=10, help="times each result is written")
+    parser.add_argument("--size", type=int, default=8, help="height and width of each puzzle")
+    parser.add_argument("--batch-size", type=int, default=1000)
+    arguments = parser.parse_args()
+
+    corpus = generate_corpus(arguments.count, arguments.size, arguments.size)
+    solver = BacktrackingSolver()
+    results = []
+
+    for puzzle in corpus:
+        kakuro_service = KakuroService(KakuroModel([list(row) for row in puzzle]))
+        results.append((puzzle, kakuro_service.model.grid if solver.solve(kakuro_service, time_limit=5) else None))
+
+    directory = tempfile.mkdtemp()
+    results = results * arguments.repeat
+
+    connection = sqlite3.connect(os.path.join(directory, "rows.db"))
+    connection.execute("CREATE TABLE results (fingerprint TEXT, status TEXT, grid TEXT)")
+    started = time.perf_counter()
+    for puzzle, solution in results:
+        connection.execute("INSERT INTO results VALUES (?, ?, ?)",
+                           (puzzle_fingerprint(puzzle), "solved" if solution else "unsolvable", json.dumps(solution)))
+        connection.commit()
+    row_elapsed = time.perf_counter() - started
+    connection.close()
+
+    started = time.perf_counter()
+    with SqliteResultsSink(os.path.join(directory, "sink.db"), arguments.batch_size) as sink:
+        for puzzle, solution in results:
+            sink.add(puzzle, solution, "solved" if solution else "unsolvable", str(solver))
+    sink_elapsed = time.perf_counter() - started
+
+    for name, elapsed in (("row at a time", row_elapsed), ("batched sink", sink_elapsed)):
+        size = os.path.getsize(os.path.join(directory, "rows.db" if name == "row at a time" else "sink.db"))
+        print(f"{name:>13}: {len(results) / elapsed:10.0f} results/s, {size / 1024:8.0f} KiB")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
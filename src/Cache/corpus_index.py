@@ -0,0 +1,180 @@
+import os
+import sqlite3
+from typing import Any, Iterable, Iterator, List, Optional, Tuple
+
+from src.Cache.puzzle_fingerprint import puzzle_fingerprint
+from src.Types.types import PuzzleGrid
+
+
+def iter_corpus_paths(inputs: Iterable[str]) -> Iterator[str]:
+    """
+    Streams the puzzle files of a corpus, walking directories recursively in name order
+    without listing the whole corpus first.
+
+    :param inputs: Puzzle files or directories of *.json puzzles.
+    :return: Iterator over the file paths.
+    """
+    for path in inputs:
+        if not os.path.isdir(path):
+            yield path
+            continue
+
+        for directory, subdirectories, names in os.walk(path):
+            subdirectories.sort()
+            for name in sorted(names):
+                if name.endswith(".json"):
+                    yield os.path.join(directory, name)
+
+
+class CorpusIndex:
+    """
+    On-disk index of a puzzle corpus, keyed by canonical puzzle fingerprint.
+
+    The fingerprint is the same for a puzzle, its transpose (which swaps every down and right sum)
+    and any other representation of the same grid, so all of them fall in one cluster. Each
+    cluster keeps the first path seen as its representative; every path is recorded as well, so
+    duplicate clusters can be reported afterwards.
+
+    Entries are written in batches, so indexing holds at most batch_size entries in memory
+    whatever the size of the corpus, and a path indexed again replaces its previous entry, so an
+    index can be refreshed with the files added or changed since. A changed file leaves its former
+    cluster, which is dropped if it is left empty or else gets its smallest remaining path as
+    representative. Lookups go through the fingerprint primary key.
+
+    :param path: Path to the SQLite database file.
+    :param batch_size: Number of entries written per transaction.
+    """
+    def __init__(self, path: str, batch_size: int = 10000) -> None:
+        self.path: str = path
+        self.batch_size: int = batch_size
+        self.pending: List[Tuple[str, str]] = []
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS puzzles (fingerprint TEXT PRIMARY KEY, path TEXT NOT NULL) WITHOUT ROWID"
+        )
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS entries (path TEXT PRIMARY KEY, fingerprint TEXT NOT NULL) WITHOUT ROWID"
+        )
+        self.connection.execute("CREATE INDEX IF NOT EXISTS entries_fingerprint ON entries (fingerprint)")
+        self.connection.commit()
+
+    def add(self, path: str, puzzle: PuzzleGrid) -> str:
+        """
+        Queues one puzzle of the corpus, writing the pending batch if it is full.
+
+        :param path: Where the puzzle is stored.
+        :param puzzle: Puzzle grid.
+        :return: Fingerprint of the puzzle.
+        """
+        fingerprint = puzzle_fingerprint(puzzle)
+        self.pending.append((fingerprint, path))
+
+        if len(self.pending) >= self.batch_size:
+            self.flush()
+
+        return fingerprint
+
+    def flush(self) -> None:
+        """
+        Writes the pending entries in one transaction, moving the paths whose puzzle changed out
+        of their former cluster.
+        """
+        if not self.pending:
+            return
+
+        # The last puzzle queued for a path wins, as it would have been written last.
+        latest = {path: fingerprint for fingerprint, path in self.pending}
+        entries = [(fingerprint, path) for path, fingerprint in latest.items()]
+
+        with self.connection:
+            left = set()
+            for fingerprint, path in entries:
+                row = self.connection.execute("SELECT fingerprint FROM entries WHERE path = ?", (path,)).fetchone()
+                if row is not None and row[0] != fingerprint:
+                    left.add((row[0],))
+
+            self.connection.executemany("INSERT OR REPLACE INTO entries (fingerprint, path) VALUES (?, ?)", entries)
+            self.connection.executemany(
+                "DELETE FROM puzzles WHERE fingerprint = ?1 "
+                "AND NOT EXISTS (SELECT 1 FROM entries WHERE fingerprint = ?1)", left
+            )
+            self.connection.executemany(
+                "UPDATE puzzles SET path = (SELECT MIN(path) FROM entries WHERE fingerprint = ?1) "
+                "WHERE fingerprint = ?1 "
+                "AND NOT EXISTS (SELECT 1 FROM entries WHERE fingerprint = ?1 AND path = puzzles.path)", left
+            )
+            self.connection.executemany("INSERT OR IGNORE INTO puzzles (fingerprint, path) VALUES (?, ?)", entries)
+        self.pending = []
+
+    def lookup(self, puzzle: PuzzleGrid) -> Optional[str]:
+        """
+        Finds a puzzle, in any orientation, in the index.
+
+        :param puzzle: Puzzle grid.
+        :return: Path of the representative of its cluster, or None if it is not indexed.
+        """
+        return self.lookup_fingerprint(puzzle_fingerprint(puzzle))
+
+    def lookup_fingerprint(self, fingerprint: str) -> Optional[str]:
+        """
+        :param fingerprint: Canonical puzzle fingerprint.
+        :return: Path of the representative of its cluster, or None if it is not indexed.
+        """
+        self.flush()
+        row = self.connection.execute("SELECT path FROM puzzles WHERE fingerprint = ?", (fingerprint,)).fetchone()
+
+        return None if row is None else row[0]
+
+    def count(self) -> Tuple[int, int]:
+        """
+        :return: (puzzles, unique) tuple, the number of indexed paths and of distinct puzzles.
+        """
+        self.flush()
+        puzzles = self.connection.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        unique = self.connection.execute("SELECT COUNT(*) FROM puzzles").fetchone()[0]
+
+        return puzzles, unique
+
+    def iter_duplicate_clusters(self) -> Iterator[Tuple[str, List[str]]]:
+        """
+        Streams the clusters holding more than one path, largest first.
+
+        :return: Iterator of (fingerprint, paths) tuples, the representative path first.
+        """
+        self.flush()
+        clusters = self.connection.execute(
+            "SELECT fingerprint FROM entries GROUP BY fingerprint HAVING COUNT(*) > 1 ORDER BY COUNT(*) DESC, fingerprint"
+        )
+
+        for (fingerprint,) in clusters:
+            representative = self.lookup_fingerprint(fingerprint)
+            paths = [row[0] for row in self.connection.execute(
+                "SELECT path FROM entries WHERE fingerprint = ? ORDER BY path", (fingerprint,)
+            )]
+            paths.sort(key=lambda path: path != representative)
+            yield fingerprint, paths
+
+    def iter_unique_paths(self) -> Iterator[str]:
+        """
+        Streams one path per distinct puzzle, the corpus to solve once duplicates are dropped.
+
+        :return: Iterator over the representative paths.
+        """
+        self.flush()
+        for row in self.connection.execute("SELECT path FROM puzzles ORDER BY path"):
+            yield row[0]
+
+    def close(self) -> None:
+        """
+        Writes the pending entries and closes the database connection.
+        """
+        self.flush()
+        self.connection.close()
+
+    def __enter__(self) -> "CorpusIndex":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
\ No newline at end of file
@@ -0,0 +1,70 @@
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+
+class LRUCache:
+    """
+    A bounded mapping that evicts the least recently used entry once full.
+
+    Keeps hit and miss counters so callers can judge how effective the cache is.
+    The cache is not thread-safe; callers sharing it across threads must lock around it.
+
+    :param capacity: Maximum number of entries kept in memory.
+    :param on_evict: Optional callback called with (key, value) for every evicted entry.
+    """
+    def __init__(self, capacity: int = 1024, on_evict: Optional[Callable[[Hashable, Any], None]] = None) -> None:
+        if capacity < 1:
+            raise ValueError("LRUCache capacity must be at least 1")
+
+        self.capacity: int = capacity
+        self.on_evict: Optional[Callable[[Hashable, Any], None]] = on_evict
+        self.hits: int = 0
+        self.misses: int = 0
+        self.entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        """
+        Look up a key and mark it as most recently used.
+
+        :param key: Key to look up.
+        :param default: Value returned when the key is not cached.
+        :return: Cached value or default.
+        """
+        try:
+            value = self.entries[key]
+        except KeyError:
+            self.misses += 1
+            return default
+
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """
+        Store a value, evicting the least recently used entry if the cache is full.
+
+        :param key: Key to store.
+        :param value: Value to store.
+        """
+        self.entries[key] = value
+        self.entries.move_to_end(key)
+
+        while len(self.entries) > self.capacity:
+            evicted_key, evicted_value = self.entries.popitem(last=False)
+            if self.on_evict is not None:
+                self.on_evict(evicted_key, evicted_value)
+
+    def clear(self) -> None:
+        """
+        Remove all entries and reset the counters.
+        """
+        self.entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
\ No newline at end of file
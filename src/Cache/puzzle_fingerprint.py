@@ -0,0 +1,97 @@
+import hashlib
+import json
+from typing import Tuple
+
+from src.Types.types import CanonicalGrid, CellValue, PuzzleGrid
+
+
+def normalize_cell(cell: CellValue) -> CellValue:
+    """
+    Normalizes a single grid cell so that equivalent representations compare equal.
+
+    Clues given as lists (as they come out of JSON) are converted to tuples.
+
+    :param cell: Cell value from a puzzle grid.
+    :return: Normalized cell value.
+    """
+    if isinstance(cell, list):
+        return tuple(cell)
+    return cell
+
+
+def normalize_grid(grid: PuzzleGrid) -> CanonicalGrid:
+    """
+    Converts a puzzle grid into an immutable tuple-of-tuples with normalized cells.
+
+    :param grid: 2D puzzle grid.
+    :return: Immutable, normalized copy of the grid.
+    """
+    return tuple(tuple(normalize_cell(cell) for cell in row) for row in grid)
+
+
+def transpose_grid(grid: CanonicalGrid) -> CanonicalGrid:
+    """
+    Transposes a normalized grid, swapping the down and right sums of every clue.
+
+    A transposed puzzle has exactly the transposed solutions of the original one.
+
+    :param grid: Normalized puzzle grid.
+    :return: Transposed grid.
+    """
+    height, width = len(grid), len(grid[0])
+
+    return tuple(
+        tuple(
+            (grid[row][column][1], grid[row][column][0]) if isinstance(grid[row][column], tuple) else grid[row][column]
+            for row in range(height)
+        )
+        for column in range(width)
+    )
+
+
+def encode_grid(grid: CanonicalGrid) -> str:
+    """
+    Serializes a normalized grid into a compact, deterministic JSON string.
+
+    :param grid: Normalized puzzle grid.
+    :return: JSON encoding of the grid.
+    """
+    return json.dumps(grid, separators=(",", ":"))
+
+
+def canonicalize(grid: PuzzleGrid) -> Tuple[CanonicalGrid, bool]:
+    """
+    Picks the canonical orientation of a puzzle.
+
+    The canonical form is whichever of the grid and its transpose has the smaller encoding.
+
+    :param grid: 2D puzzle grid.
+    :return: (canonical_grid, transposed) tuple, transposed is True if the canonical form is the transpose.
+    """
+    normalized = normalize_grid(grid)
+    transposed = transpose_grid(normalized)
+
+    if encode_grid(transposed) < encode_grid(normalized):
+        return transposed, True
+    return normalized, False
+
+
+def hash_grid(grid: CanonicalGrid) -> str:
+    """
+    Hashes a grid that is already in canonical orientation.
+
+    :param grid: Canonical puzzle grid.
+    :return: Hex encoded SHA-256 digest of the grid encoding.
+    """
+    return hashlib.sha256(encode_grid(grid).encode("utf-8")).hexdigest()
+
+
+def puzzle_fingerprint(grid: PuzzleGrid) -> str:
+    """
+    Computes a hash of a puzzle that is stable under transposition and representation changes.
+
+    :param grid: 2D puzzle grid.
+    :return: Hex encoded SHA-256 digest of the canonical grid.
+    """
+    canonical, _ = canonicalize(grid)
+    return hash_grid(canonical)
\ No newline at end of file
@@ -0,0 +1,229 @@
+import sqlite3
+import threading
+import time
+from typing import Any, List, Optional, Tuple
+
+from src.Cache.puzzle_fingerprint import canonicalize, hash_grid, normalize_grid
+from src.Types.types import CanonicalGrid, CellPosition, PuzzleGrid
+
+EMPTY_CELL = "."
+
+ResultRow = Tuple[str, Optional[str], Optional[str], str, Optional[str], Optional[float], Optional[int], float]
+
+
+def get_white_cells(grid: CanonicalGrid) -> List[CellPosition]:
+    """
+    Lists the white cells of a grid in row-major order.
+
+    :param grid: Normalized puzzle grid.
+    :return: Positions of the empty or filled cells.
+    """
+    return [
+        (row, column)
+        for row, cells in enumerate(grid)
+        for column, cell in enumerate(cells)
+        if cell is None or isinstance(cell, int)
+    ]
+
+
+def encode_solution(canonical: CanonicalGrid, transposed: bool, solution: PuzzleGrid) -> str:
+    """
+    Encodes a solution as one character per white cell of the canonical puzzle, chr(48 + digit),
+    which is the digit itself for 0-9; unfilled cells are '.'.
+
+    :param canonical: Puzzle in canonical orientation.
+    :param transposed: Whether the canonical orientation is the transpose of the solution's one.
+    :param solution: Solved grid in the orientation of the puzzle as given.
+    :return: Digit string.
+    """
+    characters = []
+
+    for row, column in get_white_cells(canonical):
+        value = solution[column][row] if transposed else solution[row][column]
+        characters.append(EMPTY_CELL if value is None else chr(48 + value))
+
+    return "".join(characters)
+
+
+def decode_solution(puzzle: PuzzleGrid, encoded: str) -> PuzzleGrid:
+    """
+    Rebuilds a solved grid from the digit string stored for a puzzle.
+
+    :param puzzle: Puzzle grid, in any orientation; it is not modified.
+    :param encoded: Digit string from encode_solution.
+    :return: Solved grid in the orientation of the given puzzle.
+    """
+    canonical, transposed = canonicalize(puzzle)
+    grid = [list(row) for row in normalize_grid(puzzle)]
+
+    for (row, column), character in zip(get_white_cells(canonical), encoded):
+        value = None if character == EMPTY_CELL else ord(character) - 48
+        if transposed:
+            grid[column][row] = value
+        else:
+            grid[row][column] = value
+
+    return grid
+
+
+class SqliteResultsSink:
+    """
+    Writes solve results to a SQLite database in batches.
+
+    Results are buffered and inserted with one executemany per transaction once batch_size of
+    them are pending (and on flush/close). The database runs in WAL mode, solutions are stored
+    as digit strings over the white cells of the canonical puzzle, and rows are indexed by
+    puzzle fingerprint, so a puzzle and its transpose find the same results.
+
+    Typical use in a batch loop:
+
+        with SqliteResultsSink("results.db") as sink:
+            for puzzle in puzzles:
+                kakuro_service = KakuroService(KakuroModel([list(row) for row in puzzle]))
+                solved = solver.solve(kakuro_service)
+                sink.add_solve(puzzle, kakuro_service, solver, solved)
+
+    :param path: Path to the SQLite database file.
+    :param batch_size: Number of results written per transaction.
+    """
+    def __init__(self, path: str, batch_size: int = 1000) -> None:
+        self.path: str = path
+        self.batch_size: int = batch_size
+        self.pending: List[ResultRow] = []
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "id INTEGER PRIMARY KEY, fingerprint TEXT NOT NULL, source TEXT, solver TEXT, status TEXT NOT NULL, "
+            "solution TEXT, elapsed REAL, nodes INTEGER, created REAL NOT NULL)"
+        )
+        self.connection.execute("CREATE INDEX IF NOT EXISTS results_fingerprint ON results (fingerprint)")
+        self.connection.commit()
+
+    def add(
+        self,
+        puzzle: PuzzleGrid,
+        solution: Optional[PuzzleGrid],
+        status: str,
+        solver: Optional[str] = None,
+        elapsed: Optional[float] = None,
+        nodes: Optional[int] = None,
+        source: Optional[str] = None
+    ) -> None:
+        """
+        Queues one result, writing the pending batch if it is full.
+
+        :param puzzle: Puzzle grid as given to the solver, before solving.
+        :param solution: Solved grid in the same orientation, or None if there is no solution.
+        :param status: Outcome, e.g. 'solved', 'unsolvable' or 'timeout'.
+        :param solver: Name of the solver.
+        :param elapsed: Solve time in seconds.
+        :param nodes: Search nodes visited, for the engines that count them.
+        :param source: Where the puzzle came from.
+        """
+        canonical, transposed = canonicalize(puzzle)
+        encoded = None if solution is None else encode_solution(canonical, transposed, solution)
+        row = (hash_grid(canonical), source, solver, status, encoded, elapsed, nodes, time.time())
+
+        with self.lock:
+            self.pending.append(row)
+            if len(self.pending) >= self.batch_size:
+                self.write_pending()
+
+    def add_solve(
+        self,
+        puzzle: PuzzleGrid,
+        kakuro_service: Any,
+        solver: Any,
+        solved: bool,
+        elapsed: Optional[float] = None,
+        source: Optional[str] = None
+    ) -> None:
+        """
+        Queues the result of a solve call, taking the status and the stats from the solver.
+
+        :param puzzle: Puzzle grid before solving, not the grid the service solved in place.
+        :param kakuro_service: Kakuro instance that was solved; its grid is only read when the solver has no result.
+        :param solver: Solver instance that ran.
+        :param solved: Return value of solve.
+        :param elapsed: Solve time in seconds.
+        :param source: Where the puzzle came from.
+        """
+        if solved:
+            status = "solved"
+        elif getattr(solver, "timed_out", False):
+            status = "timeout"
+        else:
+            status = "unsolvable"
+
+        result = getattr(solver, "result", None)
+        solution = None
+        if solved:
+            solution = kakuro_service.model.grid if result is None else result.to_grid(puzzle)
+
+        self.add(
+            puzzle, solution, status,
+            str(solver), elapsed, getattr(solver, "nodes", None), source
+        )
+
+    def write_pending(self) -> None:
+        """
+        Inserts the pending results in one transaction; the caller holds the lock.
+        """
+        if not self.pending:
+            return
+
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO results (fingerprint, source, solver, status, solution, elapsed, nodes, created) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                self.pending
+            )
+        self.pending = []
+
+    def flush(self) -> None:
+        """
+        Writes the pending results.
+        """
+        with self.lock:
+            self.write_pending()
+
+    def get_solution(self, puzzle: PuzzleGrid) -> Optional[PuzzleGrid]:
+        """
+        Looks up the latest stored solution of a puzzle, including pending results.
+
+        :param puzzle: Puzzle grid, in any orientation.
+        :return: Solved grid in the orientation of the given puzzle, or None.
+        """
+        fingerprint = hash_grid(canonicalize(puzzle)[0])
+
+        with self.lock:
+            self.write_pending()
+            row = self.connection.execute(
+                "SELECT solution FROM results WHERE fingerprint = ? AND solution IS NOT NULL ORDER BY id DESC LIMIT 1",
+                (fingerprint,)
+            ).fetchone()
+
+        return None if row is None else decode_solution(puzzle, row[0])
+
+    def count(self) -> int:
+        """
+        :return: Number of results written or pending.
+        """
+        with self.lock:
+            return self.connection.execute("SELECT COUNT(*) FROM results").fetchone()[0] + len(self.pending)
+
+    def close(self) -> None:
+        """
+        Writes the pending results and closes the database connection.
+        """
+        self.flush()
+        self.connection.close()
+
+    def __enter__(self) -> "SqliteResultsSink":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
\ No newline at end of file
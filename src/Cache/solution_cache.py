@@ -0,0 +1,154 @@
+import copy
+import json
+import sqlite3
+import threading
+from typing import Any, Optional
+
+from src.Cache.lru_cache import LRUCache
+from src.Cache.puzzle_fingerprint import canonicalize, encode_grid, hash_grid, normalize_grid, transpose_grid
+from src.Models.kakuro_model import KakuroModel
+from src.Services.kakuro_service import KakuroService
+from src.Types.types import CanonicalGrid, PuzzleGrid
+
+
+class SqliteCacheBackend:
+    """
+    Persistent store for solved puzzles backed by a SQLite database file.
+
+    Solutions are stored as JSON in canonical orientation, keyed by puzzle fingerprint.
+
+    :param path: Path to the SQLite database file.
+    """
+    def __init__(self, path: str) -> None:
+        self.path: str = path
+        self.connection = sqlite3.connect(path, check_same_thread=False)
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS solutions (fingerprint TEXT PRIMARY KEY, solution TEXT NOT NULL)"
+        )
+        self.connection.commit()
+
+    def get(self, fingerprint: str) -> Optional[CanonicalGrid]:
+        """
+        Fetches a stored solution.
+
+        :param fingerprint: Canonical puzzle fingerprint.
+        :return: Solution grid in canonical orientation, or None if not stored.
+        """
+        row = self.connection.execute(
+            "SELECT solution FROM solutions WHERE fingerprint = ?", (fingerprint,)
+        ).fetchone()
+
+        if row is None:
+            return None
+        return normalize_grid(json.loads(row[0]))
+
+    def put(self, fingerprint: str, solution: CanonicalGrid) -> None:
+        """
+        Stores a solution, replacing any previous entry for the fingerprint.
+
+        :param fingerprint: Canonical puzzle fingerprint.
+        :param solution: Solution grid in canonical orientation.
+        """
+        self.connection.execute(
+            "INSERT OR REPLACE INTO solutions (fingerprint, solution) VALUES (?, ?)",
+            (fingerprint, encode_grid(solution))
+        )
+        self.connection.commit()
+
+    def close(self) -> None:
+        """
+        Closes the underlying database connection.
+        """
+        self.connection.close()
+
+
+class SolutionCache:
+    """
+    Caches puzzle solutions in front of the solvers.
+
+    Puzzles are keyed by a canonical fingerprint, so a puzzle and its transpose share one entry.
+    Lookups go to an in-memory LRU first and then to the optional persistent backend.
+
+    :param capacity: Number of solutions kept in memory.
+    :param backend: Optional persistent store, e.g. SqliteCacheBackend.
+    """
+    def __init__(self, capacity: int = 1024, backend: Optional[SqliteCacheBackend] = None) -> None:
+        self.memory: LRUCache = LRUCache(capacity)
+        self.backend: Optional[SqliteCacheBackend] = backend
+        self.lock = threading.Lock()
+
+    def get(self, grid: PuzzleGrid) -> Optional[PuzzleGrid]:
+        """
+        Looks up the solution of a puzzle.
+
+        :param grid: 2D puzzle grid.
+        :return: Solved grid in the orientation of the given puzzle, or None on a cache miss.
+        """
+        canonical, transposed = canonicalize(grid)
+        fingerprint = hash_grid(canonical)
+
+        with self.lock:
+            solution = self.memory.get(fingerprint)
+
+            if solution is None and self.backend is not None:
+                solution = self.backend.get(fingerprint)
+                if solution is not None:
+                    self.memory.put(fingerprint, solution)
+
+        if solution is None:
+            return None
+
+        if transposed:
+            solution = transpose_grid(solution)
+        return [list(row) for row in solution]
+
+    def put(self, grid: PuzzleGrid, solution: PuzzleGrid) -> None:
+        """
+        Stores the solution of a puzzle.
+
+        :param grid: 2D puzzle grid as it was given to the solver.
+        :param solution: Solved grid in the same orientation as the puzzle.
+        """
+        canonical, transposed = canonicalize(grid)
+        fingerprint = hash_grid(canonical)
+        canonical_solution = normalize_grid(solution)
+
+        if transposed:
+            canonical_solution = transpose_grid(canonical_solution)
+
+        with self.lock:
+            self.memory.put(fingerprint, canonical_solution)
+            if self.backend is not None:
+                self.backend.put(fingerprint, canonical_solution)
+
+    def solve(self, grid: PuzzleGrid, solver: Any) -> Optional[PuzzleGrid]:
+        """
+        Returns the solution of a puzzle, running the solver only on a cache miss.
+
+        A cache hit does not build a KakuroService at all.
+
+        :param grid: 2D puzzle grid, it is not modified.
+        :param solver: Solver instance exposing solve(kakuro_service).
+        :return: Solved grid, or None if the solver found no solution.
+        """
+        solution = self.get(grid)
+        if solution is not None:
+            return solution
+
+        kakuro_service = KakuroService(KakuroModel(copy.deepcopy(grid)))
+
+        if not solver.solve(kakuro_service):
+            return None
+
+        self.put(grid, kakuro_service.model.grid)
+        return kakuro_service.model.grid
+
+    @property
+    def hits(self) -> int:
+        """Number of lookups answered from memory."""
+        return self.memory.hits
+
+    @property
+    def misses(self) -> int:
+        """Number of lookups that missed the in-memory cache."""
+        return self.memory.misses
\ No newline at end of file
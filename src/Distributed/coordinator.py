@@ -0,0 +1,74 @@
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from src.Distributed.work_queue import UNIT_FAILED, WorkTask, iter_units
+from src.Loaders.kakuro_loader import parse_puzzle
+from src.kakuro_solver import STATUS_ERROR
+
+
+class Coordinator:
+    """
+    Shards a corpus into units of a work queue and gathers the result records the workers push back.
+
+    Tasks are consumed as a stream, so a corpus larger than memory can be fed from a loader
+    generator when the queue stores units outside the process, as SqliteWorkQueue does.
+
+    :param queue: Work queue, local or remote.
+    :param unit_size: Number of puzzles per unit.
+    """
+    def __init__(self, queue: Any, unit_size: int = 100) -> None:
+        self.queue = queue
+        self.unit_size: int = unit_size
+        self.sources: Dict[int, List[str]] = {}
+
+    def submit(self, tasks: Iterable[WorkTask], close: bool = True) -> int:
+        """
+        Submits the tasks in units of unit_size puzzles.
+        :param tasks: (source, puzzle) pairs.
+        :param close: Whether to close submissions afterwards, so idle workers stop once the queue is drained.
+        :return: Number of units submitted.
+        """
+        count = 0
+
+        for unit in iter_units(iter(tasks), self.unit_size):
+            self.sources[self.queue.submit(unit)] = [source for source, _ in unit]
+            count += 1
+
+        if close:
+            self.queue.close_submissions()
+
+        return count
+
+    def iter_results(self, poll_interval: float = 0.2, timeout: Optional[float] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Yields the result records of the submitted units as the units finish, in no particular order.
+        Each puzzle of a unit that failed max_attempts times is reported as an error record.
+        :param poll_interval: Time in seconds between two polls of the queue.
+        :param timeout: Optional time in seconds after which the remaining units are given up.
+        :return: Iterator of result records, shaped like those of solve_task.
+        :raises TimeoutError: If the timeout expires first.
+        """
+        started = time.monotonic()
+
+        while self.sources:
+            finished = self.queue.take_finished()
+
+            for unit_id, status, records, error in finished:
+                sources = self.sources.pop(unit_id, None)
+                if sources is None:
+                    continue
+
+                if status == UNIT_FAILED:
+                    for source in sources:
+                        yield {"source": source, "status": STATUS_ERROR, "error": error, "elapsed": 0.0, "grid": None}
+                    continue
+
+                for record in records:
+                    if record["grid"] is not None:
+                        record["grid"] = parse_puzzle(record["grid"])
+                    yield record
+
+            if not finished and self.sources:
+                if timeout is not None and time.monotonic() - started > timeout:
+                    raise TimeoutError(f"{len(self.sources)} units did not finish in time")
+                time.sleep(poll_interval)
\ No newline at end of file
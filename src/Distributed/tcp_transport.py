@@ -0,0 +1,209 @@
+import json
+import socket
+import socketserver
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.Distributed.work_queue import FinishedUnit, WorkerStats, WorkTask, WorkUnit, decode_tasks
+
+QUEUE_METHODS: Tuple[str, ...] = (
+    "submit", "close_submissions", "lease", "renew", "complete", "fail", "get_progress", "get_worker_stats",
+    "take_finished",
+)
+
+
+def encode_result(method: str, result: Any) -> Any:
+    """
+    :param method: Queue method that returned the result.
+    :param result: Its return value.
+    :return: JSON-serializable form of the result.
+    """
+    if method == "lease":
+        return None if result is None else result.to_dict()
+    if method == "get_worker_stats":
+        return [stats.to_dict() for stats in result]
+    return result
+
+
+class WorkQueueRequestHandler(socketserver.StreamRequestHandler):
+    """
+    Serves one worker connection: every line is a JSON request {"method": ..., "args": [...]}
+    answered by a JSON line {"result": ...} or {"error": ...}.
+    """
+    def handle(self) -> None:
+        for line in self.rfile:
+            try:
+                request = json.loads(line)
+                method = request["method"]
+                if method not in QUEUE_METHODS:
+                    raise ValueError(f"Unknown method: {method}")
+                if method == "submit":
+                    request["args"][0] = decode_tasks(request["args"][0])
+                result = encode_result(method, getattr(self.server.queue, method)(*request["args"]))
+                response: Dict[str, Any] = {"result": result}
+            except (KeyError, IndexError, TypeError, ValueError) as error:
+                response = {"error": str(error)}
+
+            self.wfile.write(json.dumps(response).encode() + b"\n")
+
+
+class WorkQueueServer(socketserver.ThreadingTCPServer):
+    """
+    Shares a work queue with workers on other machines over TCP, one thread per connection.
+    It stands in for a message broker: the queue stays in the coordinator process and the
+    workers reach it through TcpWorkQueue.
+
+    :param queue: Queue to share, usually a MemoryWorkQueue.
+    :param address: (host, port) to listen on, port 0 picks a free port.
+    """
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, queue: Any, address: Tuple[str, int]) -> None:
+        super().__init__(address, WorkQueueRequestHandler)
+        self.queue = queue
+        self.thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """
+        Serves connections in a background thread.
+        """
+        self.thread = threading.Thread(target=self.serve_forever, name="kakuro-work-queue", daemon=True)
+        self.thread.start()
+
+    def stop(self) -> None:
+        """
+        Stops the background thread started by start() and closes the listening socket.
+        """
+        if self.thread is not None:
+            self.shutdown()
+            self.thread.join()
+            self.thread = None
+        self.server_close()
+
+
+class TcpWorkQueue:
+    """
+    Client of a WorkQueueServer, with the methods of the local work queues, so a worker runs
+    unchanged against any transport. Calls are serialized over one connection, which is opened
+    again once if the server dropped it.
+
+    :param address: (host, port) of the server.
+    :param timeout: Socket timeout in seconds.
+    """
+    def __init__(self, address: Tuple[str, int], timeout: float = 30) -> None:
+        self.address: Tuple[str, int] = address
+        self.timeout: float = timeout
+        self.lock = threading.Lock()
+        self.connection: Optional[socket.socket] = None
+        self.reader: Any = None
+
+    def connect(self) -> None:
+        """
+        Opens the connection to the server.
+        """
+        self.connection = socket.create_connection(self.address, timeout=self.timeout)
+        self.reader = self.connection.makefile("rb")
+
+    def call(self, method: str, *args: Any) -> Any:
+        """
+        Runs a queue method on the server.
+        :param method: Method name, one of QUEUE_METHODS.
+        :param args: Its JSON-serializable arguments.
+        :return: Decoded result.
+        :raises ConnectionError: If the server cannot be reached.
+        :raises ValueError: If the server rejected the request.
+        """
+        request = json.dumps({"method": method, "args": list(args)}).encode() + b"\n"
+
+        with self.lock:
+            for attempt in range(2):
+                try:
+                    if self.connection is None:
+                        self.connect()
+                    self.connection.sendall(request)
+                    line = self.reader.readline()
+                    if not line:
+                        raise ConnectionError("Work queue server closed the connection")
+                    break
+                except OSError:
+                    self.disconnect()
+                    if attempt:
+                        raise
+
+        response = json.loads(line)
+        if "error" in response:
+            raise ValueError(response["error"])
+        return response["result"]
+
+    def submit(self, tasks: List[WorkTask]) -> int:
+        """
+        See MemoryWorkQueue.submit.
+        """
+        return self.call("submit", [list(task) for task in tasks])
+
+    def close_submissions(self) -> None:
+        """
+        See MemoryWorkQueue.close_submissions.
+        """
+        self.call("close_submissions")
+
+    def lease(self, worker: str, lease_seconds: float) -> Optional[WorkUnit]:
+        """
+        See MemoryWorkQueue.lease.
+        """
+        data = self.call("lease", worker, lease_seconds)
+        return None if data is None else WorkUnit.from_dict(data)
+
+    def renew(self, worker: str, unit_id: int, lease_seconds: float) -> bool:
+        """
+        See MemoryWorkQueue.renew.
+        """
+        return self.call("renew", worker, unit_id, lease_seconds)
+
+    def complete(self, worker: str, unit_id: int, results: List[Dict[str, Any]], busy: float) -> bool:
+        """
+        See MemoryWorkQueue.complete.
+        """
+        return self.call("complete", worker, unit_id, results, busy)
+
+    def fail(self, worker: str, unit_id: int, error: str) -> bool:
+        """
+        See MemoryWorkQueue.fail.
+        """
+        return self.call("fail", worker, unit_id, error)
+
+    def get_progress(self) -> Dict[str, Any]:
+        """
+        See MemoryWorkQueue.get_progress.
+        """
+        return self.call("get_progress")
+
+    def get_worker_stats(self) -> List[WorkerStats]:
+        """
+        See MemoryWorkQueue.get_worker_stats.
+        """
+        return [WorkerStats.from_dict(data) for data in self.call("get_worker_stats")]
+
+    def take_finished(self) -> List[FinishedUnit]:
+        """
+        See MemoryWorkQueue.take_finished.
+        """
+        return [tuple(unit) for unit in self.call("take_finished")]
+
+    def disconnect(self) -> None:
+        """
+        Closes the connection, if open.
+        """
+        if self.connection is not None:
+            self.reader.close()
+            self.connection.close()
+            self.connection = None
+            self.reader = None
+
+    def close(self) -> None:
+        """
+        Closes the connection; the queue itself lives on in the server.
+        """
+        with self.lock:
+            self.disconnect()
\ No newline at end of file
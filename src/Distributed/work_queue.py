@@ -0,0 +1,588 @@
+import json
+import sqlite3
+import threading
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+
+from src.Loaders.kakuro_loader import parse_puzzle
+from src.Types.types import PuzzleGrid
+
+UNIT_PENDING = "pending"
+UNIT_LEASED = "leased"
+UNIT_DONE = "done"
+UNIT_FAILED = "failed"
+
+WorkTask = Tuple[str, PuzzleGrid]
+FinishedUnit = Tuple[int, str, List[Dict[str, Any]], Optional[str]]
+
+DEFAULT_MAX_ATTEMPTS = 3
+
+
+class WorkUnit:
+    """
+    A shard of a corpus, leased to one worker at a time.
+
+    :param unit_id: Identifier given by the queue.
+    :param tasks: (source, puzzle) pairs to solve.
+    :param attempts: Number of times the unit has been leased, this lease included.
+    """
+    def __init__(self, unit_id: int, tasks: List[WorkTask], attempts: int = 0) -> None:
+        self.unit_id: int = unit_id
+        self.tasks: List[WorkTask] = tasks
+        self.attempts: int = attempts
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        :return: JSON-serializable representation.
+        """
+        return {"unit_id": self.unit_id, "tasks": [list(task) for task in self.tasks], "attempts": self.attempts}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "WorkUnit":
+        """
+        :param data: Representation returned by to_dict, possibly through JSON.
+        :return: Rebuilt unit, with clue lists turned back into tuples.
+        """
+        return cls(data["unit_id"], decode_tasks(data["tasks"]), data["attempts"])
+
+
+def decode_tasks(tasks: List[List[Any]]) -> List[WorkTask]:
+    """
+    :param tasks: [source, puzzle] pairs decoded from JSON.
+    :return: (source, puzzle grid) pairs.
+    """
+    return [(source, parse_puzzle(puzzle)) for source, puzzle in tasks]
+
+
+class WorkerStats:
+    """
+    Work reported by one worker.
+
+    :param name: Worker name.
+    :param units: Units completed.
+    :param puzzles: Puzzles solved, whatever their outcome.
+    :param busy: Seconds spent solving those puzzles.
+    :param first_seen: Time of the worker's first lease.
+    :param last_seen: Time of the worker's last call.
+    """
+    def __init__(self, name: str, units: int = 0, puzzles: int = 0, busy: float = 0.0,
+                 first_seen: float = 0.0, last_seen: float = 0.0) -> None:
+        self.name: str = name
+        self.units: int = units
+        self.puzzles: int = puzzles
+        self.busy: float = busy
+        self.first_seen: float = first_seen
+        self.last_seen: float = last_seen
+
+    @property
+    def throughput(self) -> float:
+        """
+        Puzzles per second of solving time.
+        """
+        return self.puzzles / self.busy if self.busy > 0 else 0.0
+
+    @property
+    def wall_throughput(self) -> float:
+        """
+        Puzzles per second since the worker's first lease, including the time spent waiting.
+        """
+        elapsed = self.last_seen - self.first_seen
+        return self.puzzles / elapsed if elapsed > 0 else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        :return: JSON-serializable representation.
+        """
+        return {
+            "name": self.name, "units": self.units, "puzzles": self.puzzles, "busy": self.busy,
+            "first_seen": self.first_seen, "last_seen": self.last_seen,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "WorkerStats":
+        """
+        :param data: Representation returned by to_dict.
+        :return: Rebuilt stats.
+        """
+        return cls(data["name"], data["units"], data["puzzles"], data["busy"], data["first_seen"], data["last_seen"])
+
+
+class MemoryWorkQueue:
+    """
+    Work queue held in the memory of the coordinator process, shared with remote workers through
+    a WorkQueueServer.
+
+    Every work queue exposes the same methods, so coordinators and workers do not depend on the
+    transport: submit and close_submissions on the coordinator side; lease, renew, complete and
+    fail on the worker side; get_progress, get_worker_stats and take_finished for monitoring.
+
+    A lease expires after lease_seconds unless it is renewed; the unit is then leased again, up to
+    max_attempts leases, after which it is failed. Expired leases are taken back by the next call
+    to lease, get_progress or take_finished, so units held by dead workers still finish while the
+    coordinator polls. Results of a worker whose lease has expired are refused, so every unit is
+    completed exactly once.
+
+    :param max_attempts: Maximum number of leases of a unit.
+    """
+    def __init__(self, max_attempts: int = DEFAULT_MAX_ATTEMPTS) -> None:
+        self.max_attempts: int = max_attempts
+        self.lock = threading.Lock()
+        self.units: Dict[int, Dict[str, Any]] = {}
+        self.pending: Deque[int] = deque()
+        self.finished: Deque[int] = deque()
+        self.workers: Dict[str, WorkerStats] = {}
+        self.next_id: int = 1
+        self.open: bool = True
+
+    def submit(self, tasks: List[WorkTask]) -> int:
+        """
+        Adds a unit of work.
+        :param tasks: (source, puzzle) pairs.
+        :return: Unit identifier.
+        """
+        with self.lock:
+            unit_id = self.next_id
+            self.next_id += 1
+            self.units[unit_id] = {
+                "tasks": tasks, "status": UNIT_PENDING, "attempts": 0, "worker": None, "expires": 0.0,
+                "results": None, "error": None,
+            }
+            self.pending.append(unit_id)
+            return unit_id
+
+    def close_submissions(self) -> None:
+        """
+        Tells the workers that no more units will be submitted, so they stop once the queue is drained.
+        """
+        with self.lock:
+            self.open = False
+
+    def touch(self, worker: str, now: float) -> WorkerStats:
+        """
+        Records a call from a worker; the caller holds the lock.
+        :param worker: Worker name.
+        :param now: Current time.
+        :return: Stats of the worker.
+        """
+        stats = self.workers.get(worker)
+        if stats is None:
+            stats = WorkerStats(worker, first_seen=now)
+            self.workers[worker] = stats
+        stats.last_seen = now
+        return stats
+
+    def finish(self, unit_id: int, status: str, error: Optional[str]) -> None:
+        """
+        Ends a unit; the caller holds the lock.
+        """
+        unit = self.units[unit_id]
+        unit["status"] = status
+        unit["error"] = error
+        unit["worker"] = None
+        self.finished.append(unit_id)
+
+    def release(self, unit_id: int, error: str) -> None:
+        """
+        Puts a unit whose lease ended without results back in the queue, or fails it for good
+        once it has used max_attempts leases; the caller holds the lock.
+        """
+        unit = self.units[unit_id]
+        if unit["attempts"] >= self.max_attempts:
+            self.finish(unit_id, UNIT_FAILED, error)
+        else:
+            unit["status"] = UNIT_PENDING
+            unit["worker"] = None
+            self.pending.appendleft(unit_id)
+
+    def release_expired(self, now: float) -> None:
+        """
+        Takes back the units whose lease has expired; the caller holds the lock.
+        :param now: Current time.
+        """
+        for unit_id, unit in self.units.items():
+            if unit["status"] == UNIT_LEASED and unit["expires"] < now:
+                self.release(unit_id, "lease expired")
+
+    def lease(self, worker: str, lease_seconds: float) -> Optional[WorkUnit]:
+        """
+        Hands the next unit to a worker, taking back expired leases first.
+        :param worker: Worker name.
+        :param lease_seconds: Time the worker has to complete or renew the unit.
+        :return: The unit, or None if no unit is waiting.
+        """
+        now = time.time()
+
+        with self.lock:
+            self.touch(worker, now)
+            self.release_expired(now)
+
+            if not self.pending:
+                return None
+
+            unit_id = self.pending.popleft()
+            unit = self.units[unit_id]
+            unit["status"] = UNIT_LEASED
+            unit["attempts"] += 1
+            unit["worker"] = worker
+            unit["expires"] = now + lease_seconds
+
+            return WorkUnit(unit_id, unit["tasks"], unit["attempts"])
+
+    def renew(self, worker: str, unit_id: int, lease_seconds: float) -> bool:
+        """
+        Extends the lease of a unit the worker is still working on.
+        :return: False if the worker no longer holds the lease.
+        """
+        now = time.time()
+
+        with self.lock:
+            self.touch(worker, now)
+            unit = self.units.get(unit_id)
+            if unit is None or unit["status"] != UNIT_LEASED or unit["worker"] != worker:
+                return False
+            unit["expires"] = now + lease_seconds
+            return True
+
+    def complete(self, worker: str, unit_id: int, results: List[Dict[str, Any]], busy: float) -> bool:
+        """
+        Stores the results of a unit.
+        :param worker: Worker name.
+        :param unit_id: Unit identifier.
+        :param results: One result record per task.
+        :param busy: Seconds the worker spent solving the unit.
+        :return: False if the worker no longer held the lease, the results are then dropped.
+        """
+        now = time.time()
+
+        with self.lock:
+            stats = self.touch(worker, now)
+            unit = self.units.get(unit_id)
+            if unit is None or unit["status"] != UNIT_LEASED or unit["worker"] != worker:
+                return False
+
+            unit["results"] = results
+            self.finish(unit_id, UNIT_DONE, None)
+            stats.units += 1
+            stats.puzzles += len(results)
+            stats.busy += busy
+            return True
+
+    def fail(self, worker: str, unit_id: int, error: str) -> bool:
+        """
+        Gives a unit back after an error, to be retried by another lease.
+        :return: False if the worker no longer held the lease.
+        """
+        with self.lock:
+            self.touch(worker, time.time())
+            unit = self.units.get(unit_id)
+            if unit is None or unit["status"] != UNIT_LEASED or unit["worker"] != worker:
+                return False
+            self.release(unit_id, error)
+            return True
+
+    def get_progress(self) -> Dict[str, Any]:
+        """
+        :return: Number of units in each status, and whether submissions are still open.
+        """
+        with self.lock:
+            self.release_expired(time.time())
+            progress: Dict[str, Any] = {UNIT_PENDING: 0, UNIT_LEASED: 0, UNIT_DONE: 0, UNIT_FAILED: 0}
+            for unit in self.units.values():
+                progress[unit["status"]] += 1
+            progress["open"] = self.open
+            return progress
+
+    def get_worker_stats(self) -> List[WorkerStats]:
+        """
+        :return: Stats of every worker seen, by name.
+        """
+        with self.lock:
+            return [WorkerStats.from_dict(self.workers[name].to_dict()) for name in sorted(self.workers)]
+
+    def take_finished(self) -> List[FinishedUnit]:
+        """
+        Hands the units finished since the last call to the coordinator, which is their only reader,
+        and forgets them.
+        :return: (unit_id, status, results, error) tuples; results is empty for a failed unit.
+        """
+        with self.lock:
+            self.release_expired(time.time())
+            finished = []
+            while self.finished:
+                unit_id = self.finished.popleft()
+                unit = self.units.pop(unit_id)
+                finished.append((unit_id, unit["status"], unit["results"] or [], unit["error"]))
+            return finished
+
+    def close(self) -> None:
+        """
+        Nothing to release, for symmetry with the other queues.
+        """
+
+
+class SqliteWorkQueue:
+    """
+    Work queue stored in a SQLite file, for a coordinator and workers running on machines that
+    share a filesystem, or as a stand-in for a broker on a single box.
+
+    It has the methods and lease rules of MemoryWorkQueue. Every call is one IMMEDIATE transaction,
+    so concurrent processes never lease the same unit twice; the database runs in WAL mode so
+    monitoring reads do not block the workers.
+
+    The maximum number of leases of a unit is stored in the file by the coordinator, since expired
+    leases are taken back by whichever process leases or polls next.
+
+    :param path: Path to the SQLite database file, created if needed.
+    :param max_attempts: Maximum number of leases of a unit, None keeps the stored value.
+    """
+    def __init__(self, path: str, max_attempts: Optional[int] = None) -> None:
+        self.path: str = path
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(path, timeout=30, isolation_level=None, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS units ("
+            "id INTEGER PRIMARY KEY, tasks TEXT NOT NULL, status TEXT NOT NULL, attempts INTEGER NOT NULL DEFAULT 0, "
+            "worker TEXT, expires REAL, results TEXT, error TEXT, taken INTEGER NOT NULL DEFAULT 0)"
+        )
+        self.connection.execute("CREATE INDEX IF NOT EXISTS units_status ON units (status, id)")
+        self.connection.execute(
+            "CREATE TABLE IF NOT EXISTS workers ("
+            "name TEXT PRIMARY KEY, units INTEGER NOT NULL DEFAULT 0, puzzles INTEGER NOT NULL DEFAULT 0, "
+            "busy REAL NOT NULL DEFAULT 0, first_seen REAL NOT NULL, last_seen REAL NOT NULL) WITHOUT ROWID"
+        )
+        self.connection.execute("CREATE TABLE IF NOT EXISTS settings (name TEXT PRIMARY KEY, value TEXT) WITHOUT ROWID")
+        if max_attempts is not None:
+            self.connection.execute(
+                "INSERT OR REPLACE INTO settings (name, value) VALUES ('max_attempts', ?)", (str(max_attempts),)
+            )
+
+    def transaction(self) -> "SqliteTransaction":
+        """
+        :return: Context manager running its block in one IMMEDIATE transaction under the lock.
+        """
+        return SqliteTransaction(self)
+
+    def touch(self, worker: str, now: float) -> None:
+        """
+        Records a call from a worker; the caller holds a transaction.
+        """
+        self.connection.execute(
+            "INSERT INTO workers (name, first_seen, last_seen) VALUES (?, ?, ?) "
+            "ON CONFLICT (name) DO UPDATE SET last_seen = excluded.last_seen",
+            (worker, now, now)
+        )
+
+    def release(self, unit_id: int, attempts: int, error: str) -> None:
+        """
+        Puts a unit back in the queue, or fails it once it has used max_attempts leases; the caller holds a transaction.
+        """
+        row = self.connection.execute("SELECT value FROM settings WHERE name = 'max_attempts'").fetchone()
+        if attempts >= (DEFAULT_MAX_ATTEMPTS if row is None else int(row[0])):
+            self.connection.execute(
+                "UPDATE units SET status = ?, worker = NULL, error = ? WHERE id = ?", (UNIT_FAILED, error, unit_id)
+            )
+        else:
+            self.connection.execute("UPDATE units SET status = ?, worker = NULL WHERE id = ?", (UNIT_PENDING, unit_id))
+
+    def release_expired(self, now: float) -> None:
+        """
+        Takes back the units whose lease has expired; the caller holds a transaction.
+        :param now: Current time.
+        """
+        expired = self.connection.execute(
+            "SELECT id, attempts FROM units WHERE status = ? AND expires < ?", (UNIT_LEASED, now)
+        ).fetchall()
+        for unit_id, attempts in expired:
+            self.release(unit_id, attempts, "lease expired")
+
+    def submit(self, tasks: List[WorkTask]) -> int:
+        """
+        Adds a unit of work.
+        :param tasks: (source, puzzle) pairs.
+        :return: Unit identifier.
+        """
+        with self.transaction():
+            cursor = self.connection.execute(
+                "INSERT INTO units (tasks, status) VALUES (?, ?)", (json.dumps([list(task) for task in tasks]), UNIT_PENDING)
+            )
+            self.connection.execute("INSERT OR REPLACE INTO settings (name, value) VALUES ('open', '1')")
+            return cursor.lastrowid
+
+    def close_submissions(self) -> None:
+        """
+        Tells the workers that no more units will be submitted.
+        """
+        with self.transaction():
+            self.connection.execute("INSERT OR REPLACE INTO settings (name, value) VALUES ('open', '0')")
+
+    def lease(self, worker: str, lease_seconds: float) -> Optional[WorkUnit]:
+        """
+        Hands the next unit to a worker, taking back expired leases first.
+        :param worker: Worker name.
+        :param lease_seconds: Time the worker has to complete or renew the unit.
+        :return: The unit, or None if no unit is waiting.
+        """
+        now = time.time()
+
+        with self.transaction():
+            self.touch(worker, now)
+            self.release_expired(now)
+
+            row = self.connection.execute(
+                "SELECT id, tasks, attempts FROM units WHERE status = ? ORDER BY attempts DESC, id LIMIT 1", (UNIT_PENDING,)
+            ).fetchone()
+            if row is None:
+                return None
+
+            unit_id, tasks, attempts = row
+            self.connection.execute(
+                "UPDATE units SET status = ?, attempts = ?, worker = ?, expires = ? WHERE id = ?",
+                (UNIT_LEASED, attempts + 1, worker, now + lease_seconds, unit_id)
+            )
+
+        return WorkUnit(unit_id, decode_tasks(json.loads(tasks)), attempts + 1)
+
+    def renew(self, worker: str, unit_id: int, lease_seconds: float) -> bool:
+        """
+        Extends the lease of a unit the worker is still working on.
+        :return: False if the worker no longer holds the lease.
+        """
+        now = time.time()
+
+        with self.transaction():
+            self.touch(worker, now)
+            cursor = self.connection.execute(
+                "UPDATE units SET expires = ? WHERE id = ? AND status = ? AND worker = ?",
+                (now + lease_seconds, unit_id, UNIT_LEASED, worker)
+            )
+            return cursor.rowcount == 1
+
+    def complete(self, worker: str, unit_id: int, results: List[Dict[str, Any]], busy: float) -> bool:
+        """
+        Stores the results of a unit.
+        :param worker: Worker name.
+        :param unit_id: Unit identifier.
+        :param results: One result record per task.
+        :param busy: Seconds the worker spent solving the unit.
+        :return: False if the worker no longer held the lease, the results are then dropped.
+        """
+        with self.transaction():
+            self.touch(worker, time.time())
+            cursor = self.connection.execute(
+                "UPDATE units SET status = ?, worker = NULL, results = ? WHERE id = ? AND status = ? AND worker = ?",
+                (UNIT_DONE, json.dumps(results), unit_id, UNIT_LEASED, worker)
+            )
+            if cursor.rowcount != 1:
+                return False
+
+            self.connection.execute(
+                "UPDATE workers SET units = units + 1, puzzles = puzzles + ?, busy = busy + ? WHERE name = ?",
+                (len(results), busy, worker)
+            )
+            return True
+
+    def fail(self, worker: str, unit_id: int, error: str) -> bool:
+        """
+        Gives a unit back after an error, to be retried by another lease.
+        :return: False if the worker no longer held the lease.
+        """
+        with self.transaction():
+            self.touch(worker, time.time())
+            row = self.connection.execute(
+                "SELECT attempts FROM units WHERE id = ? AND status = ? AND worker = ?", (unit_id, UNIT_LEASED, worker)
+            ).fetchone()
+            if row is None:
+                return False
+            self.release(unit_id, row[0], error)
+            return True
+
+    def get_progress(self) -> Dict[str, Any]:
+        """
+        :return: Number of units in each status, and whether submissions are still open.
+        """
+        with self.transaction():
+            self.release_expired(time.time())
+            progress: Dict[str, Any] = {UNIT_PENDING: 0, UNIT_LEASED: 0, UNIT_DONE: 0, UNIT_FAILED: 0}
+            for status, count in self.connection.execute("SELECT status, COUNT(*) FROM units GROUP BY status"):
+                progress[status] = count
+            row = self.connection.execute("SELECT value FROM settings WHERE name = 'open'").fetchone()
+            progress["open"] = row is None or row[0] == "1"
+            return progress
+
+    def get_worker_stats(self) -> List[WorkerStats]:
+        """
+        :return: Stats of every worker seen, by name.
+        """
+        with self.lock:
+            return [
+                WorkerStats(*row) for row in self.connection.execute(
+                    "SELECT name, units, puzzles, busy, first_seen, last_seen FROM workers ORDER BY name"
+                )
+            ]
+
+    def take_finished(self) -> List[FinishedUnit]:
+        """
+        Hands the units finished since the last call to the coordinator, which is their only reader.
+        Their results stay in the database.
+        :return: (unit_id, status, results, error) tuples; results is empty for a failed unit.
+        """
+        with self.transaction():
+            self.release_expired(time.time())
+            rows = self.connection.execute(
+                "SELECT id, status, results, error FROM units WHERE status IN (?, ?) AND taken = 0 ORDER BY id",
+                (UNIT_DONE, UNIT_FAILED)
+            ).fetchall()
+            self.connection.executemany("UPDATE units SET taken = 1 WHERE id = ?", [(row[0],) for row in rows])
+
+        return [(unit_id, status, json.loads(results) if results else [], error) for unit_id, status, results, error in rows]
+
+    def close(self) -> None:
+        """
+        Closes the database connection.
+        """
+        self.connection.close()
+
+
+class SqliteTransaction:
+    """
+    Runs a block in one IMMEDIATE transaction of a SqliteWorkQueue, committed unless the block raises.
+    :param queue: Queue whose connection is used.
+    """
+    def __init__(self, queue: SqliteWorkQueue) -> None:
+        self.queue = queue
+
+    def __enter__(self) -> None:
+        self.queue.lock.acquire()
+        try:
+            self.queue.connection.execute("BEGIN IMMEDIATE")
+        except BaseException:
+            self.queue.lock.release()
+            raise
+
+    def __exit__(self, exc_type: Any, *exc_info: Any) -> None:
+        try:
+            self.queue.connection.execute("COMMIT" if exc_type is None else "ROLLBACK")
+        finally:
+            self.queue.lock.release()
+
+
+def iter_units(tasks: Iterator[WorkTask], unit_size: int) -> Iterator[List[WorkTask]]:
+    """
+    Shards a stream of tasks into units without holding more than one unit in memory.
+    :param tasks: (source, puzzle) pairs.
+    :param unit_size: Number of tasks per unit.
+    :return: Iterator over the task lists of the units.
+    """
+    unit: List[WorkTask] = []
+
+    for task in tasks:
+        unit.append(task)
+        if len(unit) >= unit_size:
+            yield unit
+            unit = []
+
+    if unit:
+        yield unit
\ No newline at end of file
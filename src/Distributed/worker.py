@@ -0,0 +1,95 @@
+import os
+import socket
+import time
+from typing import Any, Dict, List, Optional
+
+from src.Distributed.work_queue import UNIT_LEASED, UNIT_PENDING, WorkUnit
+from src.kakuro_solver import solve_task
+
+
+def get_default_worker_name() -> str:
+    """
+    :return: 'host:pid', unique among the workers of a cluster.
+    """
+    return f"{socket.gethostname()}:{os.getpid()}"
+
+
+class Worker:
+    """
+    Pulls units from a work queue, solves their puzzles and pushes the result records back.
+
+    The lease of a unit is renewed between puzzles once half of it has gone by, so lease_seconds
+    must exceed the time limit of one puzzle. When the lease is lost, because the worker was too
+    slow and the unit went to another worker, the unit is abandoned and its results are dropped.
+
+    :param queue: Work queue, local or remote.
+    :param engine: Solver engine name from the solver registry.
+    :param name: Worker name, defaults to 'host:pid'.
+    :param time_limit: Optional limit in seconds for each puzzle.
+    :param lease_seconds: Time the worker has to complete or renew a unit.
+    """
+    def __init__(self, queue: Any, engine: str = "backtracking", name: Optional[str] = None,
+                 time_limit: Optional[float] = None, lease_seconds: float = 60) -> None:
+        self.queue = queue
+        self.engine: str = engine
+        self.name: str = name or get_default_worker_name()
+        self.time_limit: Optional[float] = time_limit
+        self.lease_seconds: float = lease_seconds
+        self.units: int = 0
+        self.puzzles: int = 0
+
+    def process(self, unit: WorkUnit) -> bool:
+        """
+        Solves the puzzles of a unit and completes it, or gives it back if solving raised.
+        :param unit: Leased unit.
+        :return: Whether the results were accepted.
+        """
+        records: List[Dict[str, Any]] = []
+        started = renewed = time.monotonic()
+
+        try:
+            for source, puzzle in unit.tasks:
+                if time.monotonic() - renewed > self.lease_seconds / 2:
+                    if not self.queue.renew(self.name, unit.unit_id, self.lease_seconds):
+                        return False
+                    renewed = time.monotonic()
+                records.append(solve_task(source, puzzle, self.engine, self.time_limit))
+        except Exception as error:
+            self.queue.fail(self.name, unit.unit_id, f"{type(error).__name__}: {error}")
+            return False
+
+        if not self.queue.complete(self.name, unit.unit_id, records, time.monotonic() - started):
+            return False
+
+        self.units += 1
+        self.puzzles += len(records)
+        return True
+
+    def run(self, max_units: Optional[int] = None, idle_timeout: Optional[float] = None,
+            poll_interval: float = 0.5) -> int:
+        """
+        Processes units until the coordinator has closed submissions and every unit is finished.
+        :param max_units: Optional number of units after which the worker stops.
+        :param idle_timeout: Optional time in seconds without work after which the worker stops.
+        :param poll_interval: Time in seconds between two polls of an empty queue.
+        :return: Number of units completed.
+        """
+        idle_since = time.monotonic()
+
+        while max_units is None or self.units < max_units:
+            unit = self.queue.lease(self.name, self.lease_seconds)
+
+            if unit is not None:
+                self.process(unit)
+                idle_since = time.monotonic()
+                continue
+
+            progress = self.queue.get_progress()
+            if not progress["open"] and not progress[UNIT_PENDING] and not progress[UNIT_LEASED]:
+                break
+            if idle_timeout is not None and time.monotonic() - idle_since > idle_timeout:
+                break
+
+            time.sleep(poll_interval)
+
+        return self.units
\ No newline at end of file
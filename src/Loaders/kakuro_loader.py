@@ -1,9 +1,29 @@
 import json
 import os
+from typing import Any, Iterator, List
 
 from src.Types.types import PuzzleGrid
 
 
+def parse_puzzle(puzzle: Any) -> PuzzleGrid:
+    """
+    Converts a decoded JSON puzzle into a puzzle grid by turning clue lists into tuple objects.
+
+    :param puzzle: 2D list as decoded from JSON.
+    :return: Puzzle grid.
+    :raises ValueError: If the puzzle is not a non-empty list of lists.
+    """
+    if not isinstance(puzzle, list) or not puzzle or not all(isinstance(row, list) for row in puzzle):
+        raise ValueError("A puzzle must be a non-empty list of rows")
+
+    for row in range(len(puzzle)):
+        for column in range(len(puzzle[row])):
+            if isinstance(puzzle[row][column], list):
+                puzzle[row][column] = tuple(puzzle[row][column])
+
+    return puzzle
+
+
 def load_puzzle_from_path(file_path: str) -> PuzzleGrid:
     """
     Loads a Kakuro puzzle grid from a JSON file and converts any lists to tuple objects.
@@ -18,9 +38,90 @@ def load_puzzle_from_path(file_path: str) -> PuzzleGrid:
     with open(file_path, "r") as file:
         puzzle = json.load(file)
 
-    for row in range(len(puzzle)):
-        for column in range(len(puzzle[row])):
-            if isinstance(puzzle[row][column], list):
-                puzzle[row][column] = tuple(puzzle[row][column])
+    return parse_puzzle(puzzle)
 
-    return puzzle
+
+def list_puzzle_paths(directory: str) -> List[str]:
+    """
+    Lists the puzzle JSON files of a directory, sorted by name.
+
+    :param directory: Directory containing puzzle files.
+    :return: Paths of the *.json files in the directory.
+    :raises FileNotFoundError: If the directory does not exist.
+    """
+    if not os.path.isdir(directory):
+        raise FileNotFoundError(f"No such directory: {directory}")
+
+    return [os.path.join(directory, name) for name in sorted(os.listdir(directory)) if name.endswith(".json")]
+
+
+def iter_puzzles_from_text(text: str) -> Iterator[PuzzleGrid]:
+    """
+    Decodes consecutive JSON puzzles from a text, e.g. a single puzzle or one puzzle per line.
+
+    :param text: Text containing zero or more JSON encoded puzzles.
+    :return: Iterator over the decoded puzzle grids.
+    :raises ValueError: If the text contains something other than JSON puzzles.
+    """
+    decoder = json.JSONDecoder()
+    position = 0
+
+    while True:
+        while position < len(text) and text[position].isspace():
+            position += 1
+        if position == len(text):
+            return
+
+        puzzle, position = decoder.raw_decode(text, position)
+        yield parse_puzzle(puzzle)
+
+
+def iter_puzzle_rows_from_path(file_path: str, chunk_size: int = 1 << 16) -> Iterator[List[Any]]:
+    """
+    Streams the rows of a puzzle JSON file one at a time, so that a very large grid is never
+    held in memory as a whole (see SparseKakuroModel.from_rows). Clues are left as lists.
+
+    :param file_path: Path to the puzzle JSON file.
+    :param chunk_size: Number of characters read at once.
+    :return: Iterator over the decoded rows.
+    :raises FileNotFoundError: If the specified file does not exist.
+    :raises ValueError: If the file is not a JSON list of rows.
+    """
+    if not os.path.exists(file_path):
+        raise FileNotFoundError(f"No such file: {file_path}")
+
+    decoder = json.JSONDecoder()
+    buffer = ""
+    position = 0
+    opened = False
+
+    with open(file_path, "r") as file:
+        while True:
+            while position < len(buffer) and (buffer[position].isspace() or (opened and buffer[position] == ",")):
+                position += 1
+
+            if position == len(buffer) or (opened and buffer[position] == "["):
+                try:
+                    row, end = decoder.raw_decode(buffer, position) if position < len(buffer) else (None, None)
+                except ValueError:
+                    row = None
+
+                if row is None:
+                    chunk = file.read(chunk_size)
+                    if not chunk:
+                        raise ValueError("A puzzle must be a non-empty list of rows")
+                    buffer, position = buffer[position:] + chunk, 0
+                    continue
+
+                if not isinstance(row, list):
+                    raise ValueError("A puzzle must be a non-empty list of rows")
+
+                position = end
+                yield row
+            elif not opened and buffer[position] == "[":
+                opened = True
+                position += 1
+            elif opened and buffer[position] == "]":
+                return
+            else:
+                raise ValueError("A puzzle must be a non-empty list of rows")
\ No newline at end of file
@@ -0,0 +1,198 @@
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from src.Models.kakuro_model import KakuroModel
+from src.Types.types import CellPosition, CellValue, CellsList, CellToCluesDict, ClueToCellsDict, CluesDict
+
+BLACK_CELL = "X"
+
+
+class SparseRow:
+    """
+    One row of a SparseGrid: only its clue and white cells are stored, every other column reads as a black cell.
+    :param width: Number of columns of the row.
+    """
+    __slots__ = ("cells", "width")
+
+    def __init__(self, width: int) -> None:
+        self.cells: Dict[int, CellValue] = {}
+        self.width: int = width
+
+    def __getitem__(self, column: Any) -> Any:
+        if isinstance(column, slice):
+            return [self.cells.get(index, BLACK_CELL) for index in range(*column.indices(self.width))]
+        return self.cells.get(column, BLACK_CELL)
+
+    def __setitem__(self, column: Any, value: Any) -> None:
+        if isinstance(column, slice):
+            for index, item in zip(range(*column.indices(self.width)), value):
+                self[index] = item
+        elif value == BLACK_CELL:
+            self.cells.pop(column, None)
+        else:
+            self.cells[column] = value
+
+    def __len__(self) -> int:
+        return self.width
+
+    def __iter__(self) -> Iterator[CellValue]:
+        return (self.cells.get(column, BLACK_CELL) for column in range(self.width))
+
+    def __eq__(self, other: Any) -> bool:
+        return list(self) == list(other)
+
+
+class SparseGrid:
+    """
+    Grid storing only clue and white cells, indexed like a PuzzleGrid: grid[row][column].
+    Memory is proportional to the number of non-black cells (plus one small object per row).
+    """
+    def __init__(self) -> None:
+        self.rows: List[SparseRow] = []
+
+    def __getitem__(self, row: int) -> SparseRow:
+        return self.rows[row]
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __iter__(self) -> Iterator[SparseRow]:
+        return iter(self.rows)
+
+    def __eq__(self, other: Any) -> bool:
+        return len(self.rows) == len(other) and all(row == other_row for row, other_row in zip(self.rows, other))
+
+
+class SparseModelBuilder:
+    """
+    Builds a SparseGrid and its runs in a single row-major pass over the non-black cells.
+
+    Horizontal runs only need the clue being extended in the current row, vertical runs one open
+    clue per column, so nothing is ever looked up again once a cell has been added.
+    """
+    def __init__(self) -> None:
+        self.grid = SparseGrid()
+        self.clues: CluesDict = {}
+        self.clue_cells: ClueToCellsDict = {}
+        self.cell_clues: CellToCluesDict = {}
+        self.empty_cells: CellsList = []
+        self.filled_cells: CellsList = []
+        self.horizontal: Optional[Tuple[Tuple[int, int, str], CellPosition]] = None
+        self.vertical: Dict[int, Tuple[Tuple[int, int, str], int]] = {}
+        self.previous: CellPosition = (-1, -1)
+
+    def add_row(self, width: int) -> None:
+        """
+        Opens the next row of the grid.
+        :param width: Number of columns of the row.
+        """
+        self.grid.rows.append(SparseRow(width))
+
+    def add_cell(self, row: int, column: int, value: Any) -> None:
+        """
+        Adds one cell; black cells may be passed or skipped.
+        :param row: Row index, rows must have been opened with add_row.
+        :param column: Column index.
+        :param value: Cell value: a clue tuple (or list), None, a digit or a black cell.
+        :raises ValueError: If cells are not given in row-major order or lie outside the grid.
+        """
+        if (row, column) <= self.previous:
+            raise ValueError("Cells must be given in row-major order")
+        if not (0 <= row < len(self.grid.rows) and 0 <= column < self.grid.rows[row].width):
+            raise ValueError(f"Cell {(row, column)} is outside the grid")
+        self.previous = (row, column)
+
+        if isinstance(value, list):
+            value = tuple(value)
+
+        if isinstance(value, tuple):
+            self.grid.rows[row].cells[column] = value
+            self.clues[(row, column)] = value
+            self.horizontal = ((row, column, 'H'), (row, column + 1))
+            self.vertical[column] = ((row, column, 'V'), row + 1)
+            return
+
+        if value is not None and not isinstance(value, int):
+            return
+
+        self.grid.rows[row].cells[column] = value
+        horizontal_clue = vertical_clue = None
+
+        if self.horizontal is not None and self.horizontal[1] == (row, column):
+            horizontal_clue = self.horizontal[0]
+            self.horizontal = (horizontal_clue, (row, column + 1))
+            self.clue_cells.setdefault(horizontal_clue, []).append((row, column))
+
+        run = self.vertical.get(column)
+        if run is not None and run[1] == row:
+            vertical_clue = run[0]
+            self.vertical[column] = (vertical_clue, row + 1)
+            self.clue_cells.setdefault(vertical_clue, []).append((row, column))
+
+        if horizontal_clue or vertical_clue:
+            self.cell_clues[(row, column)] = (vertical_clue, horizontal_clue)
+
+        (self.empty_cells if value is None else self.filled_cells).append((row, column))
+
+    def build(self) -> "SparseKakuroModel":
+        """
+        :return: Model holding the sparse grid and the runs collected so far.
+        :raises ValueError: If no row was added.
+        """
+        if not self.grid.rows:
+            raise ValueError("A puzzle must be a non-empty list of rows")
+
+        model = SparseKakuroModel(self.grid)
+        model.clues = self.clues
+        model.clue_cells = self.clue_cells
+        model.cell_clues = self.cell_clues
+        model.empty_cells = self.empty_cells
+        model.filled_cells = self.filled_cells
+
+        return model
+
+
+class SparseKakuroModel(KakuroModel):
+    """
+    Kakuro model backed by a SparseGrid, for very large puzzles that are mostly black cells.
+
+    The clue, run and cell lists are filled in while the grid is built, so KakuroService uses
+    them as they are instead of scanning the grid. Build it with from_rows or from_cells.
+    :param grid: Sparse grid.
+    """
+    def __init__(self, grid: SparseGrid) -> None:
+        super().__init__(grid)
+
+    @staticmethod
+    def from_rows(rows: Iterable[Sequence[Any]]) -> "SparseKakuroModel":
+        """
+        Builds a model from rows consumed one at a time, e.g. iter_puzzle_rows_from_path.
+        :param rows: Iterable of grid rows.
+        :return: Sparse model.
+        """
+        builder = SparseModelBuilder()
+
+        for row, values in enumerate(rows):
+            builder.add_row(len(values))
+            for column, value in enumerate(values):
+                if value != BLACK_CELL:
+                    builder.add_cell(row, column, value)
+
+        return builder.build()
+
+    @staticmethod
+    def from_cells(height: int, width: int, cells: Iterable[Tuple[int, int, Any]]) -> "SparseKakuroModel":
+        """
+        Builds a model from its non-black cells only.
+        :param height: Number of rows.
+        :param width: Number of columns.
+        :param cells: (row, column, value) triples in row-major order; omitted cells are black.
+        :return: Sparse model.
+        """
+        builder = SparseModelBuilder()
+        for _ in range(height):
+            builder.add_row(width)
+
+        for row, column, value in cells:
+            builder.add_cell(row, column, value)
+
+        return builder.build()
\ No newline at end of file
@@ -0,0 +1,397 @@
+import argparse
+import json
+import multiprocessing
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from src.Loaders.kakuro_loader import parse_puzzle
+from src.Models.kakuro_model import KakuroModel
+from src.Services.combination_table import get_combination_table
+from src.Services.kakuro_service import KakuroService
+from src.Services.solution_validator import IncrementalValidator
+from src.Solvers.solver_registry import ORTOOLS_ENGINES, create_solver
+
+Job = Tuple[str, Dict[str, Any]]
+
+JOB_SOLVE = "solve"
+JOB_COUNT = "count-solutions"
+
+POST_ENDPOINTS: Tuple[str, ...] = ("/solve", "/validate", "/count-solutions")
+OTHER_ENDPOINT = "other"
+
+
+def warm_worker(preload_ortools: bool) -> None:
+    """
+    Initializes a worker process: builds the combination table and optionally imports OR-Tools
+    and runs a tiny solve with each OR-Tools engine, so that the first request served by the
+    process does not pay for it. Missing OR-Tools is tolerated.
+
+    :param preload_ortools: Whether to import the OR-Tools engines.
+    """
+    get_combination_table(KakuroService.MIN_VALUE, KakuroService.MAX_VALUE).preload()
+
+    if preload_ortools:
+        for engine in ORTOOLS_ENGINES:
+            try:
+                create_solver(engine).solve(KakuroService(KakuroModel([["X", (1, None)], [(None, 1), None]])))
+            except ImportError:
+                return
+
+
+def run_job(kind: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Executes one solve or count-solutions request.
+
+    :param kind: JOB_SOLVE or JOB_COUNT.
+    :param payload: Decoded request body.
+    :return: JSON-serializable response body.
+    """
+    try:
+        kakuro_service = KakuroService(KakuroModel(parse_puzzle(payload["puzzle"])))
+
+        if kind == JOB_COUNT:
+            solver = create_solver("backtracking")
+            count = solver.count_solutions(kakuro_service, limit=payload.get("limit"), time_limit=payload.get("time_limit"))
+            return {"count": count, "complete": not (solver.timed_out or solver.count_limit == count)}
+
+        solver = create_solver(payload.get("engine", "backtracking"))
+        if solver.solve(kakuro_service, time_limit=payload.get("time_limit")):
+            return {"status": "solved", "grid": kakuro_service.model.grid}
+        return {"status": "timeout" if solver.timed_out else "unsolvable", "grid": None}
+    except (KeyError, IndexError, TypeError, ValueError) as error:
+        return {"error": str(error)}
+
+
+def run_batch(jobs: List[Job]) -> List[Dict[str, Any]]:
+    """
+    Executes a micro-batch of requests in a worker process.
+
+    :param jobs: (kind, payload) tuples.
+    :return: One response body per job.
+    """
+    return [run_job(kind, payload) for kind, payload in jobs]
+
+
+class ServerMetrics:
+    """
+    Thread-safe request, batch and latency counters of the HTTP service.
+
+    :param window: Number of most recent latencies per endpoint used for percentiles.
+    """
+    def __init__(self, window: int = 10000) -> None:
+        self.started: float = time.monotonic()
+        self.lock = threading.Lock()
+        self.window: int = window
+        self.requests: Dict[str, int] = {}
+        self.errors: Dict[str, int] = {}
+        self.latencies: Dict[str, Deque[float]] = {}
+        self.batches: int = 0
+        self.batched_jobs: int = 0
+        self.largest_batch: int = 0
+
+    def record_request(self, endpoint: str, latency: float, ok: bool) -> None:
+        """
+        Records a finished request.
+
+        :param endpoint: Request path.
+        :param latency: Time from receiving the request to sending the response, in seconds.
+        :param ok: False if the request failed.
+        """
+        with self.lock:
+            self.requests[endpoint] = self.requests.get(endpoint, 0) + 1
+            if not ok:
+                self.errors[endpoint] = self.errors.get(endpoint, 0) + 1
+            self.latencies.setdefault(endpoint, deque(maxlen=self.window)).append(latency)
+
+    def record_batch(self, size: int) -> None:
+        """
+        Records a micro-batch dispatched to the worker pool.
+
+        :param size: Number of jobs in the batch.
+        """
+        with self.lock:
+            self.batches += 1
+            self.batched_jobs += size
+            self.largest_batch = max(self.largest_batch, size)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        :return: JSON-serializable view of all counters.
+        """
+        with self.lock:
+            uptime = time.monotonic() - self.started
+            endpoints = {}
+
+            for endpoint, count in self.requests.items():
+                latencies = sorted(self.latencies[endpoint])
+                endpoints[endpoint] = {
+                    "requests": count,
+                    "errors": self.errors.get(endpoint, 0),
+                    "requests_per_second": count / uptime if uptime else 0.0,
+                    "latency_ms": {
+                        "p50": latencies[len(latencies) // 2] * 1000,
+                        "p95": latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))] * 1000,
+                        "max": latencies[-1] * 1000,
+                    },
+                }
+
+            return {
+                "uptime_seconds": uptime,
+                "endpoints": endpoints,
+                "batches": self.batches,
+                "average_batch_size": self.batched_jobs / self.batches if self.batches else 0.0,
+                "largest_batch": self.largest_batch,
+            }
+
+
+class MicroBatcher:
+    """
+    Coalesces concurrent jobs into micro-batches dispatched to a process pool.
+
+    A dispatcher thread waits for a job, then keeps collecting for at most max_delay seconds
+    or until max_batch_size jobs are queued. The batch is split into one task per worker, so a
+    hard puzzle only holds up the jobs sharing its chunk while the other workers keep going.
+
+    :param executor: Worker pool running run_batch.
+    :param metrics: Metrics receiving the batch sizes.
+    :param max_batch_size: Largest number of jobs per batch.
+    :param max_delay: Longest time in seconds the first job of a batch waits for others.
+    :param workers: Number of worker processes in the pool.
+    """
+    def __init__(self, executor: ProcessPoolExecutor, metrics: ServerMetrics, max_batch_size: int = 16,
+                 max_delay: float = 0.002, workers: int = 1) -> None:
+        self.executor = executor
+        self.metrics = metrics
+        self.workers: int = max(1, workers)
+        self.max_batch_size: int = max_batch_size
+        self.max_delay: float = max_delay
+        self.jobs: "queue.Queue[Optional[Tuple[Job, Future]]]" = queue.Queue()
+        self.thread = threading.Thread(target=self.dispatch, name="kakuro-batcher", daemon=True)
+        self.thread.start()
+
+    def submit(self, kind: str, payload: Dict[str, Any]) -> Future:
+        """
+        Queues a job.
+
+        :param kind: JOB_SOLVE or JOB_COUNT.
+        :param payload: Decoded request body.
+        :return: Future resolved with the response body.
+        """
+        future: Future = Future()
+        self.jobs.put(((kind, payload), future))
+        return future
+
+    def dispatch(self) -> None:
+        """
+        Dispatcher loop, runs until close() is called.
+        """
+        while True:
+            item = self.jobs.get()
+            if item is None:
+                return
+
+            batch = [item]
+            deadline = time.monotonic() + self.max_delay
+
+            while len(batch) < self.max_batch_size:
+                try:
+                    item = self.jobs.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    break
+                if item is None:
+                    self.jobs.put(None)
+                    break
+                batch.append(item)
+
+            self.metrics.record_batch(len(batch))
+            chunk_count = min(self.workers, len(batch))
+
+            for chunk in (batch[index::chunk_count] for index in range(chunk_count)):
+                futures = [future for _, future in chunk]
+                task = self.executor.submit(run_batch, [job for job, _ in chunk])
+                task.add_done_callback(lambda done, futures=futures: self.resolve(done, futures))
+
+    @staticmethod
+    def resolve(task: Future, futures: List[Future]) -> None:
+        """
+        Hands the results of a finished batch to the waiting requests.
+        """
+        error = task.exception()
+        for index, future in enumerate(futures):
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(task.result()[index])
+
+    def close(self) -> None:
+        """
+        Stops the dispatcher thread.
+        """
+        self.jobs.put(None)
+        self.thread.join()
+
+
+class KakuroRequestHandler(BaseHTTPRequestHandler):
+    """
+    Handles the JSON endpoints: POST /solve, /validate and /count-solutions, GET /metrics.
+    """
+    server: "KakuroHTTPServer"
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    wbufsize = -1
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Keeps the per-request access log off stderr."""
+
+    def send_json(self, status: int, body: Dict[str, Any]) -> None:
+        """
+        Sends a JSON response.
+        """
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def do_GET(self) -> None:
+        if self.path == "/metrics":
+            self.send_json(200, self.server.metrics.snapshot())
+        else:
+            self.send_json(404, {"error": f"Unknown endpoint: {self.path}"})
+
+    def do_POST(self) -> None:
+        started = time.monotonic()
+
+        try:
+            length = int(self.headers.get("Content-Length", 0))
+            if length < 0:
+                raise ValueError
+        except ValueError:
+            # The body cannot be skipped without a valid length, so the connection is closed.
+            self.close_connection = True
+            status, response = 400, {"error": "Invalid Content-Length header"}
+        else:
+            status, response = self.handle_post(self.rfile.read(length))
+
+        self.send_json(status, response)
+        endpoint = self.path if self.path in POST_ENDPOINTS else OTHER_ENDPOINT
+        self.server.metrics.record_request(endpoint, time.monotonic() - started, status == 200)
+
+    def handle_post(self, body: bytes) -> Tuple[int, Dict[str, Any]]:
+        """
+        Dispatches a POST request.
+
+        :param body: Raw request body.
+        :return: (HTTP status, response body) tuple.
+        """
+        if self.path not in POST_ENDPOINTS:
+            return 404, {"error": f"Unknown endpoint: {self.path}"}
+
+        try:
+            payload = json.loads(body)
+            if not isinstance(payload, dict):
+                raise ValueError("Request body must be a JSON object")
+        except ValueError as error:
+            return 400, {"error": str(error)}
+
+        if self.path == "/validate":
+            return self.validate(payload)
+
+        kind = JOB_SOLVE if self.path == "/solve" else JOB_COUNT
+        try:
+            result = self.server.batcher.submit(kind, payload).result()
+        except Exception as error:
+            return 500, {"error": str(error)}
+
+        return (400 if "error" in result else 200), result
+
+    @staticmethod
+    def validate(payload: Dict[str, Any]) -> Tuple[int, Dict[str, Any]]:
+        """
+        Validates a grid in the request thread, it is too cheap to be worth batching.
+        """
+        try:
+            validator = IncrementalValidator(KakuroService(KakuroModel(parse_puzzle(payload["puzzle"]))))
+        except (KeyError, IndexError, TypeError, ValueError) as error:
+            return 400, {"error": str(error)}
+
+        violation = validator.first_violation()
+        return 200, {
+            "solved": violation is None,
+            "violation": None if violation is None else {"clue": list(violation[0]), "reason": violation[1]},
+        }
+
+
+class KakuroHTTPServer(ThreadingHTTPServer):
+    """
+    Local HTTP/JSON solving service.
+
+    Solve and count-solutions requests are coalesced into micro-batches and run in a pool of
+    warm worker processes that have the combination table built and, optionally, OR-Tools imported.
+
+    :param address: (host, port) to listen on, port 0 picks a free port.
+    :param workers: Number of worker processes.
+    :param max_batch_size: Largest number of requests per micro-batch.
+    :param max_delay: Longest time in seconds a request waits for others to join its batch.
+    :param preload_ortools: Whether workers import OR-Tools at start-up.
+    """
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], workers: int = 2, max_batch_size: int = 16,
+                 max_delay: float = 0.002, preload_ortools: bool = True) -> None:
+        self.metrics = ServerMetrics()
+        self.executor = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=warm_worker,
+            initargs=(preload_ortools,)
+        )
+        # Start every worker now so that start-up costs are not paid by the first requests.
+        for future in [self.executor.submit(time.sleep, 0.05) for _ in range(workers)]:
+            future.result()
+
+        self.batcher = MicroBatcher(self.executor, self.metrics, max_batch_size, max_delay, workers)
+        super().__init__(address, KakuroRequestHandler)
+
+    def server_close(self) -> None:
+        """
+        Closes the socket, the batcher and the worker pool.
+        """
+        super().server_close()
+        self.batcher.close()
+        self.executor.shutdown(wait=True)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Runs the HTTP service until interrupted.
+    """
+    parser = argparse.ArgumentParser(description="Serve Kakuro solving over HTTP/JSON.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    parser.add_argument("--workers", type=int, default=multiprocessing.cpu_count())
+    parser.add_argument("--max-batch-size", type=int, default=16)
+    parser.add_argument("--max-delay", type=float, default=0.002, help="batching window in seconds")
+    parser.add_argument("--no-ortools", action="store_true", help="do not preload OR-Tools in the workers")
+    arguments = parser.parse_args(argv)
+
+    server = KakuroHTTPServer((arguments.host, arguments.port), arguments.workers, arguments.max_batch_size,
+                              arguments.max_delay, not arguments.no_ortools)
+    print(f"Serving on http://{server.server_address[0]}:{server.server_address[1]}")
+
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
\ No newline at end of file
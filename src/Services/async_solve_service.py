@@ -0,0 +1,144 @@
+import asyncio
+import copy
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional, Tuple, Union
+
+from src.Models.kakuro_model import KakuroModel
+from src.Services.kakuro_service import KakuroService
+from src.Services.puzzle_definition import PuzzleDefinition
+from src.Solvers.cancellation import CancellationToken
+from src.Solvers.solver_registry import SOLVER_ENGINES, create_solver
+from src.Types.types import PuzzleGrid
+
+
+class AsyncSolveService:
+    """
+    Runs blocking solves from asyncio code in a managed thread pool.
+
+    Every solve works on its own copy of the puzzle; a PuzzleDefinition can be passed
+    instead of a grid to share the parsed structure between solves without copying it. Each engine has its own concurrency
+    limit, so a burst of requests queues up instead of oversubscribing the cores; a
+    request waiting for a slot or running in the pool can be cancelled or time out, in
+    which case the running solver is told to stop through a CancellationToken.
+
+    :param engine_limits: Maximum number of concurrent solves per engine name.
+    :param default_limit: Limit for engines missing from engine_limits, defaults to the CPU count.
+    """
+    def __init__(self, engine_limits: Optional[Dict[str, int]] = None, default_limit: Optional[int] = None) -> None:
+        self.engine_limits: Dict[str, int] = dict(engine_limits or {})
+        self.default_limit: int = default_limit or os.cpu_count() or 1
+        self.semaphores: Dict[str, asyncio.Semaphore] = {}
+        self.executors: Dict[str, ThreadPoolExecutor] = {}
+
+    def get_engine_pool(self, engine: str) -> Tuple[asyncio.Semaphore, ThreadPoolExecutor]:
+        """
+        Returns the semaphore and thread pool enforcing the concurrency limit of an engine.
+
+        :param engine: Engine name.
+        :return: (semaphore, executor) tuple for that engine.
+        :raises KeyError: If the engine is not registered.
+        """
+        if engine not in SOLVER_ENGINES:
+            raise KeyError(f"Unknown solver engine: {engine}")
+
+        if engine not in self.semaphores:
+            limit = self.engine_limits.get(engine, self.default_limit)
+            self.semaphores[engine] = asyncio.Semaphore(limit)
+            self.executors[engine] = ThreadPoolExecutor(max_workers=limit, thread_name_prefix=f"kakuro-{engine}")
+
+        return self.semaphores[engine], self.executors[engine]
+
+    @staticmethod
+    def solve_blocking(
+        puzzle: Union[PuzzleGrid, PuzzleDefinition],
+        engine: str,
+        time_limit: Optional[float],
+        cancellation: CancellationToken,
+        min_value: Optional[int] = None,
+        max_value: Optional[int] = None
+    ) -> Optional[PuzzleGrid]:
+        """
+        Solves a copy of a puzzle in the calling thread.
+
+        :param puzzle: Puzzle grid or definition, it is not modified.
+        :param engine: Engine name.
+        :param time_limit: Optional limit in seconds passed to the solver.
+        :param cancellation: Token that stops the solver.
+        :param min_value: Smallest allowed digit of a grid, a definition carries its own range.
+        :param max_value: Largest allowed digit of a grid, a definition carries its own range.
+        :return: Solved grid, or None if the puzzle has no solution.
+        :raises asyncio.TimeoutError: If the solver stopped at its time limit.
+        :raises asyncio.CancelledError: If the solver was stopped through the token.
+        """
+        if isinstance(puzzle, PuzzleDefinition):
+            kakuro_service = puzzle.create_service()
+        else:
+            kakuro_service = KakuroService(KakuroModel(copy.deepcopy(puzzle)), min_value, max_value)
+        solver = create_solver(engine)
+
+        if solver.solve(kakuro_service, time_limit=time_limit, cancellation=cancellation):
+            return kakuro_service.model.grid
+
+        # A stopped solver also returns False, which must not be mistaken for "no solution".
+        if getattr(solver, "timed_out", False):
+            raise asyncio.TimeoutError(f"Engine {engine} reached its time limit")
+        if getattr(solver, "cancelled", False):
+            raise asyncio.CancelledError()
+        return None
+
+    async def solve(
+        self,
+        puzzle: Union[PuzzleGrid, PuzzleDefinition],
+        engine: str = "backtracking",
+        timeout: Optional[float] = None,
+        min_value: Optional[int] = None,
+        max_value: Optional[int] = None
+    ) -> Optional[PuzzleGrid]:
+        """
+        Solves a puzzle without blocking the event loop.
+
+        The timeout covers the solve itself, not the wait for a free slot of the engine.
+
+        :param puzzle: Puzzle grid or definition, it is not modified.
+        :param engine: Engine name from the solver registry.
+        :param timeout: Optional limit in seconds.
+        :param min_value: Smallest allowed digit of a grid, KakuroService.MIN_VALUE by default.
+        :param max_value: Largest allowed digit of a grid, KakuroService.MAX_VALUE by default.
+        :return: Solved grid, or None if the puzzle has no solution.
+        :raises asyncio.TimeoutError: If the solve did not finish within the timeout.
+        :raises KeyError: If the engine is not registered.
+        """
+        semaphore, executor = self.get_engine_pool(engine)
+        await semaphore.acquire()
+
+        cancellation = CancellationToken()
+        try:
+            future = asyncio.get_running_loop().run_in_executor(
+                executor, self.solve_blocking, puzzle, engine, timeout, cancellation, min_value, max_value
+            )
+        except BaseException:
+            semaphore.release()
+            raise
+
+        # The slot is only given back once the worker thread is done, even if the caller gave up earlier.
+        future.add_done_callback(lambda _: semaphore.release())
+
+        try:
+            return await asyncio.wait_for(asyncio.shield(future), timeout)
+        finally:
+            if not future.done():
+                cancellation.cancel()
+
+    def close(self) -> None:
+        """
+        Shuts the thread pools down, waiting for running solves to finish.
+        """
+        for executor in self.executors.values():
+            executor.shutdown(wait=True)
+
+    async def __aenter__(self) -> "AsyncSolveService":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
\ No newline at end of file
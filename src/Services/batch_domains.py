@@ -0,0 +1,141 @@
+from typing import Any, List, Sequence
+
+from src.Services.combination_table import get_combination_table
+from src.Services.grid_arrays import CELL_CLUE, CELL_WHITE, encode_grids
+from src.Services.kakuro_service import KakuroService
+from src.Types.types import CellDomainDict, PuzzleGrid
+
+
+def build_combination_masks(min_value: int, max_value: int) -> Any:
+    """
+    Lays the combination table of a digit range out as an array indexed by run length and sum.
+
+    :param min_value: Smallest allowed digit.
+    :param max_value: Largest allowed digit.
+    :return: Array of shape (max_length + 1, max_sum + 1, max_combinations) holding the bitmask
+             (bit v set for digit v) of each combination, padded with -1.
+    """
+    import numpy as np
+
+    combination_table = get_combination_table(min_value, max_value)
+    max_length = max_value - min_value + 1
+    max_sum = sum(range(min_value, max_value + 1))
+    table = [
+        [combination_table.get_masks(length, total) for total in range(max_sum + 1)]
+        for length in range(max_length + 1)
+    ]
+
+    width = max(len(masks) for sums in table for masks in sums)
+    combination_masks = np.full((max_length + 1, max_sum + 1, width), -1, dtype=np.int64)
+
+    for length, sums in enumerate(table):
+        for total, masks in enumerate(sums):
+            combination_masks[length, total, :len(masks)] = masks
+
+    return combination_masks
+
+
+def extract_domain_masks(
+    grids: Sequence[PuzzleGrid],
+    min_value: int = KakuroService.MIN_VALUE,
+    max_value: int = KakuroService.MAX_VALUE
+) -> Any:
+    """
+    Computes the initial candidate masks of all empty cells of many puzzles at once.
+
+    Gives the same domains as KakuroService.extract_domains, but with a few vectorised NumPy
+    operations over the whole batch instead of a Python loop per puzzle and cell.
+
+    :param grids: Puzzle grids, possibly of different sizes.
+    :param min_value: Smallest allowed digit.
+    :param max_value: Largest allowed digit.
+    :return: Array of shape (count, height, width) with the candidate bitmask (bit v set for
+             digit v) of each empty cell and 0 for every other cell.
+    """
+    import numpy as np
+
+    encoded = encode_grids(grids)
+    combination_masks = build_combination_masks(min_value, max_value)
+    max_length, max_sum = combination_masks.shape[0] - 1, combination_masks.shape[1] - 1
+    full_mask = ((1 << (max_value + 1)) - 1) & ~((1 << min_value) - 1)
+
+    kinds = encoded.kind.ravel()
+    values = encoded.value.ravel()
+    white = kinds == CELL_WHITE
+    empty = white & (values < 0)
+    filled = white & (values >= 0)
+    domain_masks = np.where(empty, full_mask, 0)
+
+    for run_ids, sums in ((encoded.down_run, encoded.down_sum), (encoded.right_run, encoded.right_sum)):
+        run_ids = run_ids.ravel()
+        targets = sums.ravel()
+        clued = white & (run_ids >= 0)
+        clued[clued] = kinds[run_ids[clued]] == CELL_CLUE
+
+        lengths = np.bincount(run_ids[clued], minlength=encoded.kind.size)
+        used = np.zeros(encoded.kind.size, dtype=np.int64)
+        np.bitwise_or.at(used, run_ids[clued & filled], np.left_shift(1, values[clued & filled]))
+
+        runs = np.nonzero(lengths)[0]
+        run_lengths, run_targets, run_used = lengths[runs], targets[runs], used[runs]
+        in_table = (run_lengths <= max_length) & (run_targets <= max_sum)
+
+        combos = combination_masks[np.minimum(run_lengths, max_length), np.minimum(run_targets, max_sum)]
+        matching = (combos >= 0) & ((combos & run_used[:, None]) == run_used[:, None]) & in_table[:, None]
+        summed = np.bitwise_or.reduce(np.where(matching, combos, 0), axis=1)
+
+        candidates = np.full(encoded.kind.size, full_mask, dtype=np.int64)
+        candidates[runs] = np.where(run_targets > 0, summed, full_mask) & ~run_used
+
+        cells = np.nonzero(empty & clued)[0]
+        domain_masks[cells] &= candidates[run_ids[cells]]
+
+    return domain_masks.reshape(encoded.kind.shape)
+
+
+def masks_to_domains(
+    domain_masks: Any,
+    grid: PuzzleGrid,
+    min_value: int = KakuroService.MIN_VALUE,
+    max_value: int = KakuroService.MAX_VALUE
+) -> CellDomainDict:
+    """
+    Converts the candidate masks of one puzzle into a domain dictionary.
+
+    The result can be assigned to KakuroService.domains to seed any solver.
+
+    :param domain_masks: Candidate masks of the puzzle, shape (height, width) or larger.
+    :param grid: The puzzle grid the masks belong to.
+    :param min_value: Smallest allowed digit.
+    :param max_value: Largest allowed digit.
+    :return: Dictionary mapping each empty cell to a list of valid values.
+    """
+    domains: CellDomainDict = {}
+
+    for row, cells in enumerate(grid):
+        for column, cell in enumerate(cells):
+            if cell is None:
+                mask = int(domain_masks[row, column])
+                domains[(row, column)] = [value for value in range(min_value, max_value + 1) if mask >> value & 1]
+
+    return domains
+
+
+def extract_domains_batch(
+    grids: Sequence[PuzzleGrid],
+    min_value: int = KakuroService.MIN_VALUE,
+    max_value: int = KakuroService.MAX_VALUE
+) -> List[CellDomainDict]:
+    """
+    Computes the initial domains of many puzzles with the vectorised path.
+
+    :param grids: Puzzle grids, possibly of different sizes.
+    :param min_value: Smallest allowed digit.
+    :param max_value: Largest allowed digit.
+    :return: One domain dictionary per puzzle, as KakuroService.extract_domains would return it.
+    """
+    if not grids:
+        return []
+
+    domain_masks = extract_domain_masks(grids, min_value, max_value)
+    return [masks_to_domains(domain_masks[index], grid, min_value, max_value) for index, grid in enumerate(grids)]
\ No newline at end of file
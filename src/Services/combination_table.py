@@ -0,0 +1,128 @@
+from typing import Dict, Set, Tuple
+
+
+class CombinationTable:
+    """
+    Digit combinations of Kakuro runs for one digit range, stored as subset bitmasks (bit v set for digit v).
+
+    The masks of a (length, sum) pair are computed by dynamic programming the first time they are
+    asked for: the combinations using digits up to d are those using digits up to d - 1, plus d
+    added to the combinations of length - 1 and sum - d using digits up to d - 1. Partial results
+    are shared between pairs and pairs that are never asked for are never computed, so ranges
+    such as 1-15 or 0-9 stay cheap where enumerating every combination would not.
+
+    :param min_value: Smallest allowed digit, at least 0.
+    :param max_value: Largest allowed digit.
+    :raises ValueError: If the range is empty or starts below 0.
+    """
+    def __init__(self, min_value: int, max_value: int) -> None:
+        if min_value < 0 or max_value < min_value:
+            raise ValueError(f"Invalid digit range: {min_value}-{max_value}")
+
+        self.min_value: int = min_value
+        self.max_value: int = max_value
+        self.masks: Dict[Tuple[int, int], Tuple[int, ...]] = {}
+        self.partial: Dict[Tuple[int, int, int], Tuple[int, ...]] = {}
+
+    def get_masks(self, length: int, target_sum: int) -> Tuple[int, ...]:
+        """
+        Get the combinations of a run.
+        :param length: Number of cells in the run.
+        :param target_sum: Clue sum of the run.
+        :return: Bitmask of each combination of distinct digits with that length and sum.
+        """
+        key = (length, target_sum)
+        masks = self.masks.get(key)
+
+        if masks is None:
+            masks = self.build(length, target_sum)
+            self.masks[key] = masks
+
+        return masks
+
+    def build(self, length: int, target_sum: int) -> Tuple[int, ...]:
+        """
+        Compute the combinations of a run that is not in the table yet.
+        :param length: Number of cells in the run.
+        :param target_sum: Clue sum of the run.
+        :return: Bitmasks of the combinations.
+        """
+        return self.subsets(length, target_sum, self.max_value)
+
+    def subsets(self, length: int, target_sum: int, upper: int) -> Tuple[int, ...]:
+        """
+        Combinations of distinct digits between min_value and upper.
+        :param length: Number of digits.
+        :param target_sum: Sum of the digits.
+        :param upper: Largest digit allowed.
+        :return: Bitmasks of the combinations.
+        """
+        if length == 0:
+            return (0,) if target_sum == 0 else ()
+
+        lowest = length * self.min_value + length * (length - 1) // 2
+        highest = length * upper - length * (length - 1) // 2
+        if upper - self.min_value + 1 < length or not lowest <= target_sum <= highest:
+            return ()
+
+        key = (length, target_sum, upper)
+        masks = self.partial.get(key)
+
+        if masks is None:
+            bit = 1 << upper
+            masks = self.subsets(length, target_sum, upper - 1) + tuple(
+                mask | bit for mask in self.subsets(length - 1, target_sum - upper, upper - 1)
+            )
+            self.partial[key] = masks
+
+        return masks
+
+    def count(self, length: int, target_sum: int) -> int:
+        """
+        :param length: Number of cells in the run.
+        :param target_sum: Clue sum of the run.
+        :return: Number of combinations of the run.
+        """
+        return len(self.get_masks(length, target_sum))
+
+    def get_combinations(self, length: int, target_sum: int) -> Set[Tuple[int, ...]]:
+        """
+        Get the combinations of a run as sorted digit tuples.
+        :param length: Number of cells in the run.
+        :param target_sum: Clue sum of the run.
+        :return: Set of digit tuples.
+        """
+        return {
+            tuple(value for value in range(self.min_value, self.max_value + 1) if mask >> value & 1)
+            for mask in self.get_masks(length, target_sum)
+        }
+
+    def preload(self) -> None:
+        """
+        Compute every (length, sum) pair of the range, e.g. when warming up a worker process.
+        """
+        for length in range(1, self.max_value - self.min_value + 2):
+            lowest = length * self.min_value + length * (length - 1) // 2
+            highest = length * self.max_value - length * (length - 1) // 2
+            for target_sum in range(lowest, highest + 1):
+                self.get_masks(length, target_sum)
+
+
+_tables: Dict[Tuple[int, int], CombinationTable] = {}
+
+
+def get_combination_table(min_value: int, max_value: int) -> CombinationTable:
+    """
+    Get the combination table of a digit range, shared by every service using that range.
+    :param min_value: Smallest allowed digit.
+    :param max_value: Largest allowed digit.
+    :return: The table, created on first use.
+    """
+    key = (min_value, max_value)
+    table = _tables.get(key)
+
+    if table is None:
+        table = CombinationTable(min_value, max_value)
+        _tables[key] = table
+
+    return table
\ No newline at end of file
@@ -0,0 +1,437 @@
+import math
+from typing import Dict, List, Optional, Tuple
+
+from src.Cache.lru_cache import LRUCache
+from src.Models.kakuro_model import KakuroModel
+from src.Services.kakuro_service import KakuroService
+from src.Types.types import CellPosition, PuzzleGrid
+
+LEVEL_NONE = 0
+LEVEL_SINGLES = 1
+LEVEL_COMBINATIONS = 2
+LEVEL_INTERSECTIONS = 3
+LEVEL_SEARCH = 4
+TECHNIQUES: Tuple[str, ...] = ("none", "singles", "combinations", "intersections", "search")
+
+
+class DifficultyRating:
+    """
+    Outcome of rating a puzzle with layered logical deductions.
+
+    :param level: Hardest technique level the deductions needed, LEVEL_SEARCH if they stalled before
+                  the grid was complete.
+    :param steps: Number of deductions made with each technique, by technique name.
+    :param solved: Number of cells placed by the deductions.
+    :param remaining: Number of empty cells left when the deductions stalled.
+    :param branching: Sum of log2 of the domain sizes left, i.e. log2 of the number of candidate grids a search would face.
+    :param contradiction: Whether the deductions emptied a domain, i.e. the puzzle has no solution.
+    """
+    def __init__(
+        self,
+        level: int,
+        steps: Dict[str, int],
+        solved: int,
+        remaining: int,
+        branching: float,
+        contradiction: bool = False
+    ) -> None:
+        self.level: int = level
+        self.steps: Dict[str, int] = steps
+        self.solved: int = solved
+        self.remaining: int = remaining
+        self.branching: float = branching
+        self.contradiction: bool = contradiction
+
+    @property
+    def technique(self) -> str:
+        """
+        Name of the hardest technique level needed.
+        """
+        return TECHNIQUES[self.level]
+
+    @property
+    def score(self) -> Tuple[int, float]:
+        """
+        Sort key of the expected solve cost: technique level first, then the branching left.
+        """
+        return self.level, self.branching
+
+    def to_dict(self) -> Dict[str, object]:
+        """
+        :return: JSON-serialisable representation.
+        """
+        return {
+            "level": self.level,
+            "technique": self.technique,
+            "steps": dict(self.steps),
+            "solved": self.solved,
+            "remaining": self.remaining,
+            "branching": round(self.branching, 3),
+            "contradiction": self.contradiction,
+        }
+
+
+class DeductionState:
+    """
+    Cell values and candidate bitmasks (bit v set for digit v) of a puzzle being rated.
+
+    Starts from the domains of a KakuroService and only ever narrows them; the service itself is
+    read, never modified. Runs are indexed once, so every technique works on lists and masks.
+
+    :param kakuro_service: Kakuro instance to rate.
+    :param memo: Cache of get_allowed_digits results, shared between the puzzles of a rater.
+    """
+    def __init__(self, kakuro_service: KakuroService, memo: LRUCache) -> None:
+        self.kakuro_service = kakuro_service
+        self.memo = memo
+        self.combinations = kakuro_service.combinations
+        self.runs: List[Tuple[List[CellPosition], Optional[int]]] = []
+        self.cell_runs: Dict[CellPosition, List[int]] = {}
+        self.values: Dict[CellPosition, int] = {}
+        self.masks: Dict[CellPosition, int] = {}
+        self.contradiction: bool = False
+
+        for clue, cells in kakuro_service.clue_cells.items():
+            for cell in cells:
+                self.cell_runs.setdefault(cell, []).append(len(self.runs))
+            self.runs.append((cells, kakuro_service.get_clue_sum(clue)))
+
+        grid = kakuro_service.model.grid
+        for row, column in kakuro_service.filled_cells:
+            self.values[(row, column)] = grid[row][column]
+
+        for cell, domain in kakuro_service.domains.items():
+            mask = 0
+            for value in domain:
+                mask |= 1 << value
+            self.masks[cell] = mask
+            if not mask:
+                self.contradiction = True
+
+    def get_used_mask(self, index: int) -> int:
+        """
+        :param index: Run index.
+        :return: Bitmask of the digits placed in the run.
+        """
+        used_mask = 0
+        for cell in self.runs[index][0]:
+            value = self.values.get(cell)
+            if value is not None:
+                used_mask |= 1 << value
+        return used_mask
+
+    def place(self, cell: CellPosition, value: int) -> None:
+        """
+        Place a deduced value and remove it, and the digits its runs no longer allow, from the run peers.
+        :param cell: Empty cell.
+        :param value: Its only possible value.
+        """
+        del self.masks[cell]
+        self.values[cell] = value
+
+        for index in self.cell_runs[cell]:
+            cells, target_sum = self.runs[index]
+            used_mask = self.get_used_mask(index)
+            allowed = ~used_mask
+            if target_sum:
+                feasible, candidates_mask = self.kakuro_service.get_run_state(len(cells), target_sum, used_mask)
+                allowed = candidates_mask if feasible else 0
+
+            for peer in cells:
+                if peer in self.masks:
+                    self.masks[peer] &= allowed
+                    if not self.masks[peer]:
+                        self.contradiction = True
+
+    def apply_singles(self) -> int:
+        """
+        Place every naked single (a cell with one candidate left) and hidden single (a digit every
+        combination of a run needs that only one of its cells can take), until none is left.
+        :return: Number of cells placed.
+        """
+        placed = 0
+        progress = True
+
+        while progress and not self.contradiction:
+            progress = False
+
+            for cell in list(self.masks):
+                mask = self.masks.get(cell)
+                if mask and not mask & (mask - 1):
+                    self.place(cell, mask.bit_length() - 1)
+                    placed += 1
+                    progress = True
+
+            if progress:
+                continue
+
+            for index, (cells, target_sum) in enumerate(self.runs):
+                empty = [cell for cell in cells if cell in self.masks]
+                if not target_sum or not empty:
+                    continue
+
+                used_mask = self.get_used_mask(index)
+                combinations_count, digit_counts = self.kakuro_service.get_run_digit_counts(len(cells), target_sum, used_mask)
+                if not combinations_count:
+                    self.contradiction = True
+                    break
+
+                for value, count in enumerate(digit_counts):
+                    if count == combinations_count and not used_mask >> value & 1:
+                        candidates = [cell for cell in empty if self.masks[cell] >> value & 1]
+                        if len(candidates) == 1:
+                            self.place(candidates[0], value)
+                            placed += 1
+                            progress = True
+                            break
+                        if not candidates:
+                            self.contradiction = True
+                            break
+
+                if progress or self.contradiction:
+                    break
+
+        return placed
+
+    @staticmethod
+    def can_match(masks: List[int], digits: int) -> bool:
+        """
+        Check whether cells can take distinct digits covering a set of digits exactly.
+        :param masks: Candidate masks of the cells, as many as the bits in digits.
+        :param digits: Bitmask of the digits to place.
+        :return: True if a one-to-one assignment exists.
+        """
+        if len(masks) < 2:
+            return not masks or masks[0] & digits == digits
+
+        options = masks[0] & digits
+        while options:
+            bit = options & -options
+            if DeductionState.can_match(masks[1:], digits & ~bit):
+                return True
+            options &= ~bit
+
+        return False
+
+    def get_allowed_digits(self, length: int, target_sum: int, used_mask: int, masks: List[int]) -> int:
+        """
+        Compute, with memoization, the digits of the run combinations its empty cells can still complete.
+
+        A combination is kept only if its missing digits can be given one to each empty cell
+        within their candidates. The result only depends on the run and the candidate masks, so
+        it is shared by every puzzle rated with the same memo.
+
+        :param length: Number of cells in the run.
+        :param target_sum: Clue sum of the run.
+        :param used_mask: Bitmask of the digits placed in the run.
+        :param masks: Candidate masks of the empty cells.
+        :return: Bitmask of the allowed digits, 0 if no combination is left.
+        """
+        masks = sorted(masks)
+        key = (length, target_sum, used_mask, tuple(masks))
+        allowed = self.memo.get(key)
+
+        if allowed is None:
+            masks.sort(key=lambda mask: bin(mask).count("1"))
+            union = 0
+            for mask in masks:
+                union |= mask
+
+            allowed = 0
+            for combination_mask in self.combinations.get_masks(length, target_sum):
+                digits = combination_mask & ~used_mask
+                if combination_mask & used_mask != used_mask or digits & ~union or not digits & ~allowed:
+                    continue
+                if self.can_match(masks, digits):
+                    allowed |= digits
+
+            self.memo.put(key, allowed)
+
+        return allowed
+
+    def filter_run(self, index: int, overlay: Optional[Dict[CellPosition, int]] = None) -> Tuple[List[CellPosition], List[int], int]:
+        """
+        Narrow the empty cells of a run by combination elimination.
+        :param index: Run index.
+        :param overlay: Masks replacing the current ones, for tentative deductions.
+        :return: (empty, masks, allowed) tuple, empty: the empty cells of the run, masks: their candidate masks,
+                 allowed: bitmask of the digits they may keep, 0 if no combination is left.
+        """
+        cells, target_sum = self.runs[index]
+        used_mask = self.get_used_mask(index)
+        empty = [cell for cell in cells if cell in self.masks]
+        masks = [overlay.get(cell, self.masks[cell]) if overlay else self.masks[cell] for cell in empty]
+
+        if not empty:
+            return empty, masks, 0
+        if not target_sum:
+            return empty, masks, ~used_mask
+
+        return empty, masks, self.get_allowed_digits(len(cells), target_sum, used_mask, masks)
+
+    def apply_combinations(self) -> int:
+        """
+        Run combination elimination on every run.
+        :return: Number of candidates removed.
+        """
+        removed = 0
+
+        for index in range(len(self.runs)):
+            empty, masks, allowed = self.filter_run(index)
+
+            for cell, mask in zip(empty, masks):
+                if mask & ~allowed:
+                    removed += bin(mask & ~allowed).count("1")
+                    self.masks[cell] = mask & allowed
+                    if not mask & allowed:
+                        self.contradiction = True
+                        return removed
+
+        return removed
+
+    def get_cell_supports(self, length: int, target_sum: int, used_mask: int, masks: Tuple[int, ...]) -> Tuple[int, ...]:
+        """
+        Compute, with memoization, which candidates each empty cell of a run can take in some complete
+        assignment of the run, not just in some combination of it.
+        :param length: Number of cells in the run.
+        :param target_sum: Clue sum of the run.
+        :param used_mask: Bitmask of the digits placed in the run.
+        :param masks: Candidate masks of the empty cells, in run order.
+        :return: Supported candidates of each cell, in the same order.
+        """
+        key = ("cells", length, target_sum, used_mask, masks)
+        supports = self.memo.get(key)
+
+        if supports is None:
+            found = [0] * len(masks)
+            order = sorted(range(len(masks)), key=lambda position: bin(masks[position]).count("1"))
+            ordered = [masks[position] for position in order]
+
+            for combination_mask in self.combinations.get_masks(length, target_sum):
+                digits = combination_mask & ~used_mask
+                if combination_mask & used_mask != used_mask:
+                    continue
+
+                if any(not mask & digits for mask in masks) or not self.can_match(ordered, digits):
+                    continue
+
+                for position, mask in enumerate(masks):
+                    options = mask & digits & ~found[position]
+                    others = [masks[other] for other in order if other != position]
+                    while options:
+                        bit = options & -options
+                        options &= ~bit
+                        if self.can_match(others, digits & ~bit):
+                            found[position] |= bit
+
+            supports = tuple(found)
+            self.memo.put(key, supports)
+
+        return supports
+
+    def apply_intersections(self) -> int:
+        """
+        Narrow every empty cell to the intersection of the candidates its two runs can place in it.
+        :return: Number of candidates removed.
+        """
+        removed = 0
+
+        for index, (cells, target_sum) in enumerate(self.runs):
+            empty = [cell for cell in cells if cell in self.masks]
+            if not target_sum or not empty:
+                continue
+
+            masks = tuple(self.masks[cell] for cell in empty)
+            supports = self.get_cell_supports(len(cells), target_sum, self.get_used_mask(index), masks)
+
+            for cell, mask, support in zip(empty, masks, supports):
+                if mask & ~support:
+                    removed += bin(mask & ~support).count("1")
+                    self.masks[cell] = mask & support
+                    if not support:
+                        self.contradiction = True
+                        return removed
+
+        return removed
+
+    def get_branching(self) -> float:
+        """
+        :return: Sum of log2 of the candidate counts of the empty cells.
+        """
+        return sum((math.log2(bin(mask).count("1")) for mask in self.masks.values() if mask), 0.0)
+
+
+class DifficultyRater:
+    """
+    Rates puzzles by how far layered logical deductions get without searching.
+
+    Deductions are tried from the cheapest technique up and the cheaper ones are retried after
+    every success, so the level of a rating is the hardest technique the puzzle needed:
+
+        1. singles: naked and hidden singles over the KakuroService domains,
+        2. combinations: run combinations whose digits the empty cells cannot take are eliminated,
+        3. intersections: a cell keeps only the candidates that both its runs can place in that
+           very cell, given the candidates of their other cells.
+
+    Rating costs a few milliseconds at most for usual puzzle sizes, against a full solve, so
+    queues can be sorted by DifficultyRating.score before they are scheduled.
+
+    MEMO_CAPACITY (int): Maximum number of run narrowings memoized per rater; they are shared
+        between the puzzles it rates, which is what makes rating a whole corpus cheap.
+
+    :param max_level: Hardest technique tried; puzzles needing more are rated LEVEL_SEARCH.
+    """
+    MEMO_CAPACITY: int = 1 << 16
+
+    def __init__(self, max_level: int = LEVEL_INTERSECTIONS) -> None:
+        self.max_level: int = max_level
+        self.memo = LRUCache(self.MEMO_CAPACITY)
+
+    def rate(self, kakuro_service: KakuroService) -> DifficultyRating:
+        """
+        Rate a puzzle; the service and its grid are not modified.
+        :param kakuro_service: Kakuro instance to rate.
+        :return: The rating.
+        """
+        state = DeductionState(kakuro_service, self.memo)
+        techniques = [
+            (LEVEL_SINGLES, state.apply_singles),
+            (LEVEL_COMBINATIONS, state.apply_combinations),
+            (LEVEL_INTERSECTIONS, state.apply_intersections),
+        ]
+        steps = {TECHNIQUES[level]: 0 for level, _ in techniques if level <= self.max_level}
+        empty_count = len(state.masks)
+        level = LEVEL_NONE
+
+        while state.masks and not state.contradiction:
+            for technique_level, technique in techniques:
+                if technique_level > self.max_level:
+                    continue
+                count = technique()
+                if count:
+                    steps[TECHNIQUES[technique_level]] += count
+                    level = max(level, technique_level)
+                    break
+            else:
+                level = LEVEL_SEARCH
+                break
+
+        if state.contradiction:
+            level = LEVEL_SEARCH
+
+        return DifficultyRating(
+            level, steps, empty_count - len(state.masks), len(state.masks), state.get_branching(), state.contradiction
+        )
+
+
+_rater = DifficultyRater()
+
+
+def rate_puzzle(puzzle: PuzzleGrid, rater: Optional[DifficultyRater] = None) -> DifficultyRating:
+    """
+    Rate a puzzle grid, which is not modified.
+    :param puzzle: Puzzle grid.
+    :param rater: Rater to use, a shared one with the default levels if None.
+    :return: The rating.
+    """
+    return (rater or _rater).rate(KakuroService(KakuroModel(puzzle)))
\ No newline at end of file
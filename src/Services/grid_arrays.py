@@ -0,0 +1,94 @@
+from typing import Any, Sequence
+
+from src.Types.types import PuzzleGrid
+
+CELL_BLACK: int = 0
+CELL_CLUE: int = 1
+CELL_WHITE: int = 2
+EMPTY_VALUE: int = -1
+
+
+class EncodedGrids:
+    """
+    Many puzzle grids encoded as padded NumPy integer arrays of shape (count, height, width).
+
+    Grids smaller than the largest one are padded with black cells. Runs are identified by the
+    flat index (into the padded arrays) of the cell that starts them, so run ids are unique across
+    all encoded grids; cells that are not white have run id -1.
+
+    :param kind: CELL_BLACK, CELL_CLUE or CELL_WHITE for each cell.
+    :param value: Digit of filled white cells, EMPTY_VALUE for empty cells and 0 elsewhere.
+    :param down_sum: Down sum of clue cells, 0 where there is none.
+    :param right_sum: Right sum of clue cells, 0 where there is none.
+    """
+    def __init__(self, kind: Any, value: Any, down_sum: Any, right_sum: Any) -> None:
+        self.kind = kind
+        self.value = value
+        self.down_sum = down_sum
+        self.right_sum = right_sum
+        self.count, self.height, self.width = kind.shape
+        self.down_run = self.compute_run_ids(axis=1)
+        self.right_run = self.compute_run_ids(axis=2)
+
+    def compute_run_ids(self, axis: int) -> Any:
+        """
+        Assigns every white cell the flat index of the cell that starts its run along an axis.
+
+        :param axis: 1 for vertical (down) runs, 2 for horizontal (right) runs.
+        :return: Array of run ids, -1 for non-white cells and for runs starting at the border.
+        """
+        import numpy as np
+
+        size = self.kind.shape[axis]
+        shape = [1, 1, 1]
+        shape[axis] = size
+        positions = np.arange(size).reshape(shape)
+
+        starts = np.where(self.kind != CELL_WHITE, positions, -1)
+        starts = np.maximum.accumulate(starts, axis=axis)
+
+        grid_index = np.arange(self.count).reshape(-1, 1, 1)
+        rows = np.arange(self.height).reshape(1, -1, 1)
+        columns = np.arange(self.width).reshape(1, 1, -1)
+
+        if axis == 1:
+            run_ids = (grid_index * self.height + starts) * self.width + columns
+        else:
+            run_ids = (grid_index * self.height + rows) * self.width + starts
+
+        return np.where((self.kind == CELL_WHITE) & (starts >= 0), run_ids, -1)
+
+
+def encode_grids(grids: Sequence[PuzzleGrid]) -> EncodedGrids:
+    """
+    Encodes puzzle grids as padded integer arrays.
+
+    NumPy is imported on first use, so it is only required by callers of the vectorised paths.
+
+    :param grids: Puzzle grids, possibly of different sizes.
+    :return: EncodedGrids holding the arrays.
+    """
+    import numpy as np
+
+    height = max(len(grid) for grid in grids)
+    width = max(len(row) for grid in grids for row in grid)
+    padding = [(CELL_BLACK, 0, 0, 0)] * width
+
+    cells = []
+    for grid in grids:
+        for row in grid:
+            for cell in row:
+                if cell is None:
+                    cells.append((CELL_WHITE, EMPTY_VALUE, 0, 0))
+                elif isinstance(cell, int):
+                    cells.append((CELL_WHITE, cell, 0, 0))
+                elif isinstance(cell, (tuple, list)):
+                    cells.append((CELL_CLUE, 0, cell[0] or 0, cell[1] or 0))
+                else:
+                    cells.append((CELL_BLACK, 0, 0, 0))
+            cells.extend(padding[len(row):])
+        cells.extend(padding * (height - len(grid)))
+
+    encoded = np.array(cells, dtype=np.int64).reshape(len(grids), height, width, 4)
+
+    return EncodedGrids(encoded[..., 0].astype(np.int8), encoded[..., 1], encoded[..., 2], encoded[..., 3])
\ No newline at end of file
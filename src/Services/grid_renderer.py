@@ -0,0 +1,186 @@
+import json
+import sys
+from typing import Any, Callable, Dict, Iterable, Optional, TextIO
+
+from src.Types.types import CellValue, ClueSums, PuzzleGrid
+
+FORMAT_PRETTY = "pretty"
+FORMAT_COMPACT = "compact"
+FORMAT_JSON = "json"
+
+FORMATS = (FORMAT_PRETTY, FORMAT_COMPACT, FORMAT_JSON)
+
+BLACK_CELL = 'X'
+COMPACT_EMPTY = "."
+COMPACT_CELL_SEPARATOR = ","
+COMPACT_ROW_SEPARATOR = "/"
+
+JSON_ENCODER = json.JSONEncoder(separators=(",", ":"))
+
+
+def format_clue(clue: ClueSums) -> str:
+    """
+    Formats a clue cell for display in a Kakuro puzzle.
+
+    :param clue: A tuple (down_sum, right_sum) representing the clue values.
+                 Each value can be an integer or None if no clue exists in that direction.
+    :return: A string in the format "down\\right", "\\right", "down\\", or a space
+             if both values are None.
+    """
+    down, right = clue
+
+    if down and right:
+        return f"{down}\\{right}"
+    elif down:
+        return f"{down}\\"
+    elif right:
+        return f"\\{right}"
+    else:
+        return " "
+
+
+def render_pretty_cell(cell: CellValue) -> str:
+    """
+    :param cell: Grid cell.
+    :return: The cell as shown by the pretty view, five characters wide for clues and digits.
+    """
+    if cell == BLACK_CELL:
+        return " ███ "
+    if isinstance(cell, tuple):
+        return f"{format_clue(cell):^5}"
+    return f"  {COMPACT_EMPTY if cell is None else cell}  "
+
+
+def render_compact_cell(cell: CellValue) -> str:
+    """
+    :param cell: Grid cell.
+    :return: The cell in the compact format: 'X', '.', a digit, or 'down\\right' with missing sums left out.
+    """
+    if isinstance(cell, tuple):
+        down, right = cell
+        return f"{'' if down is None else down}\\{'' if right is None else right}"
+    return COMPACT_EMPTY if cell is None else str(cell)
+
+
+class CellCache(dict):
+    """
+    Rendered text of grid cells, keyed by the cell itself. A grid only holds a few hundred distinct
+    cells (black, empty, the digits and the clue pairs), so after warming up a row renders with
+    dictionary lookups only.
+
+    :param render_cell: Renders a cell missing from the cache.
+    """
+    def __init__(self, render_cell: Callable[[CellValue], str]) -> None:
+        super().__init__()
+        self.render_cell = render_cell
+
+    def __missing__(self, cell: CellValue) -> str:
+        text = self.render_cell(cell)
+        self[cell] = text
+        return text
+
+
+CELL_CACHES: Dict[str, CellCache] = {
+    FORMAT_PRETTY: CellCache(render_pretty_cell),
+    FORMAT_COMPACT: CellCache(render_compact_cell),
+}
+
+
+class GridRenderer:
+    """
+    Renders grids as text and writes them to any text stream.
+
+    Formats:
+      - pretty: the human-readable view of KakuroService.print_grid, one line per row;
+      - compact: one line per grid, cells separated by ',' and rows by '/', read back by parse_compact_grid;
+      - json: one line per grid, the JSON puzzle format without whitespace.
+
+    Clues must be tuples, as parse_puzzle returns them. Rendered cells are cached per format and
+    shared by all renderers.
+
+    :param output_format: One of FORMATS.
+    :raises ValueError: If the format is unknown.
+    """
+    def __init__(self, output_format: str = FORMAT_PRETTY) -> None:
+        if output_format not in FORMATS:
+            raise ValueError(f"Unknown format: {output_format}")
+
+        self.output_format: str = output_format
+        self.cells: Optional[CellCache] = CELL_CACHES.get(output_format)
+
+    def render(self, grid: PuzzleGrid) -> str:
+        """
+        :param grid: Grid to render.
+        :return: The grid as text, ending with a newline.
+        """
+        if self.cells is None:
+            return JSON_ENCODER.encode(grid) + "\n"
+
+        get = self.cells.__getitem__
+
+        if self.output_format == FORMAT_PRETTY:
+            return "\n".join(["".join(map(get, row)) for row in grid]) + "\n"
+
+        return COMPACT_ROW_SEPARATOR.join([COMPACT_CELL_SEPARATOR.join(map(get, row)) for row in grid]) + "\n"
+
+    def write(self, grid: PuzzleGrid, stream: Optional[TextIO] = None) -> None:
+        """
+        Writes one grid.
+        :param grid: Grid to render.
+        :param stream: Text stream, defaults to sys.stdout.
+        """
+        (sys.stdout if stream is None else stream).write(self.render(grid))
+
+    def write_all(self, grids: Iterable[PuzzleGrid], stream: Optional[TextIO] = None, batch_size: int = 256) -> int:
+        """
+        Writes many grids, batch_size grids per write call. Pretty grids are separated by a blank line.
+        :param grids: Grids to render.
+        :param stream: Text stream, defaults to sys.stdout.
+        :param batch_size: Number of grids rendered before each write.
+        :return: Number of grids written.
+        """
+        stream = sys.stdout if stream is None else stream
+        separator = "\n" if self.output_format == FORMAT_PRETTY else ""
+        render = self.render
+        chunk = []
+        count = 0
+
+        for grid in grids:
+            text = render(grid)
+            chunk.append(separator + text if count else text)
+            count += 1
+            if len(chunk) >= batch_size:
+                stream.write("".join(chunk))
+                chunk = []
+
+        if chunk:
+            stream.write("".join(chunk))
+
+        return count
+
+
+def parse_compact_grid(text: str) -> PuzzleGrid:
+    """
+    Reads a grid written in the compact format.
+
+    :param text: One compact line, the trailing newline is optional.
+    :return: Puzzle grid.
+    :raises ValueError: If a cell is not valid.
+    """
+    grid = []
+
+    for line in text.strip().split(COMPACT_ROW_SEPARATOR):
+        row: Any = []
+        for token in line.split(COMPACT_CELL_SEPARATOR):
+            if token == BLACK_CELL:
+                row.append(BLACK_CELL)
+            elif token == COMPACT_EMPTY:
+                row.append(None)
+            elif "\\" in token:
+                down, right = token.split("\\")
+                row.append((int(down) if down else None, int(right) if right else None))
+            else:
+                row.append(int(token))
+        grid.append(row)
+
+    return grid
\ No newline at end of file
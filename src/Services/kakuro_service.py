@@ -1,8 +1,47 @@
-from itertools import combinations
-
+from src.Cache.lru_cache import LRUCache
 from src.Models.kakuro_model import KakuroModel
+from src.Services.combination_table import CombinationTable, get_combination_table
 from src.Types.types import CluesDict, ClueToCellsDict, CellToCluesDict, CellsList, CellDomainDict, ClueSums
-from typing import Dict, Set, Tuple
+from typing import Any, Dict, List, Optional, Set, TextIO, Tuple
+
+
+def build_possible_values(min_value: int, max_value: int, max_sum: int) -> Dict[int, Dict[int, Set[Tuple[int, ...]]]]:
+    """
+    Generate all unique digit combinations for clue lengths and their sums, decoded from the
+    combination table of the digit range. The services themselves only read the table's bitmasks.
+    :param min_value: Smallest allowed digit.
+    :param max_value: Largest allowed digit.
+    :param max_sum: Largest clue sum kept in the table.
+    :return: Nested dictionary: length -> sum -> set of valid digit tuples.
+    """
+    table = get_combination_table(min_value, max_value)
+
+    return {
+        length: {s: table.get_combinations(length, s) for s in range(min_value, max_sum + 1)}
+        for length in range(1, max_value - min_value + 2)
+    }
+
+
+class PossibleValuesTable:
+    """
+    Descriptor that generates KakuroService.POSSIBLE_VALUES on first access instead of at import
+    or service construction, and shares one table between all services with the same digit range.
+
+    A table assigned on an instance (as generate_possible_values does) takes precedence for that instance.
+    """
+    def __init__(self) -> None:
+        self.tables: Dict[Tuple[int, int, int], Dict[int, Dict[int, Set[Tuple[int, ...]]]]] = {}
+
+    def __get__(self, instance: Optional["KakuroService"], owner: type) -> Dict[int, Dict[int, Set[Tuple[int, ...]]]]:
+        source = owner if instance is None else instance
+        key = (source.MIN_VALUE, source.MAX_VALUE, source.MAX_SUM)
+        table = self.tables.get(key)
+
+        if table is None:
+            table = build_possible_values(*key)
+            self.tables[key] = table
+
+        return table
 
 
 class KakuroService:
@@ -19,40 +58,59 @@ class KakuroService:
             - target sum (int) →
             - set of valid tuples of digits (unique, non-repeating, within range)
               that satisfy the clue.
-        This acts as a domain cache for efficient constraint checking.
+        It is generated on first use and shared by all services with the same digit range.
+        Constraint checking reads the combinations property instead, a CombinationTable
+        holding the same combinations as bitmasks, computed lazily per (length, sum).
+    RUN_MEMO_CAPACITY (int): Maximum number of (length, sum, used digits) run states memoized
+        per service; least recently used states are evicted beyond that.
     """
     MIN_VALUE: int = 1
     MAX_VALUE: int = 9
     MAX_SUM: int = sum(range(MIN_VALUE, MAX_VALUE + 1))
-    POSSIBLE_VALUES: Dict[int, Dict[int, Set[Tuple[int, ...]]]] = {}
+    POSSIBLE_VALUES: Dict[int, Dict[int, Set[Tuple[int, ...]]]] = PossibleValuesTable()
+    RUN_MEMO_CAPACITY: int = 4096
 
-    def __init__(self, model: KakuroModel):
+    def __init__(self, model: KakuroModel, min_value: Optional[int] = None, max_value: Optional[int] = None):
         """
         Initialize the Kakuro puzzle service with a given model.
+        Structures already set on the model (for example by PuzzleDefinition.create_model) are
+        used as they are instead of being extracted from the grid again.
         :param  model: Kakuro model representing the puzzle.
+        :param min_value: Smallest allowed digit of a variant, MIN_VALUE by default.
+        :param max_value: Largest allowed digit of a variant, MAX_VALUE by default.
         """
+        if min_value is not None or max_value is not None:
+            self.MIN_VALUE = self.MIN_VALUE if min_value is None else min_value
+            self.MAX_VALUE = self.MAX_VALUE if max_value is None else max_value
+            self.MAX_SUM = sum(range(self.MIN_VALUE, self.MAX_VALUE + 1))
+
         self.model = model
-        self.clues, self.clue_cells = self.extract_clues()
-        self.empty_cells = self.extract_empty_cells()
-        self.filled_cells = self.extract_filled_cells()
-        self.cell_clues = self.extract_cell_clues()
+        self.run_memo = LRUCache(self.RUN_MEMO_CAPACITY)
 
-        if not self.POSSIBLE_VALUES:
-            self.generate_possible_values()
+        if model.clues is not None and model.clue_cells is not None:
+            self.clues, self.clue_cells = model.clues, model.clue_cells
+        else:
+            self.clues, self.clue_cells = self.extract_clues()
 
-        self.domains = self.extract_domains()
+        self.empty_cells = model.empty_cells if model.empty_cells is not None else self.extract_empty_cells()
+        self.filled_cells = model.filled_cells if model.filled_cells is not None else self.extract_filled_cells()
+        self.cell_clues = model.cell_clues if model.cell_clues is not None else self.extract_cell_clues()
+        self.domains = model.domains if model.domains is not None else self.extract_domains()
 
     def generate_possible_values(self) -> None:
         """
         Generate all unique digit combinations for clue lengths and their sums.
-        These are stored in POSSIBLE_VALUES for efficient lookup.
+        These are stored in POSSIBLE_VALUES of this instance for efficient lookup.
         """
-        self.POSSIBLE_VALUES = {length: {s: set() for s in range(self.MIN_VALUE, self.MAX_SUM + 1)} for length in range(1, self.MAX_VALUE - self.MIN_VALUE + 2)}
+        self.POSSIBLE_VALUES = build_possible_values(self.MIN_VALUE, self.MAX_VALUE, self.MAX_SUM)
+        self.run_memo.clear()
 
-        for length in range(1, self.MAX_VALUE - self.MIN_VALUE + 2):
-            for combination in combinations(range(self.MIN_VALUE, self.MAX_VALUE + 1), length):
-                if sum(combination) <= self.MAX_SUM:
-                    self.POSSIBLE_VALUES[length][sum(combination)].add(combination)
+    @property
+    def combinations(self) -> CombinationTable:
+        """
+        Combination table of the digit range of this service, shared with the other services using it.
+        """
+        return get_combination_table(self.MIN_VALUE, self.MAX_VALUE)
 
     def get_cells_in_clue(self, row: int, column: int, direction: str) -> CellsList:
         """
@@ -132,44 +190,252 @@ class KakuroService:
         return [(row, column) for row in range(self.model.height) for column in range(self.model.width) if isinstance(self.model.grid[row][column], int)]
 
 
+    def get_run_state(self, length: int, target_sum: int, used_mask: int) -> Tuple[bool, int]:
+        """
+        Compute, with memoization, what a run still allows given the digits already placed in it.
+
+        Results are kept in a bounded LRU keyed by (length, sum, used digits mask), so repeated
+        situations during a search are answered without scanning the combinations again.
+
+        :param length: Number of cells in the run.
+        :param target_sum: Clue sum of the run.
+        :param used_mask: Bitmask of digits already placed in the run (bit v set for digit v).
+        :return: (feasible, candidates_mask) tuple, feasible: some combination contains all used digits,
+                 candidates_mask: bitmask of digits still available to the run's empty cells.
+        """
+        key = (length, target_sum, used_mask)
+        state = self.run_memo.get(key)
+
+        if state is None:
+            feasible = False
+            candidates_mask = 0
+
+            for combination_mask in self.combinations.get_masks(length, target_sum):
+                if combination_mask & used_mask == used_mask:
+                    feasible = True
+                    candidates_mask |= combination_mask
+
+            state = (feasible, candidates_mask & ~used_mask)
+            self.run_memo.put(key, state)
+
+        return state
+
+    def get_run_digit_counts(self, length: int, target_sum: int, used_mask: int) -> Tuple[int, Tuple[int, ...]]:
+        """
+        Count, with memoization, the combinations a run still allows and how many of them contain each digit.
+
+        :param length: Number of cells in the run.
+        :param target_sum: Clue sum of the run.
+        :param used_mask: Bitmask of digits already placed in the run (bit v set for digit v).
+        :return: (combinations, digit_counts) tuple, combinations: number of combinations containing all used digits,
+                 digit_counts: for each value v up to MAX_VALUE, the number of those combinations containing v.
+        """
+        key = (length, target_sum, used_mask, "counts")
+        counts = self.run_memo.get(key)
+
+        if counts is None:
+            combinations_count = 0
+            digit_counts = [0] * (self.MAX_VALUE + 1)
+
+            for combination_mask in self.combinations.get_masks(length, target_sum):
+                if combination_mask & used_mask == used_mask:
+                    combinations_count += 1
+                    for value in range(self.MIN_VALUE, self.MAX_VALUE + 1):
+                        if combination_mask >> value & 1:
+                            digit_counts[value] += 1
+
+            counts = (combinations_count, tuple(digit_counts))
+            self.run_memo.put(key, counts)
+
+        return counts
+
+    def get_run_used_mask(self, clue: Tuple[int, int, str]) -> int:
+        """
+        Get the bitmask of digits currently placed in a run.
+        :param clue: Clue key (row, column, direction).
+        :return: Bitmask with bit v set for each placed digit v.
+        """
+        used_mask = 0
+        for row, column in self.clue_cells[clue]:
+            value = self.model.grid[row][column]
+            if value is not None:
+                used_mask |= 1 << value
+        return used_mask
+
+    def get_clue_sum(self, clue: Tuple[int, int, str]) -> Optional[int]:
+        """
+        Get the sum required by a run.
+        :param clue: Clue key (row, column, direction).
+        :return: The down sum for 'V' runs, the right sum for 'H' runs.
+        """
+        vertical_sum, horizontal_sum = self.clues[(clue[0], clue[1])]
+        return vertical_sum if clue[2] == 'V' else horizontal_sum
+
+    def is_run_feasible(self, clue: Tuple[int, int, str]) -> bool:
+        """
+        Check whether the digits placed in a run can still be completed to a valid combination.
+        :param clue: Clue key (row, column, direction).
+        :return: True if the run has no repeated digit and can still satisfy its sum, False otherwise.
+        """
+        cells = self.clue_cells[clue]
+        placed = [self.model.grid[row][column] for row, column in cells if self.model.grid[row][column] is not None]
+        used_mask = 0
+        for value in placed:
+            used_mask |= 1 << value
+
+        if bin(used_mask).count('1') != len(placed):
+            return False
+
+        target_sum = self.get_clue_sum(clue)
+        if not target_sum:
+            return True
+
+        return self.get_run_state(len(cells), target_sum, used_mask)[0]
+
+    def extract_cell_domain(self, row: int, column: int) -> List[int]:
+        """
+        Calculate the domain (possible values) of a single empty cell based on its clues.
+        :param row: Row index of the cell.
+        :param column: Column index of the cell.
+        :return: List of valid values.
+        """
+        domain_mask = ((1 << (self.MAX_VALUE + 1)) - 1) & ~((1 << self.MIN_VALUE) - 1)
+
+        for clue in self.cell_clues[(row, column)]:
+            if clue:
+                used_mask = self.get_run_used_mask(clue)
+                target_sum = self.get_clue_sum(clue)
+
+                if target_sum:
+                    domain_mask &= self.get_run_state(len(self.clue_cells[clue]), target_sum, used_mask)[1]
+                else:
+                    domain_mask &= ~used_mask
+
+        return [value for value in range(self.MIN_VALUE, self.MAX_VALUE + 1) if domain_mask >> value & 1]
+
     def extract_domains(self) -> CellDomainDict:
         """
         Calculate the domain (possible values) for each empty cell based on the clues.
         :return: Dictionary mapping each cell to a list of valid values.
         """
-        domains: CellDomainDict = {}
+        return {(row, column): self.extract_cell_domain(row, column) for (row, column) in self.empty_cells}
+
+    def get_run_conflict(self, clue: Tuple[int, int, str]) -> Optional[str]:
+        """
+        Explain why the digits placed in a run cannot be completed, if they cannot.
+        :param clue: Clue key (row, column, direction).
+        :return: "repeated digit", "no combination left", or None if the run is still feasible.
+        """
+        if self.is_run_feasible(clue):
+            return None
+
+        values = [self.model.grid[row][column] for row, column in self.clue_cells[clue] if self.model.grid[row][column] is not None]
+        return "repeated digit" if len(set(values)) != len(values) else "no combination left"
+
+    def update_runs(self, row: int, column: int) -> Tuple[CellDomainDict, List[Tuple[Any, str]]]:
+        """
+        Refresh the domains of the empty cells sharing a run with a cell that has just changed.
+        :param row: Row index of the changed cell.
+        :param column: Column index of the changed cell.
+        :return: (changed, conflicts) tuple, changed: new domains of the cells whose domain changed,
+                 conflicts: (clue, reason) for infeasible runs and (cell, "no value left") for empty domains.
+        """
+        changed: CellDomainDict = {}
+        conflicts: List[Tuple[Any, str]] = []
+        affected: Set[Tuple[int, int]] = set()
+
+        for clue in self.cell_clues[(row, column)]:
+            if clue:
+                reason = self.get_run_conflict(clue)
+                if reason is not None:
+                    conflicts.append((clue, reason))
+                affected.update(cell for cell in self.clue_cells[clue] if self.model.grid[cell[0]][cell[1]] is None)
+
+        for cell in sorted(affected):
+            domain = self.extract_cell_domain(*cell)
+            if domain != self.domains.get(cell):
+                self.domains[cell] = domain
+                changed[cell] = domain
+            if not domain:
+                conflicts.append((cell, "no value left"))
+
+        return changed, conflicts
+
+    def assign(self, cell: Tuple[int, int], value: int) -> Tuple[CellDomainDict, List[Tuple[Any, str]]]:
+        """
+        Place a value in a white cell and update only the two runs it belongs to.
+        :param cell: Cell position.
+        :param value: Value between MIN_VALUE and MAX_VALUE.
+        :return: (changed, conflicts) tuple as returned by update_runs.
+        :raises ValueError: If the cell is not a white cell or the value is out of range.
+        """
+        if cell not in self.cell_clues:
+            raise ValueError(f"{cell} is not a white cell")
+        if not isinstance(value, int) or not self.MIN_VALUE <= value <= self.MAX_VALUE:
+            raise ValueError(f"Value must be between {self.MIN_VALUE} and {self.MAX_VALUE}")
 
-        for (row, column) in self.empty_cells:
-            possible_values = set(range(self.MIN_VALUE, self.MAX_VALUE + 1))
-            vertical_clue, horizontal_clue = self.cell_clues[(row, column)]
-            if vertical_clue:
-                vertical_sum = self.model.grid[vertical_clue[0]][vertical_clue[1]][0]
-                vertical_cells = self.clue_cells[(vertical_clue[0], vertical_clue[1], 'V')]
-                vertical_used_numbers = {self.model.grid[row][column] for row, column in vertical_cells if self.model.grid[row][column] is not None}
-                length = len(vertical_cells)
+        row, column = cell
+        if self.model.grid[row][column] is None:
+            self.empty_cells.remove(cell)
+            self.filled_cells.append(cell)
+            self.domains.pop(cell, None)
 
-                if vertical_sum:
-                    valid_combinations = {combination for combination in self.POSSIBLE_VALUES[length][vertical_sum] if vertical_used_numbers.issubset(combination)}
-                    possible_values &= {value for combination in valid_combinations for value in combination}
+        self.model.grid[row][column] = value
 
-                possible_values -= vertical_used_numbers
+        return self.update_runs(row, column)
 
-            if horizontal_clue:
-                horizontal_sum = self.model.grid[horizontal_clue[0]][horizontal_clue[1]][1]
-                horizontal_cells = self.clue_cells[(horizontal_clue[0], horizontal_clue[1], 'H')]
-                horizontal_used_numbers = {self.model.grid[row][column] for row, column in horizontal_cells if self.model.grid[row][column] is not None}
-                length = len(horizontal_cells)
+    def unassign(self, cell: Tuple[int, int]) -> Tuple[CellDomainDict, List[Tuple[Any, str]]]:
+        """
+        Clear a white cell and update only the two runs it belongs to.
+        :param cell: Cell position.
+        :return: (changed, conflicts) tuple as returned by update_runs, changed includes the cleared cell.
+        :raises ValueError: If the cell is not a white cell.
+        """
+        if cell not in self.cell_clues:
+            raise ValueError(f"{cell} is not a white cell")
 
-                if horizontal_sum:
-                    valid_combinations = {combination for combination in self.POSSIBLE_VALUES[length][horizontal_sum] if horizontal_used_numbers.issubset(combination)}
-                    possible_values &= {value for combination in valid_combinations for value in combination}
+        row, column = cell
+        if self.model.grid[row][column] is not None:
+            self.model.grid[row][column] = None
+            self.filled_cells.remove(cell)
+            self.empty_cells.append(cell)
 
-                possible_values -= horizontal_used_numbers
+        return self.update_runs(row, column)
 
-            domains[(row, column)] = list(possible_values)
+    def hint(self) -> Optional[Tuple[Tuple[int, int], int]]:
+        """
+        Find a cell whose value is forced by the current domains, without searching.
 
-        return domains
+        A cell with a single value left is returned first; otherwise a digit that every remaining
+        combination of a run needs and that only one empty cell of the run can still take.
+
+        :return: (cell, value) tuple, or None if no cell is forced or the grid has a conflict.
+        """
+        empty_cells = sorted(self.empty_cells)
 
+        if any(not self.domains[cell] for cell in empty_cells):
+            return None
+
+        for cell in empty_cells:
+            if len(self.domains[cell]) == 1:
+                return cell, self.domains[cell][0]
+
+        for clue, cells in self.clue_cells.items():
+            target_sum = self.get_clue_sum(clue)
+            empty = [cell for cell in cells if self.model.grid[cell[0]][cell[1]] is None]
+            if not target_sum or not empty:
+                continue
+
+            used_mask = self.get_run_used_mask(clue)
+            combinations_count, digit_counts = self.get_run_digit_counts(len(cells), target_sum, used_mask)
+
+            for value in range(self.MIN_VALUE, self.MAX_VALUE + 1):
+                if combinations_count and digit_counts[value] == combinations_count and not used_mask >> value & 1:
+                    candidates = [cell for cell in empty if value in self.domains[cell]]
+                    if len(candidates) == 1:
+                        return candidates[0], value
+
+        return None
 
     def is_solved(self) -> bool:
         """
@@ -209,20 +475,11 @@ class KakuroService:
         :return: A string in the format "down\\right", "\\right", "down\\", or a space
                  if both values are None.
         """
-        down, right = clue
-        down_str = str(down) if down is not None else ''
-        right_str = str(right) if right is not None else ''
+        from src.Services.grid_renderer import format_clue
 
-        if down and right:
-            return f"{down_str}\\{right_str}"
-        elif down:
-            return f"{down_str}\\"
-        elif right:
-            return f"\\{right_str}"
-        else:
-            return " "
+        return format_clue(clue)
 
-    def print_grid(self) -> None:
+    def print_grid(self, stream: Optional[TextIO] = None) -> None:
         """
         Prints the Kakuro puzzle in a human-readable format.
 
@@ -232,19 +489,12 @@ class KakuroService:
           - an integer: a filled white cell,
           - None: an empty white cell.
 
+        Rendering is done by GridRenderer, which also offers compact formats and bulk output; it is
+        imported here so that solving does not pay for it.
+
+        :param stream: Text stream, defaults to sys.stdout.
         :return: None
         """
-        for row in self.model.grid:
-            row_str = ""
-
-            for cell in row:
-                if cell == 'X':
-                    row_str += " ███ "
-                elif isinstance(cell, tuple):
-                    clue_text = self.format_clue(cell)
-                    row_str += f"{clue_text:^5}"
-                else:
-                    val = str(cell) if cell is not None else '.'
-                    row_str += f"  {val}  "
+        from src.Services.grid_renderer import FORMAT_PRETTY, GridRenderer
 
-            print(row_str)
\ No newline at end of file
+        GridRenderer(FORMAT_PRETTY).write(self.model.grid, stream)
\ No newline at end of file
@@ -0,0 +1,101 @@
+from types import MappingProxyType
+from typing import Any, Mapping, Optional, Tuple
+
+from src.Models.kakuro_model import KakuroModel
+from src.Services.kakuro_service import KakuroService
+from src.Types.types import CanonicalGrid, CellPosition, ClueSums, PuzzleGrid
+
+ClueKey = Tuple[int, int, str]
+
+
+class PuzzleDefinition:
+    """
+    Immutable structure of a Kakuro puzzle, parsed once and shared by any number of solves.
+
+    Clues, runs and the initial domains are computed a single time and stored in read-only
+    containers, so one definition can be used from several threads and engines at the same
+    time. Each solve gets its own cheap state through create_model() or create_service():
+    a fresh grid and fresh empty_cells/domains, while clues, clue_cells and cell_clues are
+    shared rather than copied.
+
+    :param grid: Puzzle grid, it is not modified.
+    :param min_value: Smallest allowed digit of a variant, KakuroService.MIN_VALUE by default.
+    :param max_value: Largest allowed digit of a variant, KakuroService.MAX_VALUE by default.
+    """
+    __slots__ = (
+        "grid", "min_value", "max_value", "height", "width", "clues", "clue_cells", "cell_clues", "empty_cells",
+        "filled_cells", "domains"
+    )
+
+    grid: CanonicalGrid
+    min_value: int
+    max_value: int
+    height: int
+    width: int
+    clues: Mapping[CellPosition, ClueSums]
+    clue_cells: Mapping[ClueKey, Tuple[CellPosition, ...]]
+    cell_clues: Mapping[CellPosition, Tuple[Optional[ClueKey], Optional[ClueKey]]]
+    empty_cells: Tuple[CellPosition, ...]
+    filled_cells: Tuple[CellPosition, ...]
+    domains: Mapping[CellPosition, Tuple[int, ...]]
+
+    def __init__(self, grid: PuzzleGrid, min_value: Optional[int] = None, max_value: Optional[int] = None) -> None:
+        kakuro_service = KakuroService(KakuroModel([list(row) for row in grid]), min_value, max_value)
+
+        object.__setattr__(self, "grid", tuple(tuple(row) for row in kakuro_service.model.grid))
+        object.__setattr__(self, "min_value", kakuro_service.MIN_VALUE)
+        object.__setattr__(self, "max_value", kakuro_service.MAX_VALUE)
+        object.__setattr__(self, "height", kakuro_service.model.height)
+        object.__setattr__(self, "width", kakuro_service.model.width)
+        object.__setattr__(self, "clues", MappingProxyType(kakuro_service.clues))
+        object.__setattr__(self, "clue_cells", MappingProxyType(
+            {clue: tuple(cells) for clue, cells in kakuro_service.clue_cells.items()}
+        ))
+        object.__setattr__(self, "cell_clues", MappingProxyType(kakuro_service.cell_clues))
+        object.__setattr__(self, "empty_cells", tuple(kakuro_service.empty_cells))
+        object.__setattr__(self, "filled_cells", tuple(kakuro_service.filled_cells))
+        object.__setattr__(self, "domains", MappingProxyType(
+            {cell: tuple(domain) for cell, domain in kakuro_service.domains.items()}
+        ))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("PuzzleDefinition is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError("PuzzleDefinition is immutable")
+
+    def new_grid(self) -> PuzzleGrid:
+        """
+        Get a mutable copy of the puzzle grid.
+
+        Cells are immutable values, so copying the rows is enough and no deepcopy is needed.
+
+        :return: 2D list in the initial state of the puzzle.
+        """
+        return [list(row) for row in self.grid]
+
+    def create_model(self) -> KakuroModel:
+        """
+        Create the per-solve model of this puzzle.
+
+        The model has its precomputed slots filled in, so KakuroService takes the structure
+        from it instead of scanning the grid again.
+
+        :return: Model with a fresh grid, empty_cells and domains and the shared clue structure.
+        """
+        model = KakuroModel(self.new_grid())
+        model.clues = self.clues
+        model.clue_cells = self.clue_cells
+        model.cell_clues = self.cell_clues
+        model.empty_cells = list(self.empty_cells)
+        model.filled_cells = list(self.filled_cells)
+        model.domains = {cell: list(domain) for cell, domain in self.domains.items()}
+
+        return model
+
+    def create_service(self) -> KakuroService:
+        """
+        Create a KakuroService holding the state of one solve.
+        :return: Service that can be handed to any solver.
+        """
+        return KakuroService(self.create_model(), self.min_value, self.max_value)
\ No newline at end of file
@@ -0,0 +1,205 @@
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from src.Services.grid_arrays import CELL_WHITE, encode_grids
+from src.Services.kakuro_service import KakuroService
+from src.Types.types import CellPosition, PuzzleGrid
+
+ClueKey = Tuple[int, int, str]
+
+
+class IncrementalValidator:
+    """
+    Tracks the validity of a Kakuro grid incrementally while cells are assigned.
+
+    For every clued run it keeps a running sum, a count of each placed digit and the number of
+    filled and out-of-range cells, so an assignment only touches the (at most two) runs of a cell
+    and is_solved() is answered in O(1).
+
+    :param kakuro_service: Kakuro instance whose grid is validated and updated.
+    """
+    def __init__(self, kakuro_service: KakuroService) -> None:
+        self.kakuro_service = kakuro_service
+        self.runs: List[ClueKey] = []
+        self.cell_runs: Dict[CellPosition, List[int]] = {}
+
+        for (row, column), (vertical_sum, horizontal_sum) in kakuro_service.clues.items():
+            if vertical_sum:
+                self.add_run((row, column, 'V'))
+            if horizontal_sum:
+                self.add_run((row, column, 'H'))
+
+        self.targets: List[int] = [kakuro_service.get_clue_sum(run) for run in self.runs]
+        self.lengths: List[int] = [len(kakuro_service.clue_cells[run]) for run in self.runs]
+        self.sums: List[int] = [0] * len(self.runs)
+        self.filled: List[int] = [0] * len(self.runs)
+        self.out_of_range: List[int] = [0] * len(self.runs)
+        self.repeated: List[int] = [0] * len(self.runs)
+        self.digit_counts: List[Dict[int, int]] = [{} for _ in self.runs]
+        self.valid: List[bool] = [False] * len(self.runs)
+        self.invalid_runs: int = len(self.runs)
+
+        grid = kakuro_service.model.grid
+        for (row, column), run_indexes in self.cell_runs.items():
+            if grid[row][column] is not None:
+                for index in run_indexes:
+                    self.add_value(index, grid[row][column])
+
+        for index in range(len(self.runs)):
+            self.refresh(index)
+
+    def add_run(self, clue: ClueKey) -> None:
+        """
+        Registers a clued run and the cells it covers.
+        :param clue: Clue key (row, column, direction).
+        """
+        index = len(self.runs)
+        self.runs.append(clue)
+        for cell in self.kakuro_service.clue_cells[clue]:
+            self.cell_runs.setdefault(cell, []).append(index)
+
+    def add_value(self, index: int, value: int) -> None:
+        """
+        Adds a placed digit to the running totals of a run.
+        """
+        counts = self.digit_counts[index]
+        if counts.get(value, 0):
+            self.repeated[index] += 1
+        counts[value] = counts.get(value, 0) + 1
+
+        self.sums[index] += value
+        self.filled[index] += 1
+        if not self.kakuro_service.MIN_VALUE <= value <= self.kakuro_service.MAX_VALUE:
+            self.out_of_range[index] += 1
+
+    def remove_value(self, index: int, value: int) -> None:
+        """
+        Removes a placed digit from the running totals of a run.
+        """
+        counts = self.digit_counts[index]
+        counts[value] -= 1
+        if counts[value]:
+            self.repeated[index] -= 1
+
+        self.sums[index] -= value
+        self.filled[index] -= 1
+        if not self.kakuro_service.MIN_VALUE <= value <= self.kakuro_service.MAX_VALUE:
+            self.out_of_range[index] -= 1
+
+    def refresh(self, index: int) -> None:
+        """
+        Recomputes whether a run is satisfied and keeps the invalid run counter up to date.
+        """
+        valid = (self.filled[index] == self.lengths[index] and not self.out_of_range[index]
+                 and not self.repeated[index] and self.sums[index] == self.targets[index])
+
+        if valid != self.valid[index]:
+            self.invalid_runs += -1 if valid else 1
+            self.valid[index] = valid
+
+    def assign(self, cell: CellPosition, value: int) -> None:
+        """
+        Writes a value into the grid and updates the runs of the cell.
+        :param cell: Cell position.
+        :param value: Digit to place.
+        """
+        self.unassign(cell)
+        self.kakuro_service.model.grid[cell[0]][cell[1]] = value
+
+        for index in self.cell_runs.get(cell, ()):
+            self.add_value(index, value)
+            self.refresh(index)
+
+    def unassign(self, cell: CellPosition) -> None:
+        """
+        Clears a cell in the grid and updates the runs of the cell.
+        :param cell: Cell position.
+        """
+        value = self.kakuro_service.model.grid[cell[0]][cell[1]]
+        if value is None:
+            return
+
+        self.kakuro_service.model.grid[cell[0]][cell[1]] = None
+
+        for index in self.cell_runs.get(cell, ()):
+            self.remove_value(index, value)
+            self.refresh(index)
+
+    def is_solved(self) -> bool:
+        """
+        Check if the tracked grid satisfies all Kakuro rules.
+        :return: True if valid, False otherwise.
+        """
+        return self.invalid_runs == 0
+
+    def first_violation(self) -> Optional[Tuple[ClueKey, str]]:
+        """
+        Explain why the grid is not solved.
+        :return: (clue, reason) tuple for the first unsatisfied run, or None if the grid is solved.
+        """
+        if not self.invalid_runs:
+            return None
+
+        for index, clue in enumerate(self.runs):
+            if self.valid[index]:
+                continue
+
+            if self.out_of_range[index]:
+                return clue, "value outside allowed range"
+            if self.filled[index] != self.lengths[index]:
+                return clue, f"{self.lengths[index] - self.filled[index]} empty cell(s)"
+            if self.repeated[index]:
+                return clue, "repeated digit"
+            return clue, f"sum {self.sums[index]} does not match clue {self.targets[index]}"
+
+        return None
+
+
+def validate_solutions(
+    grids: Sequence[PuzzleGrid],
+    min_value: int = KakuroService.MIN_VALUE,
+    max_value: int = KakuroService.MAX_VALUE
+) -> List[bool]:
+    """
+    Validates many solved grids at once with vectorised NumPy operations.
+
+    Applies the same rules as KakuroService.is_solved: every clued run must be fully filled with
+    distinct digits in range that add up to its clue. NumPy is imported lazily.
+
+    :param grids: Solved puzzle grids, possibly of different sizes.
+    :param min_value: Smallest allowed digit.
+    :param max_value: Largest allowed digit.
+    :return: One boolean per grid, True if it is a valid solution.
+    """
+    import numpy as np
+
+    if not grids:
+        return []
+
+    encoded = encode_grids(grids)
+    white = encoded.kind.ravel() == CELL_WHITE
+    values = encoded.value.ravel()[white]
+    span = max_value - min_value + 1
+    invalid_run = np.zeros(encoded.kind.size, dtype=bool)
+
+    for run_ids, sums in ((encoded.down_run, encoded.down_sum), (encoded.right_run, encoded.right_sum)):
+        targets = sums.ravel()
+        ids = run_ids.ravel()[white]
+        clued = ids >= 0
+        clued[clued] = targets[ids[clued]] > 0
+        ids, run_values = ids[clued], values[clued]
+
+        out_of_range = (run_values < min_value) | (run_values > max_value)
+        invalid_run[ids[out_of_range]] = True
+
+        keys = ids[~out_of_range] * span + (run_values[~out_of_range] - min_value)
+        unique_keys, counts = np.unique(keys, return_counts=True)
+        invalid_run[unique_keys[counts > 1] // span] = True
+
+        run_sums = np.bincount(ids, weights=run_values, minlength=encoded.kind.size)
+        present = np.unique(ids)
+        invalid_run[present[run_sums[present] != targets[present]]] = True
+
+    invalid_grid = np.zeros(encoded.count, dtype=bool)
+    invalid_grid[np.nonzero(invalid_run)[0] // (encoded.height * encoded.width)] = True
+
+    return (~invalid_grid).tolist()
\ No newline at end of file
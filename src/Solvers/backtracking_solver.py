@@ -1,11 +1,160 @@
+from __future__ import annotations
+
+import time
+from typing import Dict, List, Optional, Set, TYPE_CHECKING
+
 from src.Services.kakuro_service import KakuroService
+from src.Solvers.ordering import (
+    VALUE_ORDERINGS, VARIABLE_ORDERINGS, ValueOrdering, VariableOrdering, get_value_ordering, get_variable_ordering,
+    order_descending, select_mrv
+)
+from src.Solvers.solve_result import ServiceSnapshot, SolveResult, get_status, get_white_cells, read_values
+from src.Types.types import CellPosition
+
+if TYPE_CHECKING:
+    from src.Services.solution_validator import IncrementalValidator
+    from src.Solvers.cancellation import CancellationToken
+    from src.Solvers.checkpoint import SolveCheckpoint, Subtree
+    from src.Solvers.nogood_store import NogoodStore
 
 
 class BacktrackingSolver:
     """
     A solver class that applies a backtracking algorithm to solve a Kakuro puzzle.
+
+    By default a failed value is undone chronologically. With backjumping enabled the search
+    records, for every failure, which earlier assignments caused it: when a cell runs out of
+    values the solver jumps straight back to the latest responsible decision, and the
+    responsible assignments are learned as a nogood (kept in a bounded NogoodStore) so the
+    same combination is pruned immediately if it comes up again.
+
+    When a time limit stops the search, the unexplored subtrees are collected as a frontier and
+    stored, with the cells forced by propagation, in a SolveCheckpoint; solving again with
+    resume=checkpoint searches only that frontier.
+
+    The validator, nogood store and checkpoint modules are imported when a solve first needs
+    them, so plain solves do not pay for their imports.
+
+    :param backjumping: Use conflict-directed backjumping with nogood learning.
+    :param nogood_capacity: Maximum number of learned nogoods kept.
+    :param max_nogood_size: Longest nogood kept.
+    :param validate: Keep an IncrementalValidator updated on every assignment and undo, and only
+                     accept a completed grid that it reports as solved.
+    :param variable_ordering: Default cell selection strategy, a key of ordering.VARIABLE_ORDERINGS.
+    :param value_ordering: Default value ordering strategy, a key of ordering.VALUE_ORDERINGS.
+    :raises ValueError: If an ordering name is unknown.
     """
 
+    deadline: Optional[float] = None
+    cancellation: Optional[CancellationToken] = None
+    timed_out: bool = False
+    cancelled: bool = False
+    count_limit: Optional[int] = None
+    solution_count: int = 0
+    nodes: int = 0
+    backjumps: int = 0
+    nogood_prunes: int = 0
+    backjumping: bool = False
+    nogood_capacity: int = 1024
+    max_nogood_size: int = 8
+    nogoods: Optional[NogoodStore] = None
+    assignment: Optional[Dict[CellPosition, int]] = None
+    frontier: Optional[List[Subtree]] = None
+    checkpoint: Optional[SolveCheckpoint] = None
+    result: Optional[SolveResult] = None
+    validate: bool = False
+    validator: Optional[IncrementalValidator] = None
+    variable_ordering: str = "mrv"
+    value_ordering: str = "descending"
+    select_cell: VariableOrdering = staticmethod(select_mrv)
+    order_values: ValueOrdering = staticmethod(order_descending)
+
+    def __init__(
+        self,
+        backjumping: bool = False,
+        nogood_capacity: int = 1024,
+        max_nogood_size: int = 8,
+        validate: bool = False,
+        variable_ordering: str = "mrv",
+        value_ordering: str = "descending"
+    ) -> None:
+        if variable_ordering not in VARIABLE_ORDERINGS:
+            raise ValueError(f"Unknown variable ordering: {variable_ordering}")
+        if value_ordering not in VALUE_ORDERINGS:
+            raise ValueError(f"Unknown value ordering: {value_ordering}")
+
+        self.backjumping = backjumping
+        self.nogood_capacity = nogood_capacity
+        self.max_nogood_size = max_nogood_size
+        self.validate = validate
+        self.variable_ordering = variable_ordering
+        self.value_ordering = value_ordering
+
+    def set_orderings(self, variable_ordering: Optional[str], value_ordering: Optional[str]) -> None:
+        """
+        Selects the ordering strategies of the next search, falling back to the solver defaults.
+
+        :param variable_ordering: Cell selection strategy name, or None for the default
+        :param value_ordering: Value ordering strategy name, or None for the default
+        :raises KeyError: If a strategy name is unknown
+        """
+        self.select_cell = get_variable_ordering(variable_ordering or self.variable_ordering)
+        self.order_values = get_value_ordering(value_ordering or self.value_ordering)
+
+    def create_validator(self, kakuro_service: KakuroService) -> Optional[IncrementalValidator]:
+        """
+        :param kakuro_service: Kakuro instance about to be searched
+        :return: A validator of its grid when validation is enabled, None otherwise
+        """
+        if not self.validate:
+            return None
+
+        from src.Services.solution_validator import IncrementalValidator
+
+        return IncrementalValidator(kakuro_service)
+
+    def create_nogood_store(self) -> NogoodStore:
+        """
+        :return: An empty nogood store sized by the solver options
+        """
+        from src.Solvers.nogood_store import NogoodStore
+
+        return NogoodStore(self.nogood_capacity, self.max_nogood_size)
+
+    def place_value(self, kakuro_service: KakuroService, row: int, column: int, value: int) -> None:
+        """
+        Writes a value into the grid, through the validator when validation is enabled.
+
+        :param kakuro_service: Kakuro instance with current puzzle state
+        :param row: Row index of the cell
+        :param column: Column index of the cell
+        :param value: Value to place
+        """
+        if self.validator is not None:
+            self.validator.assign((row, column), value)
+        else:
+            kakuro_service.model.grid[row][column] = value
+
+    def clear_value(self, kakuro_service: KakuroService, row: int, column: int) -> None:
+        """
+        Clears a cell of the grid, through the validator when validation is enabled.
+
+        :param kakuro_service: Kakuro instance with current puzzle state
+        :param row: Row index of the cell
+        :param column: Column index of the cell
+        """
+        if self.validator is not None:
+            self.validator.unassign((row, column))
+        else:
+            kakuro_service.model.grid[row][column] = None
+
+    def is_complete(self) -> bool:
+        """
+        Check a grid without empty cells, which is only in doubt when validation is enabled.
+        :return: True unless the validator reports a broken run
+        """
+        return self.validator is None or self.validator.is_solved()
+
     def backtracking(self, kakuro_service: KakuroService) -> bool:
         """
         Recursively attempts to fill the Kakuro grid using backtracking.
@@ -13,33 +162,376 @@ class BacktrackingSolver:
         :param kakuro_service: Kakuro instance with current puzzle state
         :return: True if a valid solution is found, False otherwise
         """
+        self.nodes += 1
+
         if not kakuro_service.empty_cells:
-            return True
+            return self.is_complete()
+
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            self.timed_out = True
+            self.frontier.append(list(self.assignment.items()))
+            return False
 
-        row, column = min(kakuro_service.empty_cells, key=lambda cell: len(kakuro_service.domains[cell]))
+        if self.cancellation is not None and self.cancellation.is_cancelled():
+            self.cancelled = True
+            return False
+
+        row, column = self.select_cell(kakuro_service)
         kakuro_service.empty_cells.remove((row, column))
 
-        for value in sorted(kakuro_service.domains[(row, column)], reverse=True):
-            kakuro_service.model.grid[row][column] = value
+        values = self.order_values(kakuro_service, (row, column))
+
+        for index, value in enumerate(values):
+            self.place_value(kakuro_service, row, column, value)
+            self.assignment[(row, column)] = value
             kakuro_service.domains = kakuro_service.extract_domains()
 
             if self.backtracking(kakuro_service):
                 return True
 
-            kakuro_service.model.grid[row][column] = None
+            del self.assignment[(row, column)]
+            self.clear_value(kakuro_service, row, column)
+
+            if self.timed_out:
+                self.add_frontier((row, column), values[index + 1:])
+
+            if self.timed_out or self.cancelled:
+                break
 
         kakuro_service.empty_cells.append((row, column))
 
         return False
 
-    def solve(self, kakuro_service: KakuroService) -> bool:
+    def add_frontier(self, cell: CellPosition, values: List[int]) -> None:
+        """
+        Records the untried values of a cell as unexplored subtrees, after the search timed out.
+
+        :param cell: The cell being assigned when the time limit was hit
+        :param values: Its values that were not tried yet, in search order
+        """
+        path = list(self.assignment.items())
+        self.frontier.extend(path + [(cell, value)] for value in values)
+
+    def get_conflict_cells(self, kakuro_service: KakuroService, cell: CellPosition) -> Set[CellPosition]:
+        """
+        Get the search assignments that restrict the domain of a cell: those in its two runs.
+
+        :param kakuro_service: Kakuro instance with current puzzle state
+        :param cell: The cell whose domain is explained
+        :return: Assigned cells sharing a run with the cell
+        """
+        return {
+            other
+            for clue in kakuro_service.cell_clues[cell] if clue
+            for other in kakuro_service.clue_cells[clue] if other in self.assignment
+        }
+
+    def backjump(self, kakuro_service: KakuroService) -> Optional[Set[CellPosition]]:
+        """
+        Recursively fills the Kakuro grid using conflict-directed backjumping.
+
+        :param kakuro_service: Kakuro instance with current puzzle state
+        :return: None if a valid solution is found, otherwise the conflict set: the assigned
+                 cells whose values explain the failure (empty if the puzzle has no solution)
+        """
+        self.nodes += 1
+
+        if not kakuro_service.empty_cells:
+            return None if self.is_complete() else set(self.assignment)
+
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            self.timed_out = True
+            self.frontier.append(list(self.assignment.items()))
+            return set(self.assignment)
+
+        if self.cancellation is not None and self.cancellation.is_cancelled():
+            self.cancelled = True
+            return set(self.assignment)
+
+        row, column = self.select_cell(kakuro_service)
+        kakuro_service.empty_cells.remove((row, column))
+
+        # Values missing from the domain were removed because of the cell's runs.
+        conflict = self.get_conflict_cells(kakuro_service, (row, column))
+        values = self.order_values(kakuro_service, (row, column))
+
+        for index, value in enumerate(values):
+            self.place_value(kakuro_service, row, column, value)
+            self.assignment[(row, column)] = value
+
+            nogood = self.nogoods.find(self.assignment, ((row, column), value))
+            if nogood is not None:
+                self.nogood_prunes += 1
+                child_conflict = {cell for cell, _ in nogood}
+            else:
+                kakuro_service.domains = kakuro_service.extract_domains()
+                child_conflict = self.backjump(kakuro_service)
+                if child_conflict is None:
+                    return None
+
+            del self.assignment[(row, column)]
+            self.clear_value(kakuro_service, row, column)
+
+            if (row, column) not in child_conflict:
+                # The failure does not depend on this cell, so its other values would fail too.
+                self.backjumps += 1
+                conflict = child_conflict
+                break
+
+            conflict |= child_conflict
+
+            if self.timed_out:
+                self.add_frontier((row, column), values[index + 1:])
+
+            if self.timed_out or self.cancelled:
+                break
+
+        kakuro_service.empty_cells.append((row, column))
+        conflict.discard((row, column))
+
+        # A cell without values is found again in one step, only learn from cells that branched.
+        if values and not (self.timed_out or self.cancelled):
+            self.nogoods.add(frozenset((cell, self.assignment[cell]) for cell in conflict))
+
+        return conflict
+
+    def solve(
+        self,
+        kakuro_service: KakuroService,
+        time_limit: Optional[float] = None,
+        cancellation: Optional[CancellationToken] = None,
+        variable_ordering: Optional[str] = None,
+        value_ordering: Optional[str] = None,
+        resume: Optional[SolveCheckpoint] = None,
+        write_back: bool = True
+    ) -> bool:
         """
         Solves the given Kakuro puzzle using backtracking.
 
+        The search places values in the grid of kakuro_service; the outcome is also stored in
+        result. With write_back False the grid, cell lists and domains are put back as they were
+        afterwards, so the caller reads the solution from result and the service can be solved again.
+
         :param kakuro_service: Kakuro instance to solve
+        :param time_limit: Optional limit in seconds; when it is hit the search stops,
+                           timed_out is set, checkpoint receives the state to resume from
+                           and False is returned
+        :param cancellation: Optional token checked at every node; once it is cancelled
+                             the search stops, cancelled is set and False is returned
+        :param variable_ordering: Optional cell selection strategy for this solve
+        :param value_ordering: Optional value ordering strategy for this solve
+        :param resume: Optional checkpoint of an earlier solve of the same puzzle; only its
+                       fixed cells, domains and frontier are searched
+        :param write_back: Leave the solution in the grid of kakuro_service
+        :return: True if the puzzle was solved successfully, False otherwise
+        """
+        cells = get_white_cells(kakuro_service)
+        snapshot = None if write_back else ServiceSnapshot(kakuro_service, cells)
+
+        try:
+            solved = self.solve_in_place(kakuro_service, time_limit, cancellation, variable_ordering, value_ordering, resume)
+            values = read_values(kakuro_service.model.grid, cells) if solved else b""
+            self.result = SolveResult(cells, values, get_status(solved, self.timed_out, self.cancelled), str(self), self.nodes)
+        finally:
+            if snapshot is not None:
+                snapshot.restore()
+
+        return solved
+
+    def solve_in_place(
+        self,
+        kakuro_service: KakuroService,
+        time_limit: Optional[float],
+        cancellation: Optional[CancellationToken],
+        variable_ordering: Optional[str],
+        value_ordering: Optional[str],
+        resume: Optional[SolveCheckpoint]
+    ) -> bool:
+        """
+        Runs the search of solve, leaving its outcome in the grid of kakuro_service.
+
+        :param kakuro_service: Kakuro instance to solve
+        :param time_limit: Optional limit in seconds
+        :param cancellation: Optional token checked at every node
+        :param variable_ordering: Optional cell selection strategy
+        :param value_ordering: Optional value ordering strategy
+        :param resume: Optional checkpoint to resume from
+        :return: True if the puzzle was solved successfully, False otherwise
+        """
+        self.deadline = time.monotonic() + time_limit if time_limit is not None else None
+        self.cancellation = cancellation
+        self.timed_out = False
+        self.cancelled = False
+        self.nodes = 0
+        self.backjumps = 0
+        self.nogood_prunes = 0
+        self.checkpoint = None
+        self.set_orderings(variable_ordering, value_ordering)
+
+        if self.backjumping:
+            self.nogoods = self.create_nogood_store()
+
+        if resume is not None:
+            return self.resume(kakuro_service, resume)
+
+        if self.search(kakuro_service):
+            return True
+
+        if self.timed_out:
+            from src.Solvers.checkpoint import create_checkpoint
+
+            hints = dict(self.frontier[0]) if self.frontier else {}
+            self.checkpoint = create_checkpoint(kakuro_service, self.get_engine_name(), self.frontier, hints)
+
+        return False
+
+    def search(self, kakuro_service: KakuroService) -> bool:
+        """
+        Runs one search from the current grid, collecting the frontier if it times out.
+
+        :param kakuro_service: Kakuro instance with current puzzle state
         :return: True if the puzzle was solved successfully, False otherwise
         """
-        return self.backtracking(kakuro_service)
+        self.assignment = {}
+        self.frontier = []
+        self.validator = self.create_validator(kakuro_service)
+
+        if not self.backjumping:
+            return self.backtracking(kakuro_service)
+
+        return self.backjump(kakuro_service) is None
+
+    def resume(self, kakuro_service: KakuroService, checkpoint: SolveCheckpoint) -> bool:
+        """
+        Searches the frontier of a checkpoint, subtree by subtree.
+
+        :param kakuro_service: Kakuro instance of the puzzle the checkpoint was taken from
+        :param checkpoint: Checkpoint to resume from
+        :return: True if the puzzle was solved successfully, False otherwise
+        """
+        from src.Solvers.checkpoint import SolveCheckpoint, apply_checkpoint, narrow_domains
+
+        if not apply_checkpoint(kakuro_service, checkpoint):
+            return False
+
+        subtrees = checkpoint.frontier if checkpoint.frontier is not None else [[]]
+
+        for index, subtree in enumerate(subtrees):
+            placed = []
+            consistent = True
+
+            for cell, value in subtree:
+                current = kakuro_service.model.grid[cell[0]][cell[1]]
+                if current is None:
+                    placed.append(cell)
+                    consistent = not kakuro_service.assign(cell, value)[1]
+                else:
+                    consistent = current == value
+                if not consistent:
+                    break
+
+            if consistent:
+                kakuro_service.domains = kakuro_service.extract_domains()
+                narrow_domains(kakuro_service, checkpoint)
+                if self.backjumping:
+                    # Learned nogoods leave out the subtree's cells, so they only hold inside it.
+                    self.nogoods = self.create_nogood_store()
+                if self.search(kakuro_service):
+                    return True
+
+            for cell in reversed(placed):
+                kakuro_service.unassign(cell)
+
+            if self.timed_out:
+                frontier = [subtree + rest for rest in self.frontier] + subtrees[index + 1:]
+                hints = dict(frontier[0]) if frontier else checkpoint.hints
+                self.checkpoint = SolveCheckpoint(
+                    checkpoint.grid, checkpoint.fixed, checkpoint.domains, frontier, hints, self.get_engine_name()
+                )
+
+            if self.timed_out or self.cancelled:
+                return False
+
+        return False
+
+    def get_engine_name(self) -> str:
+        """
+        :return: Registry name of the search run by this solver, recorded in checkpoints
+        """
+        return "backjumping" if self.backjumping else "backtracking"
+
+    def counting(self, kakuro_service: KakuroService) -> bool:
+        """
+        Recursively enumerates the solutions of the Kakuro grid, restoring the grid afterwards.
+
+        :param kakuro_service: Kakuro instance with current puzzle state
+        :return: True if the enumeration has to stop (limit reached, time-out or cancellation)
+        """
+        if not kakuro_service.empty_cells:
+            if not self.is_complete():
+                return False
+            self.solution_count += 1
+            return self.count_limit is not None and self.solution_count >= self.count_limit
+
+        if self.deadline is not None and time.monotonic() >= self.deadline:
+            self.timed_out = True
+            return True
+
+        if self.cancellation is not None and self.cancellation.is_cancelled():
+            self.cancelled = True
+            return True
+
+        row, column = self.select_cell(kakuro_service)
+        kakuro_service.empty_cells.remove((row, column))
+        stop = False
+
+        for value in self.order_values(kakuro_service, (row, column)):
+            self.place_value(kakuro_service, row, column, value)
+            kakuro_service.domains = kakuro_service.extract_domains()
+
+            stop = self.counting(kakuro_service)
+            self.clear_value(kakuro_service, row, column)
+
+            if stop:
+                break
+
+        kakuro_service.empty_cells.append((row, column))
+
+        return stop
+
+    def count_solutions(
+        self,
+        kakuro_service: KakuroService,
+        limit: Optional[int] = None,
+        time_limit: Optional[float] = None,
+        cancellation: Optional[CancellationToken] = None,
+        variable_ordering: Optional[str] = None,
+        value_ordering: Optional[str] = None
+    ) -> int:
+        """
+        Counts the solutions of the given Kakuro puzzle without modifying it.
+
+        :param kakuro_service: Kakuro instance to examine
+        :param limit: Optional number of solutions after which counting stops
+        :param time_limit: Optional limit in seconds, timed_out is set when it is hit
+        :param cancellation: Optional token stopping the enumeration, cancelled is set when it is used
+        :param variable_ordering: Optional cell selection strategy for this enumeration
+        :param value_ordering: Optional value ordering strategy for this enumeration
+        :return: Number of solutions found, a lower bound if the enumeration was stopped early
+        """
+        self.deadline = time.monotonic() + time_limit if time_limit is not None else None
+        self.cancellation = cancellation
+        self.timed_out = False
+        self.cancelled = False
+        self.count_limit = limit
+        self.solution_count = 0
+        self.validator = self.create_validator(kakuro_service)
+        self.set_orderings(variable_ordering, value_ordering)
+
+        self.counting(kakuro_service)
+        kakuro_service.domains = kakuro_service.extract_domains()
+
+        return self.solution_count
 
     def __str__(self) -> str:
         """
@@ -47,3 +539,11 @@ class BacktrackingSolver:
         :return: A simple string indicating the solver type
         """
         return "Backtracking Solver"
+
+
+class BackjumpingSolver(BacktrackingSolver):
+    """
+    BacktrackingSolver with conflict-directed backjumping and nogood learning enabled.
+    """
+    def __init__(self, nogood_capacity: int = 1024, max_nogood_size: int = 8) -> None:
+        super().__init__(True, nogood_capacity, max_nogood_size)
\ No newline at end of file
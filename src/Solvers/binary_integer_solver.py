@@ -1,9 +1,16 @@
-from typing import Dict
-from ortools.linear_solver import pywraplp
+from __future__ import annotations
+
+from typing import Dict, Optional, TYPE_CHECKING
 
 from src.Services.kakuro_service import KakuroService
+from src.Solvers.cancellation import CancellationToken
+from src.Solvers.checkpoint import SolveCheckpoint, apply_checkpoint, create_checkpoint
+from src.Solvers.solve_result import STATUS_SOLVED, ServiceSnapshot, SolveResult, get_status, get_white_cells
 from src.Types.types import CellPosition
 
+if TYPE_CHECKING:
+    from ortools.linear_solver import pywraplp
+
 
 class BinaryIntegerSolver:
     """
@@ -11,8 +18,14 @@ class BinaryIntegerSolver:
 
     Uses OR-Tools' SCIP solver to model the puzzle with binary variables
     representing possible digit assignments, enforcing constraints on sums and uniqueness.
+    OR-Tools is imported when a model is solved, not when this module is imported.
     """
 
+    timed_out: bool = False
+    cancelled: bool = False
+    checkpoint: Optional[SolveCheckpoint] = None
+    result: Optional[SolveResult] = None
+
     @staticmethod
     def create_variables(
         kakuro_service: KakuroService,
@@ -24,6 +37,8 @@ class BinaryIntegerSolver:
         For each cell, a set of binary variables corresponds to possible values,
         where exactly one must be set to 1 for empty cells; for filled cells,
         only the existing value has a variable set to 1.
+        Cells are taken in get_white_cells order and variables are created in the order of the
+        returned dictionaries, so the variable indices follow that order.
 
         :param kakuro_service: Kakuro puzzle instance
         :param solver: OR-Tools solver instance
@@ -31,16 +46,12 @@ class BinaryIntegerSolver:
         """
         variables: Dict[CellPosition, Dict[int, pywraplp.Variable]] = {}
 
-        for row, column in kakuro_service.empty_cells:
-            variables[(row, column)] = {
-                value: solver.BoolVar(f'cell_{row}_{column}_{value}')
-                for value in kakuro_service.domains[(row, column)]
-            }
-
-        for row, column in kakuro_service.filled_cells:
+        for row, column in get_white_cells(kakuro_service):
             value = kakuro_service.model.grid[row][column]
+            values = kakuro_service.domains.get((row, column), []) if value is None else [value]
             variables[(row, column)] = {
                 value: solver.BoolVar(f'cell_{row}_{column}_{value}')
+                for value in values
             }
 
         return variables
@@ -65,7 +76,7 @@ class BinaryIntegerSolver:
         cell_variables = [variables[(r, c)] for r, c in cells]
         length = len(cells)
 
-        for val in range(kakuro_service.MIN_VALUE, kakuro_service.MAX_VALUE):
+        for val in range(kakuro_service.MIN_VALUE, kakuro_service.MAX_VALUE + 1):
             solver.Add(
                 sum(cell_variables[i][val] for i in range(length) if val in cell_variables[i]) <= 1
             )
@@ -86,11 +97,12 @@ class BinaryIntegerSolver:
         """
         Adds constraints for the entire Kakuro puzzle to the solver.
 
-        Enforces that each empty cell must be assigned exactly one value,
-        and that clues' sum and uniqueness constraints hold.
+        Enforces that each empty cell must be assigned exactly one value, that each filled cell
+        keeps its value, and that clues' sum and uniqueness constraints hold.
         """
-        for (row, column) in kakuro_service.empty_cells:
-            solver.Add(sum(variables[(row, column)].values()) == 1)
+        # A filled cell has a single variable, left free it could drop the given value from its runs.
+        for cell_variables in variables.values():
+            solver.Add(sum(cell_variables.values()) == 1)
 
         for (row, column), (vertical_sum, horizontal_sum) in kakuro_service.clues.items():
             if vertical_sum:
@@ -102,32 +114,146 @@ class BinaryIntegerSolver:
                     kakuro_service, solver, variables, row, column, 'H', horizontal_sum
                 )
 
-    def solve(self, kakuro_service: KakuroService) -> bool:
+    def solve(
+        self,
+        kakuro_service: KakuroService,
+        time_limit: Optional[float] = None,
+        cancellation: Optional[CancellationToken] = None,
+        resume: Optional[SolveCheckpoint] = None,
+        write_back: bool = True
+    ) -> bool:
         """
         Solves the Kakuro puzzle by formulating it as a binary integer linear program.
 
         Creates variables and constraints, then uses SCIP solver to find an optimal
-        assignment satisfying all constraints. Updates the Kakuro grid with the solution.
+        assignment satisfying all constraints. Updates the Kakuro grid with the solution,
+        unless write_back is False, and stores it in result either way.
 
         :param kakuro_service: Kakuro puzzle instance to solve
+        :param time_limit: Optional limit in seconds; when it is hit timed_out is set, checkpoint
+                           receives the fixed cells, domains and hints, and False is returned
+        :param cancellation: Optional token; cancelling it interrupts SCIP, sets cancelled
+                             and makes the call return False
+        :param resume: Optional checkpoint of an earlier solve of the same puzzle: its fixed cells
+                       and domains restrict the model and its hints are passed to SCIP
+        :param write_back: Write the solution into the grid of kakuro_service; when False the
+                           service is left as it was and the solution is only in result
         :return: True if a solution was found, False otherwise
         """
+        cells = get_white_cells(kakuro_service)
+        snapshot = None if write_back or resume is None else ServiceSnapshot(kakuro_service, cells)
+
+        try:
+            values = self.solve_model(kakuro_service, time_limit, cancellation, resume)
+        finally:
+            if snapshot is not None:
+                snapshot.restore()
+
+        if values is None:
+            self.result = SolveResult(cells, b"", get_status(False, self.timed_out, self.cancelled), str(self))
+            return False
+
+        self.result = SolveResult(cells, values, STATUS_SOLVED, str(self))
+        if write_back:
+            self.result.apply(kakuro_service.model.grid)
+
+        return True
+
+    def solve_model(
+        self,
+        kakuro_service: KakuroService,
+        time_limit: Optional[float],
+        cancellation: Optional[CancellationToken],
+        resume: Optional[SolveCheckpoint]
+    ) -> Optional[bytes]:
+        """
+        Builds and solves the SCIP model of the puzzle, without writing into its grid.
+
+        The variable values are exported from the solver in one call instead of asking each
+        variable for its solution value.
+
+        :param kakuro_service: Kakuro puzzle instance to solve
+        :param time_limit: Optional limit in seconds
+        :param cancellation: Optional token interrupting SCIP
+        :param resume: Optional checkpoint to resume from, its fixed cells are placed in the grid
+        :return: One value per white cell, in get_white_cells order, or None if no solution was found
+        """
+        from ortools.linear_solver import linear_solver_pb2, pywraplp
+
         solver: pywraplp.Solver = pywraplp.Solver.CreateSolver('SCIP')
+        self.timed_out = False
+        self.cancelled = False
+        self.checkpoint = None
+
+        if resume is not None and not apply_checkpoint(kakuro_service, resume):
+            return None
+
+        if time_limit is not None:
+            solver.SetTimeLimit(int(time_limit * 1000))
+
         variables = self.create_variables(kakuro_service, solver)
         self.create_constraints(kakuro_service, solver, variables)
-        status = solver.Solve()
 
-        if status == pywraplp.Solver.OPTIMAL:
-            for (row, column), values in variables.items():
-                for value, variable in values.items():
-                    if variable.solution_value() == 1:
-                        kakuro_service.model.grid[row][column] = value
-            return True
+        if resume is not None:
+            hinted = [
+                variables[cell][value] for cell, value in resume.hints.items()
+                if cell in kakuro_service.domains and value in variables[cell]
+            ]
+            if hinted:
+                solver.SetHint(hinted, [1.0] * len(hinted))
+
+        if cancellation is not None:
+            if cancellation.is_cancelled():
+                self.cancelled = True
+                return None
+            stop_solver = solver.InterruptSolve
+            cancellation.add_callback(stop_solver)
+
+        try:
+            status = solver.Solve()
+        finally:
+            if cancellation is not None:
+                cancellation.remove_callback(stop_solver)
+
+        self.cancelled = status != pywraplp.Solver.OPTIMAL and cancellation is not None and cancellation.is_cancelled()
+        self.timed_out = time_limit is not None and status == pywraplp.Solver.NOT_SOLVED and not self.cancelled
+
+        if self.timed_out:
+            self.checkpoint = self.create_checkpoint(kakuro_service, resume)
+
+        if status != pywraplp.Solver.OPTIMAL:
+            return None
+
+        response = linear_solver_pb2.MPSolutionResponse()
+        solver.FillSolutionResponseProto(response)
+        flags = response.variable_value
+        solution = bytearray(len(variables))
+        index = 0
+
+        for position, values in enumerate(variables.values()):
+            for value in values:
+                if flags[index] > 0.5:
+                    solution[position] = value
+                index += 1
+
+        return bytes(solution)
+
+    @staticmethod
+    def create_checkpoint(kakuro_service: KakuroService, resume: Optional[SolveCheckpoint]) -> SolveCheckpoint:
+        """
+        Builds the checkpoint of a timed-out solve, keeping the frontier and hints it resumed from.
+
+        :param kakuro_service: Kakuro puzzle instance that was solved
+        :param resume: Checkpoint the solve resumed from, if any
+        :return: The checkpoint
+        """
+        if resume is not None:
+            return SolveCheckpoint(resume.grid, resume.fixed, resume.domains, resume.frontier, resume.hints, "binary")
 
-        return False
+        return create_checkpoint(kakuro_service, "binary")
 
     def __str__(self) -> str:
         """
         Returns a string representation identifying the solver.
         """
-        return "Binary Integer Solver"
+        return "Binary Integer Solver"
\ No newline at end of file
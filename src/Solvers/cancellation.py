@@ -0,0 +1,58 @@
+import threading
+from typing import Any, Callable, List, Optional
+
+
+class CancellationToken:
+    """
+    Asks a running solve to stop.
+
+    BacktrackingSolver polls is_cancelled() during the search; the OR-Tools solvers register a
+    callback (StopSearch / InterruptSolve) that is invoked as soon as cancel() is called.
+
+    :param event: Optional event to use as the flag, e.g. a multiprocessing.Event shared with
+                  worker processes. Defaults to a new threading.Event.
+    """
+    def __init__(self, event: Optional[Any] = None) -> None:
+        self.event = event if event is not None else threading.Event()
+        self.callbacks: List[Callable[[], Any]] = []
+        self.lock = threading.Lock()
+
+    def cancel(self) -> None:
+        """
+        Sets the flag and runs the registered callbacks.
+        """
+        with self.lock:
+            self.event.set()
+            callbacks = list(self.callbacks)
+
+        for callback in callbacks:
+            callback()
+
+    def is_cancelled(self) -> bool:
+        """
+        :return: True once cancel() has been called.
+        """
+        return self.event.is_set()
+
+    def add_callback(self, callback: Callable[[], Any]) -> None:
+        """
+        Registers a callback run on cancellation, or runs it right away if already cancelled.
+
+        :param callback: Callable without arguments.
+        """
+        with self.lock:
+            if not self.event.is_set():
+                self.callbacks.append(callback)
+                return
+
+        callback()
+
+    def remove_callback(self, callback: Callable[[], Any]) -> None:
+        """
+        Unregisters a callback, e.g. once the solve it would stop has finished.
+
+        :param callback: Callable previously passed to add_callback.
+        """
+        with self.lock:
+            if callback in self.callbacks:
+                self.callbacks.remove(callback)
\ No newline at end of file
@@ -0,0 +1,148 @@
+import json
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.Loaders.kakuro_loader import parse_puzzle
+from src.Models.kakuro_model import KakuroModel
+from src.Services.kakuro_service import KakuroService
+from src.Types.types import CellDomainDict, CellPosition, PuzzleGrid
+
+Subtree = List[Tuple[CellPosition, int]]
+
+
+class SolveCheckpoint:
+    """
+    Serialisable state of a solve that stopped at its time limit, from which a later solve resumes.
+
+    :param grid: Puzzle grid the solve started from.
+    :param fixed: Cells whose value is forced by propagation from that grid.
+    :param domains: Domains of the remaining empty cells once the fixed cells are placed.
+    :param frontier: Subtrees the backtracking search has not explored yet, as assignments on top of
+                     grid, in search order; None if the engine keeps no frontier.
+    :param hints: Values suggested to the OR-Tools engines, e.g. the deepest partial assignment reached.
+    :param engine: Name of the engine that produced the checkpoint.
+    """
+    def __init__(
+        self,
+        grid: PuzzleGrid,
+        fixed: Dict[CellPosition, int],
+        domains: CellDomainDict,
+        frontier: Optional[List[Subtree]] = None,
+        hints: Optional[Dict[CellPosition, int]] = None,
+        engine: Optional[str] = None
+    ) -> None:
+        self.grid: PuzzleGrid = grid
+        self.fixed: Dict[CellPosition, int] = fixed
+        self.domains: CellDomainDict = domains
+        self.frontier: Optional[List[Subtree]] = frontier
+        self.hints: Dict[CellPosition, int] = hints or {}
+        self.engine: Optional[str] = engine
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        :return: JSON-serialisable representation, cells are [row, column] lists.
+        """
+        return {
+            "engine": self.engine,
+            "grid": [[list(cell) if isinstance(cell, tuple) else cell for cell in row] for row in self.grid],
+            "fixed": [[row, column, value] for (row, column), value in self.fixed.items()],
+            "domains": [[row, column, list(domain)] for (row, column), domain in self.domains.items()],
+            "frontier": None if self.frontier is None else [
+                [[row, column, value] for (row, column), value in subtree] for subtree in self.frontier
+            ],
+            "hints": [[row, column, value] for (row, column), value in self.hints.items()],
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SolveCheckpoint":
+        """
+        :param data: Representation returned by to_dict.
+        :return: Rebuilt checkpoint.
+        """
+        return cls(
+            parse_puzzle([list(row) for row in data["grid"]]),
+            {(row, column): value for row, column, value in data["fixed"]},
+            {(row, column): list(domain) for row, column, domain in data["domains"]},
+            None if data.get("frontier") is None else [
+                [((row, column), value) for row, column, value in subtree] for subtree in data["frontier"]
+            ],
+            {(row, column): value for row, column, value in data.get("hints", [])},
+            data.get("engine")
+        )
+
+    def to_json(self) -> str:
+        """
+        :return: Compact JSON text of the checkpoint.
+        """
+        return json.dumps(self.to_dict(), separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, text: str) -> "SolveCheckpoint":
+        """
+        :param text: JSON text returned by to_json.
+        :return: Rebuilt checkpoint.
+        """
+        return cls.from_dict(json.loads(text))
+
+
+def create_checkpoint(
+    kakuro_service: KakuroService,
+    engine: str,
+    frontier: Optional[List[Subtree]] = None,
+    hints: Optional[Dict[CellPosition, int]] = None
+) -> SolveCheckpoint:
+    """
+    Builds a checkpoint of a puzzle, fixing every cell that KakuroService.hint() proves forced.
+
+    :param kakuro_service: Kakuro instance whose grid is the state the solve started from.
+    :param engine: Name of the engine that stopped.
+    :param frontier: Unexplored backtracking subtrees, relative to that grid.
+    :param hints: Values suggested to the OR-Tools engines.
+    :return: The checkpoint.
+    """
+    grid = [list(row) for row in kakuro_service.model.grid]
+    propagated = KakuroService(
+        KakuroModel([list(row) for row in grid]), kakuro_service.MIN_VALUE, kakuro_service.MAX_VALUE
+    )
+    fixed: Dict[CellPosition, int] = {}
+
+    hint = propagated.hint()
+    while hint is not None:
+        if propagated.assign(*hint)[1]:
+            propagated.unassign(hint[0])
+            break
+        fixed[hint[0]] = hint[1]
+        hint = propagated.hint()
+
+    return SolveCheckpoint(grid, fixed, dict(propagated.domains), frontier, hints, engine)
+
+
+def apply_checkpoint(kakuro_service: KakuroService, checkpoint: SolveCheckpoint) -> bool:
+    """
+    Places the fixed cells of a checkpoint and narrows the domains to the checkpoint's ones.
+
+    :param kakuro_service: Kakuro instance of the same puzzle, in the state the checkpoint started from.
+    :return: False if a fixed cell contradicts the grid, True otherwise.
+    """
+    for (row, column), value in checkpoint.fixed.items():
+        current = kakuro_service.model.grid[row][column]
+        if current is None:
+            kakuro_service.assign((row, column), value)
+        elif current != value:
+            return False
+
+    narrow_domains(kakuro_service, checkpoint)
+
+    return True
+
+
+def narrow_domains(kakuro_service: KakuroService, checkpoint: SolveCheckpoint) -> None:
+    """
+    Removes from the domains of kakuro_service the values the checkpoint's domains exclude.
+
+    :param kakuro_service: Kakuro instance of the same puzzle.
+    :param checkpoint: Checkpoint whose domains are applied.
+    """
+    for cell, domain in checkpoint.domains.items():
+        if cell in kakuro_service.domains:
+            allowed = set(domain)
+            kakuro_service.domains[cell] = [value for value in kakuro_service.domains[cell] if value in allowed]
\ No newline at end of file
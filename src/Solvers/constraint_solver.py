@@ -1,24 +1,32 @@
-from typing import Dict, Tuple, List, Optional, Any, Set
-from itertools import permutations
-from ortools.sat.python import cp_model
+from __future__ import annotations
+
+from typing import Dict, Tuple, List, Optional, Any, Set, TYPE_CHECKING
+from itertools import islice, permutations
 
 from src.Services.kakuro_service import KakuroService
+from src.Solvers.cancellation import CancellationToken
+from src.Solvers.checkpoint import SolveCheckpoint, apply_checkpoint, create_checkpoint
+from src.Solvers.solve_result import STATUS_SOLVED, ServiceSnapshot, SolveResult, get_status, get_white_cells
 from src.Types.types import CellPosition
 
+if TYPE_CHECKING:
+    from ortools.sat.python import cp_model
+
 
 class ConstraintSolver:
     """
     Solver for Kakuro puzzles using constraint programming with OR-Tools CP-SAT solver.
+    OR-Tools is imported when a model is built, not when this module is imported.
 
     Models cells as integer variables with domain restrictions,
     applies sum and uniqueness constraints from clues,
     and supports forbidding previously found solutions to explore alternatives.
     """
 
-    ALL_DIFFERENT = [(2, 3), (2, 4), (2, 16), (2, 17), (3, 6), (3, 7), (3, 23), (3, 24), (4, 10), (4, 11), (4, 29),
-                     (4, 30), (5, 15), (5, 16), (5, 34), (5, 35), (6, 21), (6, 22), (6, 38), (6, 39), (7, 28), (7, 29),
-                     (7, 41), (7, 42), (8, 36), (8, 37), (8, 38), (8, 39), (8, 40), (8, 41), (8, 42), (8, 43), (8, 44),
-                     (9, 45)]
+    timed_out: bool = False
+    cancelled: bool = False
+    checkpoint: Optional[SolveCheckpoint] = None
+    result: Optional[SolveResult] = None
 
     @staticmethod
     def compute_all_different(
@@ -49,13 +57,20 @@ class ConstraintSolver:
 
         For empty cells, variables have domains based on possible values.
         For filled cells, variables are fixed to their existing value.
+        Variables are created in get_white_cells order, so the index of a cell's variable is its
+        position in a SolveResult buffer.
         """
+        from ortools.sat.python import cp_model
+
         variables: Dict[CellPosition, cp_model.IntVar] = {}
 
-        for row, column in kakuro_service.empty_cells:
-            domain = kakuro_service.domains[(row, column)]
+        for row, column in get_white_cells(kakuro_service):
+            value = kakuro_service.model.grid[row][column]
+            domain = kakuro_service.domains.get((row, column))
 
-            if domain:
+            if value is not None:
+                variables[(row, column)] = model.NewIntVar(value, value, f'cell_{row}_{column}')
+            elif domain:
                 variables[(row, column)] = model.NewIntVarFromDomain(
                     cp_model.Domain.FromValues(domain),
                     f'cell_{row}_{column}'
@@ -63,10 +78,6 @@ class ConstraintSolver:
             else:
                 variables[(row, column)] = model.NewIntVar(kakuro_service.MIN_VALUE, kakuro_service.MAX_VALUE, f'cell_{row}_{column}')
 
-        for row, column in kakuro_service.filled_cells:
-            value: int = kakuro_service.model.grid[row][column]
-            variables[(row, column)] = model.NewIntVar(value, value, f'cell_{row}_{column}')
-
         return variables
 
     @staticmethod
@@ -81,6 +92,9 @@ class ConstraintSolver:
     ) -> None:
         """
         Adds constraints enforcing the clue's sum and uniqueness conditions.
+
+        A run whose sum has a single combination in the service's digit range only needs its
+        digits to differ, the cell domains already restrict them to that combination.
         """
         cells = kakuro_service.clue_cells[(row, column, direction)]
         variables_in_clue = [variables[(r, c)] for r, c in cells]
@@ -88,10 +102,10 @@ class ConstraintSolver:
         if variables_in_clue:
             length = len(variables_in_clue)
 
-            if (length, target_sum) in ConstraintSolver.ALL_DIFFERENT:
+            if kakuro_service.combinations.count(length, target_sum) == 1:
                 model.AddAllDifferent(variables_in_clue)
             else:
-                valid_combinations = kakuro_service.POSSIBLE_VALUES[length][target_sum]
+                valid_combinations = kakuro_service.combinations.get_combinations(length, target_sum)
                 valid_tuples = []
 
                 for comb in valid_combinations:
@@ -119,23 +133,126 @@ class ConstraintSolver:
             if horizontal_sum:
                 ConstraintSolver.create_clue_constraint(kakuro_service, model, variables, row, column, 'H', horizontal_sum)
 
-    def solve(self, kakuro_service: KakuroService) -> bool:
+    def solve(
+        self,
+        kakuro_service: KakuroService,
+        time_limit: Optional[float] = None,
+        cancellation: Optional[CancellationToken] = None,
+        resume: Optional[SolveCheckpoint] = None,
+        write_back: bool = True
+    ) -> bool:
         """
         Attempts to solve the Kakuro puzzle using constraint programming.
+
+        :param kakuro_service: Kakuro puzzle instance to solve
+        :param time_limit: Optional limit in seconds; when it is hit timed_out is set, checkpoint
+                           receives the fixed cells, domains and hints, and False is returned
+        :param cancellation: Optional token; cancelling it stops the CP-SAT search, sets cancelled
+                             and makes the call return False
+        :param resume: Optional checkpoint of an earlier solve of the same puzzle: its fixed cells
+                       and domains restrict the model and its hints guide the search
+        :param write_back: Write the solution into the grid of kakuro_service; when False the
+                           service is left as it was and the solution is only in result
+        :return: True if a solution was found, False otherwise
+        """
+        cells = get_white_cells(kakuro_service)
+        snapshot = None if write_back or resume is None else ServiceSnapshot(kakuro_service, cells)
+
+        try:
+            values = self.solve_model(kakuro_service, time_limit, cancellation, resume)
+        finally:
+            if snapshot is not None:
+                snapshot.restore()
+
+        if values is None:
+            self.result = SolveResult(cells, b"", get_status(False, self.timed_out, self.cancelled), str(self))
+            return False
+
+        self.result = SolveResult(cells, values, STATUS_SOLVED, str(self))
+        if write_back:
+            self.result.apply(kakuro_service.model.grid)
+
+        return True
+
+    def solve_model(
+        self,
+        kakuro_service: KakuroService,
+        time_limit: Optional[float],
+        cancellation: Optional[CancellationToken],
+        resume: Optional[SolveCheckpoint]
+    ) -> Optional[bytes]:
         """
+        Builds and solves the CP-SAT model of the puzzle, without writing into its grid.
+
+        The solution is read from the solver response in one piece instead of asking the solver
+        for the value of each variable.
+
+        :param kakuro_service: Kakuro puzzle instance to solve
+        :param time_limit: Optional limit in seconds
+        :param cancellation: Optional token stopping the search
+        :param resume: Optional checkpoint to resume from, its fixed cells are placed in the grid
+        :return: One value per white cell, in get_white_cells order, or None if no solution was found
+        """
+        from ortools.sat.python import cp_model
+
         model = cp_model.CpModel()
         solver = cp_model.CpSolver()
+        self.timed_out = False
+        self.cancelled = False
+        self.checkpoint = None
+
+        if resume is not None and not apply_checkpoint(kakuro_service, resume):
+            return None
+
+        if time_limit is not None:
+            solver.parameters.max_time_in_seconds = time_limit
 
         variables = self.create_variables(kakuro_service, model)
         self.create_constraints(kakuro_service, model, variables)
 
-        status = solver.Solve(model)
+        if resume is not None:
+            for cell, value in resume.hints.items():
+                if cell in kakuro_service.domains and value in kakuro_service.domains[cell]:
+                    model.AddHint(variables[cell], value)
+
+        if cancellation is not None:
+            if cancellation.is_cancelled():
+                self.cancelled = True
+                return None
+            stop_solver = solver.StopSearch
+            cancellation.add_callback(stop_solver)
+
+        try:
+            status = solver.Solve(model)
+        finally:
+            if cancellation is not None:
+                cancellation.remove_callback(stop_solver)
+
+        self.cancelled = status == cp_model.UNKNOWN and cancellation is not None and cancellation.is_cancelled()
+        self.timed_out = status == cp_model.UNKNOWN and not self.cancelled
+
+        if self.timed_out:
+            self.checkpoint = self.create_checkpoint(kakuro_service, resume)
+
         if status in (cp_model.FEASIBLE, cp_model.OPTIMAL):
-            for (row, column), var in variables.items():
-                kakuro_service.model.grid[row][column] = solver.Value(var)
-            return True
+            # The cell variables are the first ones of the model, see create_variables.
+            return bytes(islice(solver.ResponseProto().solution, len(variables)))
+
+        return None
+
+    @staticmethod
+    def create_checkpoint(kakuro_service: KakuroService, resume: Optional[SolveCheckpoint]) -> SolveCheckpoint:
+        """
+        Builds the checkpoint of a timed-out solve, keeping the frontier and hints it resumed from.
+
+        :param kakuro_service: Kakuro puzzle instance that was solved
+        :param resume: Checkpoint the solve resumed from, if any
+        :return: The checkpoint
+        """
+        if resume is not None:
+            return SolveCheckpoint(resume.grid, resume.fixed, resume.domains, resume.frontier, resume.hints, "constraint")
 
-        return False
+        return create_checkpoint(kakuro_service, "constraint")
 
     def __str__(self) -> str:
         """Returns the name of the solver."""
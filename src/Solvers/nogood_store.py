@@ -0,0 +1,76 @@
+from typing import Dict, FrozenSet, Hashable, Optional, Set, Tuple
+
+from src.Cache.lru_cache import LRUCache
+from src.Types.types import CellPosition
+
+Literal = Tuple[CellPosition, int]
+Nogood = FrozenSet[Literal]
+
+
+class NogoodStore:
+    """
+    Bounded store of learned nogoods: sets of (cell, value) assignments that cannot all
+    hold in any solution.
+
+    Nogoods live in an LRU cache, so once the store is full the one least recently added or
+    used is evicted. Every nogood is watched by each of its literals, so after an assignment
+    only the nogoods containing it have to be checked.
+
+    :param capacity: Maximum number of nogoods kept.
+    :param max_size: Longest nogood stored; longer ones rarely match again and are dropped.
+    """
+    def __init__(self, capacity: int = 1024, max_size: int = 8) -> None:
+        self.max_size: int = max_size
+        self.nogoods = LRUCache(capacity, on_evict=self.unwatch)
+        self.watches: Dict[Literal, Set[Nogood]] = {}
+
+    def add(self, nogood: Nogood) -> bool:
+        """
+        Learn a nogood.
+        :param nogood: Assignments that cannot be extended to a solution.
+        :return: True if it was stored, False if it is empty or longer than max_size.
+        """
+        if not nogood or len(nogood) > self.max_size:
+            return False
+
+        if nogood not in self.nogoods:
+            for literal in nogood:
+                self.watches.setdefault(literal, set()).add(nogood)
+        self.nogoods.put(nogood, True)
+
+        return True
+
+    def unwatch(self, nogood: Hashable, _: object) -> None:
+        """
+        Drop an evicted nogood from the watch lists.
+        """
+        for literal in nogood:
+            watching = self.watches.get(literal)
+            if watching is not None:
+                watching.discard(nogood)
+                if not watching:
+                    del self.watches[literal]
+
+    def find(self, assignment: Dict[CellPosition, int], literal: Literal) -> Optional[Nogood]:
+        """
+        Find a nogood violated by an assignment that has just been extended.
+        :param assignment: Current assignments, including the new literal.
+        :param literal: The (cell, value) assignment just made.
+        :return: A nogood whose assignments all hold, or None.
+        """
+        for nogood in self.watches.get(literal, ()):
+            if all(assignment.get(cell) == value for cell, value in nogood):
+                self.nogoods.get(nogood)
+                return nogood
+
+        return None
+
+    def clear(self) -> None:
+        """
+        Forget all nogoods.
+        """
+        self.nogoods.clear()
+        self.watches.clear()
+
+    def __len__(self) -> int:
+        return len(self.nogoods)
\ No newline at end of file
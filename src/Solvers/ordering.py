@@ -0,0 +1,175 @@
+from typing import Callable, Dict, List, Optional, Set, Tuple
+
+from src.Services.kakuro_service import KakuroService
+from src.Types.types import CellPosition
+
+VariableOrdering = Callable[[KakuroService], CellPosition]
+ValueOrdering = Callable[[KakuroService, CellPosition], List[int]]
+
+
+def select_mrv(kakuro_service: KakuroService) -> CellPosition:
+    """
+    Minimum remaining values: the empty cell with the smallest domain.
+    :param kakuro_service: Kakuro instance with current puzzle state.
+    :return: Cell to assign next.
+    """
+    return min(kakuro_service.empty_cells, key=lambda cell: len(kakuro_service.domains[cell]))
+
+
+def get_degree(kakuro_service: KakuroService, cell: CellPosition, empty: Set[CellPosition]) -> int:
+    """
+    Count the empty cells sharing a run with a cell.
+    :param kakuro_service: Kakuro instance with current puzzle state.
+    :param cell: Cell position.
+    :param empty: Set of the empty cells.
+    :return: Number of empty cells constrained by the cell.
+    """
+    return sum(
+        1
+        for clue in kakuro_service.cell_clues[cell] if clue
+        for other in kakuro_service.clue_cells[clue] if other != cell and other in empty
+    )
+
+
+def select_mrv_degree(kakuro_service: KakuroService) -> CellPosition:
+    """
+    Minimum remaining values, ties broken by the cell constraining the most empty cells.
+    :param kakuro_service: Kakuro instance with current puzzle state.
+    :return: Cell to assign next.
+    """
+    domains = kakuro_service.domains
+    smallest = min(len(domains[cell]) for cell in kakuro_service.empty_cells)
+    tied = [cell for cell in kakuro_service.empty_cells if len(domains[cell]) == smallest]
+
+    if len(tied) == 1 or smallest == 0:
+        return tied[0]
+
+    empty = set(kakuro_service.empty_cells)
+    return max(tied, key=lambda cell: get_degree(kakuro_service, cell, empty))
+
+
+def get_run_combinations(kakuro_service: KakuroService, clue: Tuple[int, int, str]) -> Optional[int]:
+    """
+    Count the combinations a run still allows.
+    :param kakuro_service: Kakuro instance with current puzzle state.
+    :param clue: Clue key (row, column, direction).
+    :return: Number of combinations, None for a run without a sum.
+    """
+    target_sum = kakuro_service.get_clue_sum(clue)
+    if not target_sum:
+        return None
+
+    length = len(kakuro_service.clue_cells[clue])
+    return kakuro_service.get_run_digit_counts(length, target_sum, kakuro_service.get_run_used_mask(clue))[0]
+
+
+def select_most_constrained_run(kakuro_service: KakuroService) -> CellPosition:
+    """
+    Most constrained run first: a cell of the run with the fewest surviving combinations,
+    the cell with the smallest domain within that run.
+    :param kakuro_service: Kakuro instance with current puzzle state.
+    :return: Cell to assign next.
+    """
+    domains = kakuro_service.domains
+    run_combinations: Dict[Tuple[int, int, str], float] = {}
+    best_cell = kakuro_service.empty_cells[0]
+    best_key = None
+
+    for cell in kakuro_service.empty_cells:
+        if not domains[cell]:
+            return cell
+
+        run_key = float("inf")
+        for clue in kakuro_service.cell_clues[cell]:
+            if clue:
+                if clue not in run_combinations:
+                    combinations = get_run_combinations(kakuro_service, clue)
+                    run_combinations[clue] = float("inf") if combinations is None else combinations
+                run_key = min(run_key, run_combinations[clue])
+
+        key = (run_key, len(domains[cell]))
+        if best_key is None or key < best_key:
+            best_cell, best_key = cell, key
+
+    return best_cell
+
+
+def order_descending(kakuro_service: KakuroService, cell: CellPosition) -> List[int]:
+    """
+    Largest values first.
+    :param kakuro_service: Kakuro instance with current puzzle state.
+    :param cell: Cell being assigned.
+    :return: Domain of the cell in the order to try.
+    """
+    return sorted(kakuro_service.domains[cell], reverse=True)
+
+
+def order_ascending(kakuro_service: KakuroService, cell: CellPosition) -> List[int]:
+    """
+    Smallest values first.
+    :param kakuro_service: Kakuro instance with current puzzle state.
+    :param cell: Cell being assigned.
+    :return: Domain of the cell in the order to try.
+    """
+    return sorted(kakuro_service.domains[cell])
+
+
+def order_by_combinations(kakuro_service: KakuroService, cell: CellPosition) -> List[int]:
+    """
+    Least constraining value first: values contained in the most surviving combinations of
+    the cell's runs (the product over both runs) are tried first, larger values on ties.
+    :param kakuro_service: Kakuro instance with current puzzle state.
+    :param cell: Cell being assigned.
+    :return: Domain of the cell in the order to try.
+    """
+    support = {value: 1 for value in kakuro_service.domains[cell]}
+
+    for clue in kakuro_service.cell_clues[cell]:
+        if clue:
+            target_sum = kakuro_service.get_clue_sum(clue)
+            if target_sum:
+                length = len(kakuro_service.clue_cells[clue])
+                digit_counts = kakuro_service.get_run_digit_counts(length, target_sum, kakuro_service.get_run_used_mask(clue))[1]
+                for value in support:
+                    support[value] *= digit_counts[value]
+
+    return sorted(support, key=lambda value: (support[value], value), reverse=True)
+
+
+VARIABLE_ORDERINGS: Dict[str, VariableOrdering] = {
+    "mrv": select_mrv,
+    "mrv-degree": select_mrv_degree,
+    "most-constrained-run": select_most_constrained_run,
+}
+
+VALUE_ORDERINGS: Dict[str, ValueOrdering] = {
+    "descending": order_descending,
+    "ascending": order_ascending,
+    "combinations": order_by_combinations,
+}
+
+
+def get_variable_ordering(name: str) -> VariableOrdering:
+    """
+    Returns a cell selection strategy.
+
+    :param name: Key of VARIABLE_ORDERINGS.
+    :return: Function choosing the next cell to assign.
+    :raises KeyError: If the name is unknown.
+    """
+    if name not in VARIABLE_ORDERINGS:
+        raise KeyError(f"Unknown variable ordering: {name}")
+    return VARIABLE_ORDERINGS[name]
+
+
+def get_value_ordering(name: str) -> ValueOrdering:
+    """
+    Returns a value ordering strategy.
+
+    :param name: Key of VALUE_ORDERINGS.
+    :return: Function listing the values of a cell in the order to try.
+    :raises KeyError: If the name is unknown.
+    """
+    if name not in VALUE_ORDERINGS:
+        raise KeyError(f"Unknown value ordering: {name}")
+    return VALUE_ORDERINGS[name]
\ No newline at end of file
@@ -0,0 +1,328 @@
+import multiprocessing
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.Models.kakuro_model import KakuroModel
+from src.Services.kakuro_service import KakuroService
+from src.Solvers.backtracking_solver import BacktrackingSolver
+from src.Solvers.cancellation import CancellationToken
+from src.Solvers.checkpoint import SolveCheckpoint, Subtree, apply_checkpoint, create_checkpoint
+from src.Solvers.solve_result import ServiceSnapshot, SolveResult, get_status, get_white_cells, read_values
+from src.Types.types import PuzzleGrid
+
+_worker_state: Dict[str, Any] = {}
+
+
+def init_worker(
+    grid: PuzzleGrid,
+    stop_event: Any,
+    solver_options: Dict[str, Any],
+    value_range: Tuple[int, int] = (KakuroService.MIN_VALUE, KakuroService.MAX_VALUE)
+) -> None:
+    """
+    Initializes a worker process with the puzzle and the shared stop event, so that tasks
+    only carry their partial assignment.
+
+    :param grid: Puzzle grid in its initial state.
+    :param stop_event: Event set as soon as the search has to stop everywhere.
+    :param solver_options: Keyword arguments of the BacktrackingSolver run on each subtree.
+    :param value_range: (min_value, max_value) digit range of the puzzle.
+    """
+    _worker_state["grid"] = grid
+    _worker_state["range"] = value_range
+    _worker_state["stop"] = CancellationToken(stop_event)
+    _worker_state["options"] = solver_options
+
+
+def solve_subtree(
+    subtree: Subtree,
+    time_limit: Optional[float]
+) -> Tuple[Optional[PuzzleGrid], int, bool, List[Subtree]]:
+    """
+    Searches one subtree of the frontier in a worker process.
+
+    :param subtree: (cell, value) assignments leading to the subtree.
+    :param time_limit: Optional limit in seconds for this subtree.
+    :return: (grid, nodes, timed_out, frontier) tuple, grid: solved grid or None, frontier: the
+             parts of the subtree left unexplored, the whole subtree if it was not searched.
+    """
+    stop = _worker_state["stop"]
+    if stop.is_cancelled():
+        return None, 0, False, [subtree]
+
+    grid = [list(row) for row in _worker_state["grid"]]
+    for (row, column), value in subtree:
+        grid[row][column] = value
+
+    # The service extracts the domains of the partial assignment, so the search starts propagated.
+    kakuro_service = KakuroService(KakuroModel(grid), *_worker_state["range"])
+    solver = BacktrackingSolver(**_worker_state["options"])
+    solved = solver.solve(kakuro_service, time_limit=time_limit, cancellation=stop)
+
+    if solver.timed_out:
+        frontier = [subtree + rest for rest in solver.frontier]
+    else:
+        frontier = [subtree] if solver.cancelled else []
+
+    return (grid if solved else None), solver.nodes, solver.timed_out, frontier
+
+
+class ParallelBacktrackingSolver:
+    """
+    Solves one hard puzzle with several processes by splitting its search tree.
+
+    The first split_depth decision levels are enumerated in the calling process, keeping only
+    partial assignments whose propagated domains are all non-empty. Each of these subtrees is
+    then searched by a BacktrackingSolver in a process pool: idle workers pull the next subtree,
+    so fast subtrees do not leave a worker waiting on a slow one. The first worker finding a
+    solution sets a shared event that stops every other worker.
+
+    On a time-out, the subtrees the workers did not finish form the frontier of checkpoint, which
+    both this solver and BacktrackingSolver can resume from.
+
+    :param workers: Number of worker processes, defaults to the CPU count.
+    :param split_depth: Number of decision levels enumerated before distributing the subtrees.
+    :param backjumping: Search the subtrees with conflict-directed backjumping.
+    :param variable_ordering: Cell selection strategy, a key of ordering.VARIABLE_ORDERINGS.
+    :param value_ordering: Value ordering strategy, a key of ordering.VALUE_ORDERINGS.
+    :raises ValueError: If an ordering name is unknown.
+    """
+
+    timed_out: bool = False
+    cancelled: bool = False
+    nodes: int = 0
+    subtrees: int = 0
+    checkpoint: Optional[SolveCheckpoint] = None
+    result: Optional[SolveResult] = None
+
+    def __init__(
+        self,
+        workers: Optional[int] = None,
+        split_depth: int = 4,
+        backjumping: bool = False,
+        variable_ordering: str = "mrv",
+        value_ordering: str = "descending"
+    ) -> None:
+        self.workers: int = workers or os.cpu_count() or 1
+        self.split_depth: int = split_depth
+        self.solver_options: Dict[str, Any] = {
+            "backjumping": backjumping,
+            "variable_ordering": variable_ordering,
+            "value_ordering": value_ordering,
+        }
+        self.splitter = BacktrackingSolver(variable_ordering=variable_ordering, value_ordering=value_ordering)
+
+    def expand(self, kakuro_service: KakuroService, depth: int, subtree: Subtree, frontier: List[Subtree]) -> bool:
+        """
+        Enumerates the partial assignments of the first decision levels.
+
+        :param kakuro_service: Kakuro instance with current puzzle state
+        :param depth: Number of levels still to enumerate
+        :param subtree: Assignments leading to the current node
+        :param frontier: Receives the assignments of the nodes at the split depth
+        :return: True if the grid was completed while enumerating
+        """
+        self.nodes += 1
+
+        if not kakuro_service.empty_cells:
+            return True
+
+        if depth == 0:
+            frontier.append(list(subtree))
+            return False
+
+        row, column = self.splitter.select_cell(kakuro_service)
+        kakuro_service.empty_cells.remove((row, column))
+
+        for value in self.splitter.order_values(kakuro_service, (row, column)):
+            kakuro_service.model.grid[row][column] = value
+            kakuro_service.domains = kakuro_service.extract_domains()
+
+            if all(kakuro_service.domains[cell] for cell in kakuro_service.empty_cells):
+                subtree.append(((row, column), value))
+                if self.expand(kakuro_service, depth - 1, subtree, frontier):
+                    return True
+                subtree.pop()
+
+            kakuro_service.model.grid[row][column] = None
+
+        kakuro_service.empty_cells.append((row, column))
+
+        return False
+
+    def solve(
+        self,
+        kakuro_service: KakuroService,
+        time_limit: Optional[float] = None,
+        cancellation: Optional[CancellationToken] = None,
+        resume: Optional[SolveCheckpoint] = None,
+        write_back: bool = True
+    ) -> bool:
+        """
+        Solves the given Kakuro puzzle with a pool of processes.
+
+        :param kakuro_service: Kakuro instance to solve, its grid receives the solution
+        :param time_limit: Optional limit in seconds; when it is hit every worker stops,
+                           timed_out is set, checkpoint receives the unfinished subtrees
+                           and False is returned
+        :param cancellation: Optional token; once it is cancelled every worker stops,
+                             cancelled is set and False is returned
+        :param resume: Optional checkpoint of an earlier solve of the same puzzle, its
+                       frontier is distributed instead of splitting the search tree
+        :param write_back: Leave the solution in the grid of kakuro_service; when False the
+                           service is put back as it was and the solution is only in result
+        :return: True if the puzzle was solved successfully, False otherwise
+        """
+        cells = get_white_cells(kakuro_service)
+        snapshot = None if write_back else ServiceSnapshot(kakuro_service, cells)
+
+        try:
+            solved = self.solve_in_place(kakuro_service, time_limit, cancellation, resume)
+            values = read_values(kakuro_service.model.grid, cells) if solved else b""
+            self.result = SolveResult(cells, values, get_status(solved, self.timed_out, self.cancelled), str(self), self.nodes)
+        finally:
+            if snapshot is not None:
+                snapshot.restore()
+
+        return solved
+
+    def solve_in_place(
+        self,
+        kakuro_service: KakuroService,
+        time_limit: Optional[float],
+        cancellation: Optional[CancellationToken],
+        resume: Optional[SolveCheckpoint]
+    ) -> bool:
+        """
+        Runs the parallel search of solve, leaving its outcome in the grid of kakuro_service.
+
+        :param kakuro_service: Kakuro instance to solve
+        :param time_limit: Optional limit in seconds
+        :param cancellation: Optional token stopping every worker
+        :param resume: Optional checkpoint to resume from
+        :return: True if the puzzle was solved successfully, False otherwise
+        """
+        deadline = time.monotonic() + time_limit if time_limit is not None else None
+        self.timed_out = False
+        self.cancelled = False
+        self.nodes = 0
+        self.subtrees = 0
+        self.checkpoint = None
+
+        if resume is not None and not apply_checkpoint(kakuro_service, resume):
+            return False
+
+        initial_grid = [list(row) for row in kakuro_service.model.grid]
+        frontier: List[Subtree] = []
+        self.splitter.set_orderings(None, None)
+
+        if resume is not None and resume.frontier is not None:
+            # Subtrees contradicting the fixed cells of the checkpoint have no solution.
+            frontier = [
+                subtree for subtree in resume.frontier
+                if all(initial_grid[row][column] in (None, value) for (row, column), value in subtree)
+            ]
+        elif self.expand(kakuro_service, self.split_depth, [], frontier):
+            return True
+
+        kakuro_service.domains = kakuro_service.extract_domains()
+        self.subtrees = len(frontier)
+        if not frontier:
+            return False
+
+        context = multiprocessing.get_context("spawn")
+        stop_event = context.Event()
+        stop = stop_event.set
+
+        if cancellation is not None:
+            cancellation.add_callback(stop)
+
+        solution = None
+        unfinished: List[Subtree] = []
+        futures: Dict[Any, Subtree] = {}
+        executor = ProcessPoolExecutor(
+            max_workers=min(self.workers, len(frontier)),
+            mp_context=context,
+            initializer=init_worker,
+            initargs=(
+                initial_grid, stop_event, self.solver_options, (kakuro_service.MIN_VALUE, kakuro_service.MAX_VALUE)
+            )
+        )
+
+        try:
+            remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+            futures = {executor.submit(solve_subtree, subtree, remaining): subtree for subtree in frontier}
+            pending = set(futures)
+
+            while pending and solution is None:
+                remaining = None if deadline is None else max(0.0, deadline - time.monotonic())
+                done, pending = wait(pending, timeout=remaining, return_when=FIRST_COMPLETED)
+
+                if not done:
+                    self.timed_out = True
+                    break
+
+                for future in done:
+                    grid, nodes, timed_out, rest = future.result()
+                    self.nodes += nodes
+                    self.timed_out = self.timed_out or timed_out
+                    unfinished.extend(rest)
+                    if grid is not None and solution is None:
+                        solution = grid
+
+                if cancellation is not None and cancellation.is_cancelled():
+                    self.cancelled = True
+                    break
+        finally:
+            stop()
+            executor.shutdown(wait=True, cancel_futures=True)
+            if cancellation is not None:
+                cancellation.remove_callback(stop)
+
+        if solution is None:
+            if self.timed_out:
+                for future, subtree in futures.items():
+                    if future in pending:
+                        if future.done() and not future.cancelled() and future.exception() is None:
+                            unfinished.extend(future.result()[3])
+                        else:
+                            unfinished.append(subtree)
+                self.checkpoint = self.create_checkpoint(kakuro_service, unfinished, resume)
+            return False
+
+        self.timed_out = False
+        for row, values in enumerate(solution):
+            kakuro_service.model.grid[row][:] = values
+        kakuro_service.empty_cells.clear()
+
+        return True
+
+    def create_checkpoint(
+        self,
+        kakuro_service: KakuroService,
+        frontier: List[Subtree],
+        resume: Optional[SolveCheckpoint]
+    ) -> SolveCheckpoint:
+        """
+        Builds the checkpoint of a timed-out solve from its unfinished subtrees.
+
+        :param kakuro_service: Kakuro instance that was solved
+        :param frontier: Unfinished subtrees
+        :param resume: Checkpoint the solve resumed from, if any
+        :return: The checkpoint
+        """
+        hints = dict(frontier[0]) if frontier else {}
+
+        if resume is not None:
+            return SolveCheckpoint(resume.grid, resume.fixed, resume.domains, frontier, hints, "parallel")
+
+        return create_checkpoint(kakuro_service, "parallel", frontier, hints)
+
+    def __str__(self) -> str:
+        """
+        String representation of the solver.
+        :return: A simple string indicating the solver type
+        """
+        return "Parallel Backtracking Solver"
\ No newline at end of file
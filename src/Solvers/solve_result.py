@@ -0,0 +1,175 @@
+from bisect import bisect_left
+from typing import Iterator, Optional, Sequence, Tuple
+
+from src.Services.kakuro_service import KakuroService
+from src.Types.types import CellDomainDict, CellPosition, CellsList, PuzzleGrid
+
+STATUS_SOLVED = "solved"
+STATUS_UNSOLVABLE = "unsolvable"
+STATUS_TIMEOUT = "timeout"
+STATUS_CANCELLED = "cancelled"
+
+EMPTY_VALUE = 255
+
+
+def get_white_cells(kakuro_service: KakuroService) -> CellsList:
+    """
+    Lists the white cells of a puzzle in row-major order, the order of a SolveResult buffer.
+
+    :param kakuro_service: Kakuro instance.
+    :return: Positions of the empty and filled cells.
+    """
+    return sorted(kakuro_service.cell_clues)
+
+
+def read_values(grid: PuzzleGrid, cells: Sequence[CellPosition]) -> bytes:
+    """
+    Reads the white cells of a grid into a SolveResult buffer.
+
+    :param grid: Grid holding the values.
+    :param cells: White cells, in row-major order.
+    :return: One byte per cell, EMPTY_VALUE for an empty cell.
+    """
+    return bytes(EMPTY_VALUE if grid[row][column] is None else grid[row][column] for row, column in cells)
+
+
+def get_status(solved: bool, timed_out: bool, cancelled: bool) -> str:
+    """
+    :param solved: Return value of a solve call.
+    :param timed_out: Whether the solver stopped at its time limit.
+    :param cancelled: Whether the solver was stopped through its cancellation token.
+    :return: Status of the solve, one of the STATUS_* constants.
+    """
+    if solved:
+        return STATUS_SOLVED
+    if cancelled:
+        return STATUS_CANCELLED
+    if timed_out:
+        return STATUS_TIMEOUT
+    return STATUS_UNSOLVABLE
+
+
+class SolveResult:
+    """
+    Outcome of one solve, kept apart from the grid that was solved.
+
+    The solution is a bytes buffer holding one value per white cell, in row-major order, with
+    EMPTY_VALUE for a cell left empty, so a result costs a few bytes per cell and can be stored,
+    sent between processes or written into any grid of the same puzzle with apply or to_grid.
+    A solve that found no solution has an empty buffer.
+
+    :param cells: White cells of the puzzle, in row-major order.
+    :param values: One byte per cell, or no bytes at all.
+    :param status: One of the STATUS_* constants.
+    :param solver: Name of the solver.
+    :param nodes: Search nodes visited, for the engines that count them.
+    """
+    def __init__(
+        self,
+        cells: Sequence[CellPosition],
+        values: bytes,
+        status: str,
+        solver: Optional[str] = None,
+        nodes: Optional[int] = None
+    ) -> None:
+        self.cells: Sequence[CellPosition] = cells
+        self.values: bytes = values
+        self.status: str = status
+        self.solver: Optional[str] = solver
+        self.nodes: Optional[int] = nodes
+
+    @classmethod
+    def from_grid(
+        cls,
+        cells: Sequence[CellPosition],
+        grid: PuzzleGrid,
+        status: str,
+        solver: Optional[str] = None,
+        nodes: Optional[int] = None
+    ) -> "SolveResult":
+        """
+        Reads the white cells of a grid into a result.
+        :param cells: White cells, in row-major order.
+        :param grid: Grid holding the values.
+        :param status: One of the STATUS_* constants.
+        :param solver: Name of the solver.
+        :param nodes: Search nodes visited.
+        :return: The result.
+        """
+        return cls(cells, read_values(grid, cells), status, solver, nodes)
+
+    @property
+    def solved(self) -> bool:
+        """
+        Whether the solve found a solution.
+        """
+        return self.status == STATUS_SOLVED
+
+    def get(self, cell: CellPosition) -> Optional[int]:
+        """
+        :param cell: White cell.
+        :return: Its value, or None if it is empty or there is no solution.
+        :raises KeyError: If the cell is not a white cell of the puzzle.
+        """
+        index = bisect_left(self.cells, cell)
+        if index == len(self.cells) or self.cells[index] != cell:
+            raise KeyError(cell)
+        if not self.values:
+            return None
+
+        value = self.values[index]
+        return None if value == EMPTY_VALUE else value
+
+    def items(self) -> Iterator[Tuple[CellPosition, Optional[int]]]:
+        """
+        :return: Iterator of (cell, value) pairs, value None for an empty cell; nothing if there is no solution.
+        """
+        for cell, value in zip(self.cells, self.values):
+            yield cell, None if value == EMPTY_VALUE else value
+
+    def apply(self, grid: PuzzleGrid) -> None:
+        """
+        Writes the values into a grid of the same puzzle, e.g. the grid of the service that was solved.
+        :param grid: Grid to fill in place.
+        """
+        for (row, column), value in zip(self.cells, self.values):
+            grid[row][column] = None if value == EMPTY_VALUE else value
+
+    def to_grid(self, puzzle: PuzzleGrid) -> PuzzleGrid:
+        """
+        Builds the solved grid of a puzzle, which is not modified.
+        Cells are immutable values, so only the rows are copied.
+        :param puzzle: Puzzle grid the result belongs to.
+        :return: New grid holding the values.
+        """
+        grid = [list(row) for row in puzzle]
+        self.apply(grid)
+        return grid
+
+    def __repr__(self) -> str:
+        return f"SolveResult(status={self.status!r}, solver={self.solver!r}, cells={len(self.cells)})"
+
+
+class ServiceSnapshot:
+    """
+    White cell values and cell lists of a KakuroService, taken before a solve that places values
+    in its grid, so the service can be handed back unchanged when the caller only wants the result.
+
+    :param kakuro_service: Kakuro instance.
+    :param cells: Its white cells, in row-major order.
+    """
+    def __init__(self, kakuro_service: KakuroService, cells: Sequence[CellPosition]) -> None:
+        self.kakuro_service = kakuro_service
+        self.initial = SolveResult.from_grid(cells, kakuro_service.model.grid, STATUS_UNSOLVABLE)
+        self.empty_cells: CellsList = list(kakuro_service.empty_cells)
+        self.filled_cells: CellsList = list(kakuro_service.filled_cells)
+        self.domains: CellDomainDict = dict(kakuro_service.domains)
+
+    def restore(self) -> None:
+        """
+        Puts the grid values, cell lists and domains back as they were when the snapshot was taken.
+        """
+        self.initial.apply(self.kakuro_service.model.grid)
+        self.kakuro_service.empty_cells[:] = self.empty_cells
+        self.kakuro_service.filled_cells[:] = self.filled_cells
+        self.kakuro_service.domains = self.domains
\ No newline at end of file
@@ -0,0 +1,66 @@
+import importlib
+from typing import Any, Dict, List, Tuple
+
+SOLVER_ENGINES: Dict[str, Tuple[str, str]] = {
+    "backtracking": ("src.Solvers.backtracking_solver", "BacktrackingSolver"),
+    "backjumping": ("src.Solvers.backtracking_solver", "BackjumpingSolver"),
+    "parallel": ("src.Solvers.parallel_solver", "ParallelBacktrackingSolver"),
+    "constraint": ("src.Solvers.constraint_solver", "ConstraintSolver"),
+    "binary": ("src.Solvers.binary_integer_solver", "BinaryIntegerSolver"),
+}
+
+ORTOOLS_ENGINES: Tuple[str, ...] = ("constraint", "binary")
+
+_loaded_engines: Dict[str, type] = {}
+
+
+def available_engines() -> List[str]:
+    """
+    Lists the names of all registered solver engines.
+
+    :return: Sorted engine names.
+    """
+    return sorted(SOLVER_ENGINES)
+
+
+def register_engine(name: str, module_name: str, class_name: str) -> None:
+    """
+    Registers a solver engine without importing it.
+
+    :param name: Engine name used to select the solver.
+    :param module_name: Dotted path of the module defining the solver class.
+    :param class_name: Name of the solver class in that module.
+    """
+    SOLVER_ENGINES[name] = (module_name, class_name)
+    _loaded_engines.pop(name, None)
+
+
+def get_solver_class(name: str) -> type:
+    """
+    Returns the solver class of an engine, importing its module on first use.
+
+    :param name: Engine name.
+    :return: Solver class.
+    :raises KeyError: If no engine with that name is registered.
+    """
+    solver_class = _loaded_engines.get(name)
+
+    if solver_class is None:
+        if name not in SOLVER_ENGINES:
+            raise KeyError(f"Unknown solver engine: {name}")
+
+        module_name, class_name = SOLVER_ENGINES[name]
+        solver_class = getattr(importlib.import_module(module_name), class_name)
+        _loaded_engines[name] = solver_class
+
+    return solver_class
+
+
+def create_solver(name: str) -> Any:
+    """
+    Instantiates the solver of an engine.
+
+    :param name: Engine name.
+    :return: Solver instance.
+    """
+    return get_solver_class(name)()
\ No newline at end of file
@@ -8,4 +8,5 @@ CluesDict = Dict[CellPosition, ClueSums]
 ClueToCellsDict = Dict[Tuple[int, int, str], List[CellPosition]]
 CellToCluesDict = Dict[CellPosition, Tuple[Optional[Tuple[int, int, str]], Optional[Tuple[int, int, str]]]]
 CellsList = List[CellPosition]
-CellDomainDict = Dict[CellPosition, List[int]]
\ No newline at end of file
+CellDomainDict = Dict[CellPosition, List[int]]
+CanonicalGrid = Tuple[Tuple[CellValue, ...], ...]
\ No newline at end of file
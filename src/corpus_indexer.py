@@ -0,0 +1,98 @@
+import argparse
+import json
+import sys
+from typing import List, Optional
+
+from src.Cache.corpus_index import CorpusIndex, iter_corpus_paths
+from src.Loaders.kakuro_loader import load_puzzle_from_path
+
+EXIT_OK = 0
+EXIT_ERROR = 4
+
+
+def build_index(index: CorpusIndex, inputs: List[str]) -> int:
+    """
+    Indexes a corpus in a single streaming pass, reporting unreadable puzzles on stderr.
+
+    :param index: Index receiving the puzzles.
+    :param inputs: Puzzle files or directories.
+    :return: Number of files that could not be loaded.
+    """
+    errors = 0
+
+    for path in iter_corpus_paths(inputs):
+        try:
+            index.add(path, load_puzzle_from_path(path))
+        except (OSError, ValueError, TypeError, IndexError) as error:
+            errors += 1
+            sys.stderr.write(f"{path}: {error}\n")
+
+    index.flush()
+    return errors
+
+
+def parse_arguments(argv: Optional[List[str]]) -> argparse.Namespace:
+    """
+    Parses the command-line arguments.
+    """
+    parser = argparse.ArgumentParser(
+        prog="corpus_indexer",
+        description="Index a corpus of Kakuro puzzles by canonical fingerprint and report duplicates."
+    )
+    parser.add_argument("inputs", nargs="*", help="puzzle files or directories of *.json puzzles to index")
+    parser.add_argument("--index", required=True, help="SQLite index file, created or extended")
+    parser.add_argument("--batch-size", type=int, default=10000, help="entries written per transaction")
+    parser.add_argument("--duplicates", action="store_true",
+                        help="print every duplicate cluster as a JSON line")
+    parser.add_argument("--unique", action="store_true",
+                        help="print one path per distinct puzzle")
+    parser.add_argument("--lookup", action="append", default=[],
+                        help="print the indexed path of the puzzle stored in this file, may be repeated")
+
+    arguments = parser.parse_args(argv)
+    if arguments.batch_size < 1:
+        parser.error("--batch-size must be at least 1")
+
+    return arguments
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Runs the corpus indexer: indexes the inputs, then prints the requested reports and a summary
+    on stderr.
+
+    :param argv: Command-line arguments, defaults to sys.argv[1:].
+    :return: 0 on success, 4 if some puzzle could not be loaded.
+    """
+    arguments = parse_arguments(argv)
+
+    with CorpusIndex(arguments.index, arguments.batch_size) as index:
+        errors = build_index(index, arguments.inputs)
+
+        if arguments.duplicates:
+            for fingerprint, paths in index.iter_duplicate_clusters():
+                sys.stdout.write(json.dumps({"fingerprint": fingerprint, "paths": paths}) + "\n")
+
+        if arguments.unique:
+            for path in index.iter_unique_paths():
+                sys.stdout.write(path + "\n")
+
+        for path in arguments.lookup:
+            try:
+                found = index.lookup(load_puzzle_from_path(path))
+            except (OSError, ValueError, TypeError, IndexError) as error:
+                errors += 1
+                sys.stderr.write(f"{path}: {error}\n")
+                continue
+            sys.stdout.write(json.dumps({"path": path, "indexed": found}) + "\n")
+
+        puzzles, unique = index.count()
+
+    sys.stderr.write(f"{puzzles} puzzles, {unique} distinct, {puzzles - unique} duplicates, {errors} errors\n")
+    sys.stdout.flush()
+
+    return EXIT_ERROR if errors else EXIT_OK
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -0,0 +1,194 @@
+import argparse
+import sys
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from src.Distributed.coordinator import Coordinator
+from src.Distributed.tcp_transport import TcpWorkQueue, WorkQueueServer
+from src.Distributed.work_queue import MemoryWorkQueue, SqliteWorkQueue, WorkerStats, WorkTask
+from src.Distributed.worker import Worker
+from src.Solvers.solver_registry import available_engines
+from src.kakuro_solver import (
+    EXIT_CODES, EXIT_SEVERITY, EXIT_SOLVED, STATUS_ERROR, STATUS_TIMEOUT, iter_tasks, write_record
+)
+
+EXIT_OK = 0
+EXIT_QUEUE_LOST = 5
+
+
+def parse_queue_address(queue: str) -> Tuple[str, Any]:
+    """
+    Parses a --queue argument.
+
+    :param queue: 'sqlite:PATH' for a queue in a shared SQLite file, 'tcp:HOST:PORT' for a coordinator's socket.
+    :return: ('sqlite', path) or ('tcp', (host, port)).
+    :raises ValueError: If the argument has neither form.
+    """
+    kind, _, location = queue.partition(":")
+
+    if kind == "sqlite" and location:
+        return kind, location
+    if kind == "tcp":
+        host, _, port = location.rpartition(":")
+        if host and port.isdigit():
+            return kind, (host, int(port))
+
+    raise ValueError(f"Invalid queue {queue!r}, expected sqlite:PATH or tcp:HOST:PORT")
+
+
+def write_worker_stats(stats: List[WorkerStats]) -> None:
+    """
+    Writes a per-worker throughput table to stderr.
+
+    :param stats: Stats of every worker.
+    """
+    sys.stderr.write(f"{'worker':<32} {'units':>6} {'puzzles':>8} {'busy s':>8} {'puzzles/s':>10}\n")
+    for worker in stats:
+        sys.stderr.write(f"{worker.name:<32} {worker.units:>6} {worker.puzzles:>8} {worker.busy:>8.2f} "
+                         f"{worker.throughput:>10.1f}\n")
+
+
+def run_coordinator(arguments: argparse.Namespace) -> int:
+    """
+    Shards the inputs into a queue, prints the result records as units finish and the per-worker
+    stats at the end. Puzzles whose unit has not finished when --timeout expires are reported as
+    timed out.
+
+    :param arguments: Parsed 'coordinator' arguments.
+    :return: Exit code of kakuro_solver for the same puzzles.
+    """
+    kind, location = parse_queue_address(arguments.queue)
+    server = None
+
+    if kind == "sqlite":
+        queue: Any = SqliteWorkQueue(location, arguments.max_attempts)
+    else:
+        queue = MemoryWorkQueue(arguments.max_attempts)
+        server = WorkQueueServer(queue, location)
+        server.start()
+        sys.stderr.write(f"Serving work queue on {server.server_address[0]}:{server.server_address[1]}\n")
+
+    exit_code = EXIT_SOLVED
+
+    def report(record: Dict[str, Any]) -> None:
+        nonlocal exit_code
+        write_record(record, arguments.output_format)
+        exit_code = max(exit_code, EXIT_CODES[record["status"]], key=EXIT_SEVERITY.index)
+
+    def iter_loaded() -> Iterator[WorkTask]:
+        for source, puzzle, error in iter_tasks(arguments.inputs):
+            if puzzle is None:
+                report({"source": source, "status": STATUS_ERROR, "error": error, "elapsed": 0.0, "grid": None})
+            else:
+                yield source, puzzle
+
+    try:
+        coordinator = Coordinator(queue, arguments.unit_size)
+        coordinator.submit(iter_loaded())
+        try:
+            for record in coordinator.iter_results(timeout=arguments.timeout):
+                report(record)
+        except TimeoutError as error:
+            sys.stderr.write(f"Coordinator gave up: {error}\n")
+            for sources in coordinator.sources.values():
+                for source in sources:
+                    report({"source": source, "status": STATUS_TIMEOUT, "error": "work unit did not finish in time",
+                            "elapsed": 0.0, "grid": None})
+        write_worker_stats(queue.get_worker_stats())
+    finally:
+        if server is not None:
+            server.stop()
+        queue.close()
+
+    return exit_code
+
+
+def run_worker(arguments: argparse.Namespace) -> int:
+    """
+    Processes units until the queue is drained, or the coordinator goes away.
+
+    :param arguments: Parsed 'worker' arguments.
+    :return: 0, or 5 if the coordinator's socket could not be reached.
+    """
+    kind, location = parse_queue_address(arguments.queue)
+    queue = SqliteWorkQueue(location) if kind == "sqlite" else TcpWorkQueue(location)
+    worker = Worker(queue, arguments.solver, arguments.name, arguments.time_limit, arguments.lease)
+
+    try:
+        worker.run(arguments.max_units, arguments.idle_timeout)
+    except OSError as error:
+        sys.stderr.write(f"{worker.name}: work queue lost: {error}\n")
+        return EXIT_QUEUE_LOST
+    finally:
+        queue.close()
+        sys.stderr.write(f"{worker.name}: {worker.units} units, {worker.puzzles} puzzles\n")
+
+    return EXIT_OK
+
+
+def parse_arguments(argv: Optional[List[str]]) -> argparse.Namespace:
+    """
+    Parses the command-line arguments.
+    """
+    parser = argparse.ArgumentParser(
+        prog="distributed_runner",
+        description="Solve a corpus of Kakuro puzzles with workers on several machines sharing a work queue."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    coordinator = commands.add_parser("coordinator", help="shard puzzles into the queue and gather the results")
+    coordinator.add_argument("inputs", nargs="*", default=["-"],
+                             help="puzzle files or directories of *.json puzzles, '-' reads puzzles from stdin (default)")
+    coordinator.add_argument("--queue", required=True,
+                             help="sqlite:PATH for a queue in a shared SQLite file, tcp:HOST:PORT to listen for workers")
+    coordinator.add_argument("--unit-size", type=int, default=100, help="puzzles per work unit")
+    coordinator.add_argument("--max-attempts", type=int, default=3, help="leases of a unit before it is failed")
+    coordinator.add_argument("--timeout", type=float, default=None,
+                             help="seconds after which the puzzles of unfinished units are reported as timed out")
+    coordinator.add_argument("--format", choices=["jsonl", "pretty"], default="jsonl", dest="output_format",
+                             help="output format, JSON lines (default) or a human-readable grid")
+
+    worker = commands.add_parser("worker", help="solve units pulled from the queue")
+    worker.add_argument("--queue", required=True,
+                        help="sqlite:PATH of the coordinator's SQLite file, or tcp:HOST:PORT of the coordinator")
+    worker.add_argument("--solver", choices=available_engines(), default="backtracking", help="solver engine to use")
+    worker.add_argument("--time-limit", type=float, default=None, help="time limit per puzzle in seconds")
+    worker.add_argument("--lease", type=float, default=60, help="lease of a unit in seconds, renewed while solving")
+    worker.add_argument("--name", default=None, help="worker name, defaults to host:pid")
+    worker.add_argument("--max-units", type=int, default=None, help="stop after this many units")
+    worker.add_argument("--idle-timeout", type=float, default=None, help="stop after this many seconds without work")
+
+    arguments = parser.parse_args(argv)
+    try:
+        parse_queue_address(arguments.queue)
+    except ValueError as error:
+        parser.error(str(error))
+
+    if arguments.command == "coordinator":
+        if arguments.unit_size < 1:
+            parser.error("--unit-size must be at least 1")
+        if arguments.max_attempts < 1:
+            parser.error("--max-attempts must be at least 1")
+        if arguments.timeout is not None and arguments.timeout <= 0:
+            parser.error("--timeout must be positive")
+    elif arguments.time_limit is not None and not 0 < arguments.time_limit < arguments.lease:
+        parser.error("--time-limit must be positive and shorter than --lease")
+
+    return arguments
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Runs the distributed runner.
+
+    :param argv: Command-line arguments, defaults to sys.argv[1:].
+    :return: Exit code.
+    """
+    arguments = parse_arguments(argv)
+
+    if arguments.command == "coordinator":
+        return run_coordinator(arguments)
+    return run_worker(arguments)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
\ No newline at end of file
@@ -1,2 +1,228 @@
+import argparse
+import json
+import os
+import sys
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
+
+from src.Cache.results_sink import SqliteResultsSink
+from src.Loaders.kakuro_loader import iter_puzzles_from_text, list_puzzle_paths, load_puzzle_from_path
+from src.Models.kakuro_model import KakuroModel
+from src.Services.grid_renderer import FORMAT_PRETTY, GridRenderer
+from src.Services.kakuro_service import KakuroService
+from src.Solvers.solver_registry import available_engines, create_solver
+from src.Types.types import PuzzleGrid
+
+STATUS_SOLVED = "solved"
+STATUS_UNSOLVABLE = "unsolvable"
+STATUS_TIMEOUT = "timeout"
+STATUS_ERROR = "error"
+
+EXIT_SOLVED = 0
+EXIT_UNSOLVABLE = 1
+EXIT_USAGE = 2
+EXIT_TIMEOUT = 3
+EXIT_ERROR = 4
+
+EXIT_CODES: Dict[str, int] = {
+    STATUS_SOLVED: EXIT_SOLVED,
+    STATUS_TIMEOUT: EXIT_TIMEOUT,
+    STATUS_UNSOLVABLE: EXIT_UNSOLVABLE,
+    STATUS_ERROR: EXIT_ERROR,
+}
+EXIT_SEVERITY: List[int] = [EXIT_SOLVED, EXIT_TIMEOUT, EXIT_UNSOLVABLE, EXIT_ERROR]
+
+PENDING_TASKS_PER_JOB = 4
+
+PRETTY_RENDERER = GridRenderer(FORMAT_PRETTY)
+
+Task = Tuple[str, Optional[PuzzleGrid], Optional[str]]
+
+
+def iter_tasks(inputs: List[str]) -> Iterator[Task]:
+    """
+    Expands the command-line inputs into puzzles to solve.
+
+    Files are loaded as single puzzles, directories contribute their *.json files
+    and '-' reads one or more JSON puzzles from stdin.
+
+    :param inputs: Paths to files or directories, or '-' for stdin.
+    :return: Iterator of (source, puzzle, error) tuples, puzzle is None if it could not be loaded.
+    """
+    for path in inputs:
+        if path == "-":
+            try:
+                for index, puzzle in enumerate(iter_puzzles_from_text(sys.stdin.read())):
+                    yield f"<stdin>:{index}", puzzle, None
+            except ValueError as error:
+                yield "<stdin>", None, str(error)
+            continue
+
+        paths = list_puzzle_paths(path) if os.path.isdir(path) else [path]
+        for file_path in paths:
+            try:
+                yield file_path, load_puzzle_from_path(file_path), None
+            except (OSError, ValueError) as error:
+                yield file_path, None, str(error)
+
+
+def describe_error(error: BaseException) -> str:
+    """
+    :param error: Unexpected exception raised while solving.
+    :return: Its type and message, for the error field of a record.
+    """
+    return f"{type(error).__name__}: {error}"
+
+
+def solve_task(source: str, puzzle: PuzzleGrid, solver_name: str, time_limit: Optional[float]) -> Dict[str, Any]:
+    """
+    Solves one puzzle and describes the outcome as a JSON-serializable record.
+
+    :param source: Where the puzzle came from.
+    :param puzzle: Puzzle grid, it is not modified.
+    :param solver_name: Solver engine name from the solver registry.
+    :param time_limit: Optional limit in seconds for the solve.
+    :return: Result record.
+    """
+    solver = create_solver(solver_name)
+    started = time.perf_counter()
+
+    try:
+        kakuro_service = KakuroService(KakuroModel(puzzle))
+        solved = solver.solve(kakuro_service, time_limit=time_limit, write_back=False)
+    except (KeyError, IndexError, TypeError, ValueError) as error:
+        return {"source": source, "solver": str(solver), "status": STATUS_ERROR, "error": str(error),
+                "elapsed": time.perf_counter() - started, "grid": None}
+    except Exception as error:
+        # E.g. RecursionError or MemoryError on a huge puzzle: report it instead of ending the whole run.
+        return {"source": source, "solver": str(solver), "status": STATUS_ERROR, "error": describe_error(error),
+                "elapsed": time.perf_counter() - started, "grid": None}
+
+    if solved:
+        status = STATUS_SOLVED
+    elif solver.timed_out:
+        status = STATUS_TIMEOUT
+    else:
+        status = STATUS_UNSOLVABLE
+
+    return {"source": source, "solver": str(solver), "status": status,
+            "elapsed": time.perf_counter() - started, "grid": solver.result.to_grid(puzzle) if solved else None}
+
+
+def write_record(record: Dict[str, Any], output_format: str) -> None:
+    """
+    Writes a result record to stdout and flushes it, so results stream out as they complete.
+
+    :param record: Result record from solve_task.
+    :param output_format: 'jsonl' for one JSON object per line, 'pretty' for a readable grid.
+    """
+    if output_format == "jsonl":
+        sys.stdout.write(json.dumps(record) + "\n")
+    else:
+        sys.stdout.write(f"{record['source']}: {record['status']} ({record['elapsed']:.3f}s)\n")
+        if record["grid"] is not None:
+            PRETTY_RENDERER.write(record["grid"], sys.stdout)
+        elif "error" in record:
+            sys.stdout.write(f"  {record['error']}\n")
+
+    sys.stdout.flush()
+
+
+def parse_arguments(argv: Optional[List[str]]) -> argparse.Namespace:
+    """
+    Parses the command-line arguments.
+    """
+    parser = argparse.ArgumentParser(prog="kakuro_solver", description="Solve Kakuro puzzles stored as JSON.")
+    parser.add_argument("inputs", nargs="*", default=["-"],
+                        help="puzzle files or directories of *.json puzzles, '-' reads puzzles from stdin (default)")
+    parser.add_argument("--solver", choices=available_engines(), default="backtracking", help="solver engine to use")
+    parser.add_argument("--jobs", type=int, default=1, help="number of puzzles solved in parallel processes")
+    parser.add_argument("--time-limit", type=float, default=None, help="time limit per puzzle in seconds")
+    parser.add_argument("--format", choices=["jsonl", "pretty"], default="jsonl", dest="output_format",
+                        help="output format, JSON lines (default) or a human-readable grid")
+    parser.add_argument("--results-db", default=None,
+                        help="also write every result to this SQLite database, in batched transactions")
+
+    arguments = parser.parse_args(argv)
+    if arguments.jobs < 1:
+        parser.error("--jobs must be at least 1")
+    if arguments.time_limit is not None and arguments.time_limit <= 0:
+        parser.error("--time-limit must be positive")
+
+    return arguments
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Runs the command-line interface.
+
+    Exit codes: 0 all puzzles solved, 1 some puzzle has no solution, 2 usage error,
+    3 some puzzle hit the time limit, 4 some puzzle could not be loaded or solved.
+    When several apply, the most severe one wins (4, then 1, then 3).
+
+    :param argv: Command-line arguments, defaults to sys.argv[1:].
+    :return: Exit code.
+    """
+    arguments = parse_arguments(argv)
+    exit_code = EXIT_SOLVED
+    sink = SqliteResultsSink(arguments.results_db) if arguments.results_db else None
+
+    def report(record: Dict[str, Any], puzzle: Optional[PuzzleGrid] = None) -> None:
+        nonlocal exit_code
+        write_record(record, arguments.output_format)
+        exit_code = max(exit_code, EXIT_CODES[record["status"]], key=EXIT_SEVERITY.index)
+
+        if sink is not None and puzzle is not None and record["status"] != STATUS_ERROR:
+            sink.add(puzzle, record["grid"], record["status"], record["solver"], record["elapsed"],
+                     source=record["source"])
+
+    tasks = iter_tasks(arguments.inputs)
+
+    try:
+        if arguments.jobs == 1:
+            for source, puzzle, error in tasks:
+                if puzzle is None:
+                    report({"source": source, "status": STATUS_ERROR, "error": error, "elapsed": 0.0, "grid": None})
+                else:
+                    report(solve_task(source, puzzle, arguments.solver, arguments.time_limit), puzzle)
+            return exit_code
+
+        with ProcessPoolExecutor(max_workers=arguments.jobs) as executor:
+            futures: Dict[Future, Tuple[str, PuzzleGrid]] = {}
+
+            def report_done(done: Set[Future]) -> None:
+                for future in done:
+                    source, puzzle = futures.pop(future)
+                    try:
+                        record = future.result()
+                    except Exception as error:
+                        # The worker process died or the task could not be sent to it.
+                        record = {"source": source, "solver": arguments.solver, "status": STATUS_ERROR,
+                                  "error": describe_error(error), "elapsed": 0.0, "grid": None}
+                    report(record, puzzle)
+
+            # Only a few tasks per process are in flight, so a huge corpus is never held in memory
+            # and results stream out while the remaining puzzles are still being loaded.
+            for source, puzzle, error in tasks:
+                if puzzle is None:
+                    report({"source": source, "status": STATUS_ERROR, "error": error, "elapsed": 0.0, "grid": None})
+                    continue
+
+                if len(futures) >= arguments.jobs * PENDING_TASKS_PER_JOB:
+                    report_done(wait(futures, return_when=FIRST_COMPLETED).done)
+
+                future = executor.submit(solve_task, source, puzzle, arguments.solver, arguments.time_limit)
+                futures[future] = (source, puzzle)
+
+            while futures:
+                report_done(wait(futures, return_when=FIRST_COMPLETED).done)
+    finally:
+        if sink is not None:
+            sink.close()
+
+    return exit_code
+
+
 if __name__ == "__main__":
-    print("Hello World!")
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
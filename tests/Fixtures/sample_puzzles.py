@@ -18,4 +18,11 @@ SAMPLE_PUZZLE_GRID_SMALL = [
     ["X", "X", [12, None]],
     ["X", [3, 4], 4],
     [[None, 11], None, None]
+]
+
+# Only solvable with digits 0-9, its solution is unique: rows 0 1 2 and 1 3 0.
+SAMPLE_PUZZLE_GRID_ZERO = [
+    ["X",       (1, None), (4, None), (2, None)],
+    [(None, 3), None,      None,      None],
+    [(None, 4), None,      None,      None]
 ]
\ No newline at end of file
@@ -4,7 +4,11 @@ import pytest
 from Fixtures.sample_puzzles import SAMPLE_PUZZLE_GRID, SAMPLE_PUZZLE_GRID_NO_SOLUTION
 from src.Models.kakuro_model import KakuroModel
 from src.Services.kakuro_service import KakuroService
-from src.Solvers.backtracking_solver import BacktrackingSolver
+from src.Solvers.backtracking_solver import BacktrackingSolver, BackjumpingSolver
+from src.Solvers.cancellation import CancellationToken
+from src.Solvers.checkpoint import SolveCheckpoint
+from src.Solvers import ordering
+from src.Solvers.nogood_store import NogoodStore
 
 def test_backtracking_solver():
     model = KakuroModel(copy.deepcopy(SAMPLE_PUZZLE_GRID))
@@ -30,4 +34,233 @@ def test_backtracking_solver_empty():
 
     solver = BacktrackingSolver()
 
-    assert solver.solve(service) == False
\ No newline at end of file
+    assert solver.solve(service) == False
+
+def test_backtracking_solver_time_limit():
+    model = KakuroModel(copy.deepcopy(SAMPLE_PUZZLE_GRID))
+    service = KakuroService(model)
+
+    solver = BacktrackingSolver()
+
+    assert solver.solve(service, time_limit=0) == False
+    assert solver.timed_out == True
+    assert service.model.grid == SAMPLE_PUZZLE_GRID
+
+    assert solver.solve(service, time_limit=60) == True
+    assert solver.timed_out == False
+
+def test_backtracking_solver_cancelled():
+    model = KakuroModel(copy.deepcopy(SAMPLE_PUZZLE_GRID))
+    service = KakuroService(model)
+
+    cancellation = CancellationToken()
+    cancellation.cancel()
+    solver = BacktrackingSolver()
+
+    assert solver.solve(service, cancellation=cancellation) == False
+    assert solver.cancelled == True
+    assert solver.timed_out == False
+
+def test_backtracking_count_solutions():
+    model = KakuroModel(copy.deepcopy(SAMPLE_PUZZLE_GRID))
+    service = KakuroService(model)
+
+    solver = BacktrackingSolver()
+
+    assert solver.count_solutions(service) == 1
+    assert service.model.grid == SAMPLE_PUZZLE_GRID
+
+def test_backtracking_count_solutions_limit():
+    grid = [
+        ["X", (5, None), (5, None)],
+        [(None, 4), None, None],
+        [(None, 6), None, None],
+    ]
+    service = KakuroService(KakuroModel(grid))
+
+    solver = BacktrackingSolver()
+
+    assert solver.count_solutions(service) == 2
+    assert solver.count_solutions(service, limit=1) == 1
+    assert len(service.empty_cells) == 4
+
+def test_backjumping_solver():
+    model = KakuroModel(copy.deepcopy(SAMPLE_PUZZLE_GRID))
+    service = KakuroService(model)
+
+    solver = BacktrackingSolver(backjumping=True)
+
+    assert solver.solve(service) == True
+    assert service.is_solved()
+    assert solver.nodes > 0
+
+def test_backjumping_solver_empty():
+    model = KakuroModel(copy.deepcopy(SAMPLE_PUZZLE_GRID_NO_SOLUTION))
+    service = KakuroService(model)
+
+    solver = BackjumpingSolver()
+
+    assert solver.solve(service) == False
+    assert service.model.grid == SAMPLE_PUZZLE_GRID_NO_SOLUTION
+
+def test_get_conflict_cells():
+    model = KakuroModel(copy.deepcopy(SAMPLE_PUZZLE_GRID))
+    service = KakuroService(model)
+
+    solver = BacktrackingSolver(backjumping=True)
+    solver.assignment = {(1, 2): 6, (3, 2): 3, (4, 4): 4}
+
+    assert solver.get_conflict_cells(service, (2, 1)) == set()
+    assert solver.get_conflict_cells(service, (1, 3)) == {(1, 2)}
+    assert solver.get_conflict_cells(service, (4, 2)) == {(3, 2), (4, 4)}
+
+def test_nogood_store_find():
+    store = NogoodStore(capacity=4, max_size=2)
+    nogood = frozenset({((1, 1), 9), ((1, 2), 6)})
+
+    assert store.add(nogood)
+    assert not store.add(frozenset())
+    assert not store.add(frozenset({((1, 1), 9), ((1, 2), 6), ((1, 3), 4)}))
+    assert store.find({(1, 1): 9, (1, 2): 6}, ((1, 2), 6)) == nogood
+    assert store.find({(1, 1): 8, (1, 2): 6}, ((1, 2), 6)) is None
+
+def test_nogood_store_drops_evicted_nogoods_from_watches():
+    store = NogoodStore(capacity=1)
+    first = frozenset({((1, 1), 9), ((1, 2), 6)})
+    second = frozenset({((1, 2), 6), ((1, 3), 4)})
+
+    store.add(first)
+    store.add(second)
+
+    assert len(store) == 1
+    assert ((1, 1), 9) not in store.watches
+    assert store.watches[((1, 2), 6)] == {second}
+    assert store.find({(1, 1): 9, (1, 2): 6}, ((1, 2), 6)) is None
+
+@pytest.mark.parametrize("backjumping", [False, True])
+def test_backtracking_solver_with_validation(backjumping):
+    model = KakuroModel(copy.deepcopy(SAMPLE_PUZZLE_GRID))
+    service = KakuroService(model)
+
+    solver = BacktrackingSolver(backjumping=backjumping, validate=True)
+
+    assert solver.solve(service) == True
+    assert solver.validator.is_solved()
+    assert service.is_solved()
+
+def test_count_solutions_with_validation():
+    grid = [["X", (5, None), (5, None)], [(None, 4), None, None], [(None, 6), None, None]]
+    service = KakuroService(KakuroModel(grid))
+
+    solver = BacktrackingSolver(validate=True)
+
+    assert solver.count_solutions(service) == 2
+    assert solver.validator.invalid_runs == len(solver.validator.runs)
+
+@pytest.mark.parametrize("variable_ordering", ["mrv", "mrv-degree", "most-constrained-run"])
+@pytest.mark.parametrize("value_ordering", ["descending", "ascending", "combinations"])
+def test_backtracking_solver_orderings(variable_ordering, value_ordering):
+    model = KakuroModel(copy.deepcopy(SAMPLE_PUZZLE_GRID))
+    service = KakuroService(model)
+
+    solver = BacktrackingSolver(backjumping=value_ordering == "combinations")
+
+    assert solver.solve(service, variable_ordering=variable_ordering, value_ordering=value_ordering) == True
+    assert service.is_solved()
+    assert solver.select_cell is ordering.VARIABLE_ORDERINGS[variable_ordering]
+
+def test_backtracking_solver_unknown_ordering():
+    service = KakuroService(KakuroModel(copy.deepcopy(SAMPLE_PUZZLE_GRID)))
+
+    with pytest.raises(ValueError):
+        BacktrackingSolver(variable_ordering="random")
+
+    with pytest.raises(KeyError):
+        BacktrackingSolver().solve(service, variable_ordering="random")
+
+@pytest.mark.parametrize("backjumping", [False, True])
+def test_backtracking_solver_resumes_from_checkpoint(backjumping):
+    service = KakuroService(KakuroModel(copy.deepcopy(SAMPLE_PUZZLE_GRID)))
+    solver = BacktrackingSolver(backjumping=backjumping)
+
+    assert solver.solve(service, time_limit=0) == False
+    assert solver.checkpoint is not None
+    assert solver.checkpoint.frontier == [[]]
+    assert service.model.grid == SAMPLE_PUZZLE_GRID
+
+    checkpoint = SolveCheckpoint.from_json(solver.checkpoint.to_json())
+    service = KakuroService(KakuroModel(copy.deepcopy(SAMPLE_PUZZLE_GRID)))
+
+    assert solver.solve(service, resume=checkpoint) == True
+    assert solver.checkpoint is None
+    assert service.model.grid[1][1:] == [9, 6, 4, 2]
+    assert service.model.grid[4][1:] == [2, 1, 7, 4]
+
+def test_backtracking_solver_resume_searches_frontier_only():
+    frontier = [[((1, 2), 5)], [((1, 2), 6)]]
+    checkpoint = SolveCheckpoint(copy.deepcopy(SAMPLE_PUZZLE_GRID), {}, {}, frontier)
+    solver = BacktrackingSolver()
+
+    service = KakuroService(KakuroModel(copy.deepcopy(SAMPLE_PUZZLE_GRID)))
+    assert solver.solve(service, resume=checkpoint) == True
+    assert service.model.grid[1][2] == 6
+
+    checkpoint.frontier = frontier[:1]
+    service = KakuroService(KakuroModel(copy.deepcopy(SAMPLE_PUZZLE_GRID)))
+    assert solver.solve(service, resume=checkpoint) == False
+    assert solver.timed_out == False
+    assert service.model.grid[1][2] is None
+
+def test_backjumping_solver_resume_forgets_nogoods_between_subtrees():
+    frontier = [[((2, 3), 3)], [((2, 3), 1)]]
+    checkpoint = SolveCheckpoint(copy.deepcopy(SAMPLE_PUZZLE_GRID), {}, {}, frontier)
+    service = KakuroService(KakuroModel(copy.deepcopy(SAMPLE_PUZZLE_GRID)))
+
+    assert BacktrackingSolver(backjumping=True).solve(service, resume=checkpoint) == True
+    assert service.model.grid[2][3] == 1
+    assert service.is_solved()
+
+@pytest.mark.parametrize("backjumping", [False, True])
+def test_backtracking_solver_resume_keeps_checkpoint_domains(backjumping):
+    checkpoint = SolveCheckpoint(copy.deepcopy(SAMPLE_PUZZLE_GRID), {}, {(1, 3): [3]}, [[((1, 2), 6)]])
+    service = KakuroService(KakuroModel(copy.deepcopy(SAMPLE_PUZZLE_GRID)))
+
+    assert BacktrackingSolver(backjumping=backjumping).solve(service, resume=checkpoint) == False
+
+    checkpoint.domains = {(1, 3): [3, 4]}
+    service = KakuroService(KakuroModel(copy.deepcopy(SAMPLE_PUZZLE_GRID)))
+
+    assert BacktrackingSolver(backjumping=backjumping).solve(service, resume=checkpoint) == True
+    assert service.model.grid[1][3] == 4
+
+@pytest.mark.parametrize("backjumping", [False, True])
+def test_backtracking_solver_result_without_write_back(backjumping):
+    grid = copy.deepcopy(SAMPLE_PUZZLE_GRID)
+    service = KakuroService(KakuroModel(grid))
+    empty_cells = list(service.empty_cells)
+    domains = copy.deepcopy(service.domains)
+    solver = BacktrackingSolver(backjumping=backjumping)
+
+    assert solver.solve(service, write_back=False) == True
+    assert grid == SAMPLE_PUZZLE_GRID
+    assert service.empty_cells == empty_cells
+    assert service.domains == domains
+    assert solver.result.nodes == solver.nodes
+    assert solver.result.to_grid(grid) == [
+        ['X', (21, None), (6, None), (5, None), (10, None)],
+        [(None, 21), 9, 6, 4, 2],
+        [(None, 6), 6, (4, 4), 1, 3],
+        [(None, 7), 4, 3, (7, 1), 1],
+        [(None, 14), 2, 1, 7, 4]
+    ]
+
+    assert solver.solve(service) == True
+    assert service.model.grid == solver.result.to_grid(SAMPLE_PUZZLE_GRID)
+
+def test_backtracking_solver_result_timeout():
+    service = KakuroService(KakuroModel(copy.deepcopy(SAMPLE_PUZZLE_GRID)))
+    solver = BacktrackingSolver()
+
+    assert solver.solve(service, time_limit=0, write_back=False) == False
+    assert solver.result.status == "timeout"
+    assert solver.result.get((1, 2)) is None
\ No newline at end of file
@@ -7,6 +7,9 @@ from Fixtures.sample_puzzles import SAMPLE_PUZZLE_GRID, SAMPLE_PUZZLE_GRID_NO_SO
 from src.Models.kakuro_model import KakuroModel
 from src.Services.kakuro_service import KakuroService
 from src.Solvers.binary_integer_solver import BinaryIntegerSolver
+from src.Solvers.backtracking_solver import BacktrackingSolver
+from src.Solvers.cancellation import CancellationToken
+from src.Solvers.checkpoint import SolveCheckpoint
 
 def test_create_variables():
     model = KakuroModel(copy.deepcopy(SAMPLE_PUZZLE_GRID))
@@ -30,7 +33,7 @@ def test_create_clue_constraint_adds_constraints():
         service, solver, variables, 2, 2, "H", 4
     )
 
-    assert solver.NumConstraints() == 9
+    assert solver.NumConstraints() == 10
 
 def test_create_constraints_applies_all_rules():
     model = KakuroModel(copy.deepcopy(SAMPLE_PUZZLE_GRID))
@@ -42,7 +45,7 @@ def test_create_constraints_applies_all_rules():
     BinaryIntegerSolver.create_constraints(service, solver, variables)
 
 
-    assert solver.NumConstraints() == 121
+    assert solver.NumConstraints() == 134
 
 
 def test_binary_integer_solver():
@@ -69,4 +72,63 @@ def test_binary_integer_solver_no_solution():
 
     solver = BinaryIntegerSolver()
 
-    assert solver.solve(service) == False
\ No newline at end of file
+    assert solver.solve(service) == False
+
+def test_binary_integer_solver_keeps_filled_cells():
+    solvable = [['X', 'X', (3, None), (6, None)], [(None, 10), 1, None, None]]
+    unsolvable = [['X', 'X', (3, None), (7, None)], [(None, 10), 1, None, None]]
+
+    solver = BinaryIntegerSolver()
+
+    assert solver.solve(KakuroService(KakuroModel(copy.deepcopy(solvable))), write_back=False) == True
+    assert solver.result.to_grid(solvable)[1] == [(None, 10), 1, 3, 6]
+    assert solver.solve(KakuroService(KakuroModel(copy.deepcopy(unsolvable)))) == False
+
+def test_binary_integer_solver_time_limit():
+    model = KakuroModel(copy.deepcopy(SAMPLE_PUZZLE_GRID))
+    service = KakuroService(model)
+
+    solver = BinaryIntegerSolver()
+
+    assert solver.solve(service, time_limit=60) == True
+    assert solver.timed_out == False
+
+def test_binary_integer_solver_cancelled():
+    model = KakuroModel(copy.deepcopy(SAMPLE_PUZZLE_GRID))
+    service = KakuroService(model)
+
+    cancellation = CancellationToken()
+    cancellation.cancel()
+    solver = BinaryIntegerSolver()
+
+    assert solver.solve(service, cancellation=cancellation) == False
+    assert solver.cancelled == True
+
+def test_binary_integer_solver_resumes_from_checkpoint():
+    backtracking = BacktrackingSolver()
+    backtracking.solve(KakuroService(KakuroModel(copy.deepcopy(SAMPLE_PUZZLE_GRID))), time_limit=0)
+    checkpoint = SolveCheckpoint.from_json(backtracking.checkpoint.to_json())
+    checkpoint.hints = {(1, 2): 6}
+
+    service = KakuroService(KakuroModel(copy.deepcopy(SAMPLE_PUZZLE_GRID)))
+    solver = BinaryIntegerSolver()
+
+    assert solver.solve(service, resume=checkpoint) == True
+    assert solver.checkpoint is None
+    assert service.model.grid[1][1:] == [9, 6, 4, 2]
+
+def test_binary_integer_solver_result_without_write_back():
+    grid = copy.deepcopy(SAMPLE_PUZZLE_GRID)
+    service = KakuroService(KakuroModel(grid))
+    solver = BinaryIntegerSolver()
+
+    assert solver.solve(service, write_back=False) == True
+    assert grid == SAMPLE_PUZZLE_GRID
+    assert solver.result.solved == True
+    assert solver.result.to_grid(grid) == [
+        ['X', (21, None), (6, None), (5, None), (10, None)],
+        [(None, 21), 9, 6, 4, 2],
+        [(None, 6), 6, (4, 4), 1, 3],
+        [(None, 7), 4, 3, (7, 1), 1],
+        [(None, 14), 2, 1, 7, 4]
+    ]
\ No newline at end of file
@@ -6,6 +6,9 @@ from ortools.sat.python import cp_model
 from src.Models.kakuro_model import KakuroModel
 from src.Services.kakuro_service import KakuroService
 from src.Solvers.constraint_solver import ConstraintSolver
+from src.Solvers.backtracking_solver import BacktrackingSolver
+from src.Solvers.cancellation import CancellationToken
+from src.Solvers.checkpoint import SolveCheckpoint
 from Fixtures.sample_puzzles import SAMPLE_PUZZLE_GRID, SAMPLE_PUZZLE_GRID_NO_SOLUTION
 
 def test_compute_all_different():
@@ -81,4 +84,65 @@ def test_constraint_solver_no_solution():
 
     solver = ConstraintSolver()
 
-    assert solver.solve(service) == False
\ No newline at end of file
+    assert solver.solve(service) == False
+
+def test_constraint_solver_time_limit():
+    model = KakuroModel(copy.deepcopy(SAMPLE_PUZZLE_GRID))
+    service = KakuroService(model)
+
+    solver = ConstraintSolver()
+
+    assert solver.solve(service, time_limit=60) == True
+    assert solver.timed_out == False
+
+def test_constraint_solver_cancelled():
+    model = KakuroModel(copy.deepcopy(SAMPLE_PUZZLE_GRID))
+    service = KakuroService(model)
+
+    cancellation = CancellationToken()
+    cancellation.cancel()
+    solver = ConstraintSolver()
+
+    assert solver.solve(service, cancellation=cancellation) == False
+    assert solver.cancelled == True
+
+def test_constraint_solver_resumes_from_checkpoint():
+    backtracking = BacktrackingSolver()
+    backtracking.solve(KakuroService(KakuroModel(copy.deepcopy(SAMPLE_PUZZLE_GRID))), time_limit=0)
+    checkpoint = SolveCheckpoint.from_json(backtracking.checkpoint.to_json())
+    checkpoint.hints = {(1, 2): 6}
+
+    service = KakuroService(KakuroModel(copy.deepcopy(SAMPLE_PUZZLE_GRID)))
+    solver = ConstraintSolver()
+
+    assert solver.solve(service, resume=checkpoint) == True
+    assert solver.checkpoint is None
+    assert service.model.grid[1][1:] == [9, 6, 4, 2]
+
+def test_constraint_solver_result_without_write_back():
+    grid = copy.deepcopy(SAMPLE_PUZZLE_GRID)
+    service = KakuroService(KakuroModel(grid))
+    solver = ConstraintSolver()
+
+    assert solver.solve(service, write_back=False) == True
+    assert grid == SAMPLE_PUZZLE_GRID
+    assert solver.result.status == "solved"
+    assert solver.result.get((4, 3)) == 7
+    assert solver.result.to_grid(grid) == [
+        ['X', (21, None), (6, None), (5, None), (10, None)],
+        [(None, 21), 9, 6, 4, 2],
+        [(None, 6), 6, (4, 4), 1, 3],
+        [(None, 7), 4, 3, (7, 1), 1],
+        [(None, 14), 2, 1, 7, 4]
+    ]
+
+    assert solver.solve(service) == True
+    assert service.model.grid == solver.result.to_grid(SAMPLE_PUZZLE_GRID)
+
+def test_constraint_solver_result_no_solution():
+    service = KakuroService(KakuroModel(copy.deepcopy(SAMPLE_PUZZLE_GRID_NO_SOLUTION)))
+    solver = ConstraintSolver()
+
+    assert solver.solve(service, write_back=False) == False
+    assert solver.result.status == "unsolvable"
+    assert solver.result.values == b""
\ No newline at end of file
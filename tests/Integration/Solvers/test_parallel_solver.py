@@ -0,0 +1,85 @@
+import copy
+
+from Fixtures.sample_puzzles import SAMPLE_PUZZLE_GRID, SAMPLE_PUZZLE_GRID_NO_SOLUTION, SAMPLE_PUZZLE_GRID_ZERO
+from src.Models.kakuro_model import KakuroModel
+from src.Services.kakuro_service import KakuroService
+from src.Solvers.cancellation import CancellationToken
+from src.Solvers.checkpoint import SolveCheckpoint
+from src.Solvers.parallel_solver import ParallelBacktrackingSolver
+
+EXPECTED_GRID = [
+    ['X', (21, None), (6, None), (5, None), (10, None)],
+    [(None, 21), 9, 6, 4, 2],
+    [(None, 6), 6, (4, 4), 1, 3],
+    [(None, 7), 4, 3, (7, 1), 1],
+    [(None, 14), 2, 1, 7, 4]
+]
+
+def test_parallel_solver():
+    model = KakuroModel(copy.deepcopy(SAMPLE_PUZZLE_GRID))
+    service = KakuroService(model)
+
+    solver = ParallelBacktrackingSolver(workers=2, split_depth=1, backjumping=True)
+
+    assert solver.solve(service) == True
+    assert service.model.grid == EXPECTED_GRID
+    assert solver.subtrees >= 1
+
+def test_parallel_solver_solves_while_splitting():
+    model = KakuroModel(copy.deepcopy(SAMPLE_PUZZLE_GRID))
+    service = KakuroService(model)
+
+    solver = ParallelBacktrackingSolver(workers=2, split_depth=20)
+
+    assert solver.solve(service) == True
+    assert service.model.grid == EXPECTED_GRID
+    assert solver.subtrees == 0
+
+def test_parallel_solver_empty():
+    model = KakuroModel(copy.deepcopy(SAMPLE_PUZZLE_GRID_NO_SOLUTION))
+    service = KakuroService(model)
+
+    solver = ParallelBacktrackingSolver(workers=2, split_depth=1)
+
+    assert solver.solve(service) == False
+    assert service.model.grid == SAMPLE_PUZZLE_GRID_NO_SOLUTION
+
+def test_parallel_solver_cancelled():
+    model = KakuroModel(copy.deepcopy(SAMPLE_PUZZLE_GRID))
+    service = KakuroService(model)
+    cancellation = CancellationToken()
+    cancellation.cancel()
+
+    solver = ParallelBacktrackingSolver(workers=2, split_depth=1)
+
+    assert solver.solve(service, cancellation=cancellation) == False
+    assert solver.cancelled == True
+
+def test_parallel_solver_resumes_from_checkpoint():
+    frontier = [[((1, 2), 5)], [((1, 2), 6)]]
+    checkpoint = SolveCheckpoint(copy.deepcopy(SAMPLE_PUZZLE_GRID), {}, {}, frontier)
+    service = KakuroService(KakuroModel(copy.deepcopy(SAMPLE_PUZZLE_GRID)))
+
+    solver = ParallelBacktrackingSolver(workers=2)
+
+    assert solver.solve(service, resume=checkpoint) == True
+    assert service.model.grid == EXPECTED_GRID
+    assert solver.subtrees == 2
+
+def test_parallel_solver_result_without_write_back():
+    grid = copy.deepcopy(SAMPLE_PUZZLE_GRID)
+    service = KakuroService(KakuroModel(grid))
+    solver = ParallelBacktrackingSolver(workers=2, split_depth=1)
+
+    assert solver.solve(service, write_back=False) == True
+    assert grid == SAMPLE_PUZZLE_GRID
+    assert solver.result.to_grid(grid) == EXPECTED_GRID
+
+def test_parallel_solver_custom_digit_range():
+    service = KakuroService(KakuroModel(copy.deepcopy(SAMPLE_PUZZLE_GRID_ZERO)), 0, 9)
+    solver = ParallelBacktrackingSolver(workers=2, split_depth=1)
+
+    assert solver.solve(service) == True
+    assert solver.subtrees >= 1
+    assert service.model.grid[1][1:] == [0, 1, 2]
+    assert service.model.grid[2][1:] == [1, 3, 0]
\ No newline at end of file
@@ -0,0 +1,83 @@
+import json
+import os
+import tempfile
+
+from Fixtures.sample_puzzles import SAMPLE_PUZZLE_GRID, SAMPLE_PUZZLE_GRID_NO_SOLUTION, SAMPLE_PUZZLE_GRID_SMALL
+from src.Cache.corpus_index import CorpusIndex, iter_corpus_paths
+from src.Cache.puzzle_fingerprint import normalize_grid, transpose_grid
+
+TRANSPOSED_GRID = [list(row) for row in transpose_grid(normalize_grid(SAMPLE_PUZZLE_GRID))]
+
+
+def test_iter_corpus_paths_walks_directories():
+    directory = tempfile.mkdtemp()
+    os.makedirs(os.path.join(directory, "b"))
+    for name in ("c.json", "a.json", "notes.txt", os.path.join("b", "d.json")):
+        open(os.path.join(directory, name), "w").close()
+
+    paths = list(iter_corpus_paths([directory, "single.json"]))
+
+    assert paths == [
+        os.path.join(directory, "a.json"),
+        os.path.join(directory, "c.json"),
+        os.path.join(directory, "b", "d.json"),
+        "single.json",
+    ]
+
+def test_corpus_index_clusters_transposed_duplicates():
+    path = os.path.join(tempfile.mkdtemp(), "index.db")
+
+    with CorpusIndex(path, batch_size=2) as index:
+        index.add("a.json", SAMPLE_PUZZLE_GRID)
+        index.add("b.json", SAMPLE_PUZZLE_GRID_NO_SOLUTION)
+        index.add("c.json", TRANSPOSED_GRID)
+        index.add("d.json", json.loads(json.dumps(SAMPLE_PUZZLE_GRID)))
+
+        assert index.count() == (4, 2)
+        assert index.lookup(TRANSPOSED_GRID) == "a.json"
+        assert index.lookup([["X", (3, None)], [(None, 3), None]]) is None
+
+        clusters = list(index.iter_duplicate_clusters())
+        assert len(clusters) == 1
+        assert clusters[0][1] == ["a.json", "c.json", "d.json"]
+        assert list(index.iter_unique_paths()) == ["a.json", "b.json"]
+
+def test_corpus_index_is_persistent_and_reindexes_paths():
+    path = os.path.join(tempfile.mkdtemp(), "index.db")
+
+    with CorpusIndex(path) as index:
+        index.add("a.json", SAMPLE_PUZZLE_GRID)
+        index.add("b.json", TRANSPOSED_GRID)
+
+    with CorpusIndex(path) as index:
+        index.add("b.json", TRANSPOSED_GRID)
+
+        assert index.count() == (2, 1)
+        assert index.lookup(SAMPLE_PUZZLE_GRID) == "a.json"
+
+def test_corpus_index_refreshes_changed_paths():
+    path = os.path.join(tempfile.mkdtemp(), "index.db")
+
+    with CorpusIndex(path) as index:
+        index.add("a.json", SAMPLE_PUZZLE_GRID)
+        index.add("b.json", TRANSPOSED_GRID)
+        index.add("c.json", SAMPLE_PUZZLE_GRID_NO_SOLUTION)
+
+    with CorpusIndex(path) as index:
+        index.add("a.json", SAMPLE_PUZZLE_GRID_NO_SOLUTION)
+        index.add("c.json", SAMPLE_PUZZLE_GRID_SMALL)
+        index.add("c.json", SAMPLE_PUZZLE_GRID)
+
+        assert index.count() == (3, 2)
+        assert index.lookup(SAMPLE_PUZZLE_GRID) == "b.json"
+        assert index.lookup(SAMPLE_PUZZLE_GRID_NO_SOLUTION) == "a.json"
+        assert index.lookup(SAMPLE_PUZZLE_GRID_SMALL) is None
+        assert [paths for _, paths in index.iter_duplicate_clusters()] == [["b.json", "c.json"]]
+        assert list(index.iter_unique_paths()) == ["a.json", "b.json"]
+
+    with CorpusIndex(path) as index:
+        index.add("a.json", SAMPLE_PUZZLE_GRID_SMALL)
+
+        assert index.count() == (3, 2)
+        assert index.lookup(SAMPLE_PUZZLE_GRID_NO_SOLUTION) is None
+        assert index.lookup(SAMPLE_PUZZLE_GRID_SMALL) == "a.json"
\ No newline at end of file
@@ -0,0 +1,37 @@
+import pytest
+
+from src.Cache.lru_cache import LRUCache
+
+
+def test_get_counts_hits_and_misses():
+    cache = LRUCache(2)
+    cache.put("a", 1)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+def test_evicts_least_recently_used():
+    cache = LRUCache(2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    cache.get("a")
+    cache.put("c", 3)
+
+    assert "a" in cache
+    assert "b" not in cache
+    assert "c" in cache
+    assert len(cache) == 2
+
+def test_on_evict_callback():
+    evicted = []
+    cache = LRUCache(1, on_evict=lambda key, value: evicted.append((key, value)))
+    cache.put("a", 1)
+    cache.put("b", 2)
+
+    assert evicted == [("a", 1)]
+
+def test_invalid_capacity():
+    with pytest.raises(ValueError):
+        LRUCache(0)
\ No newline at end of file
@@ -0,0 +1,32 @@
+import copy
+
+from Fixtures.sample_puzzles import SAMPLE_PUZZLE_GRID, SAMPLE_PUZZLE_GRID_SMALL
+from src.Cache.puzzle_fingerprint import canonicalize, normalize_grid, puzzle_fingerprint, transpose_grid
+
+
+def test_transpose_swaps_clue_sums():
+    grid = normalize_grid(SAMPLE_PUZZLE_GRID_SMALL)
+    transposed = transpose_grid(grid)
+
+    assert transposed[2][0] == (None, 12)
+    assert transposed[0][2] == (11, None)
+    assert transposed[1][1] == (4, 3)
+    assert transposed[2][1] == 4
+    assert transpose_grid(transposed) == grid
+
+def test_fingerprint_ignores_list_and_tuple_clues():
+    as_lists = [[list(cell) if isinstance(cell, tuple) else cell for cell in row] for row in SAMPLE_PUZZLE_GRID]
+
+    assert puzzle_fingerprint(as_lists) == puzzle_fingerprint(SAMPLE_PUZZLE_GRID)
+
+def test_fingerprint_stable_under_transposition():
+    transposed = [list(row) for row in transpose_grid(normalize_grid(SAMPLE_PUZZLE_GRID))]
+
+    assert puzzle_fingerprint(transposed) == puzzle_fingerprint(SAMPLE_PUZZLE_GRID)
+    assert canonicalize(transposed)[1] != canonicalize(SAMPLE_PUZZLE_GRID)[1]
+
+def test_fingerprint_distinguishes_puzzles():
+    grid = copy.deepcopy(SAMPLE_PUZZLE_GRID)
+    grid[1][2] = 6
+
+    assert puzzle_fingerprint(grid) != puzzle_fingerprint(SAMPLE_PUZZLE_GRID)
\ No newline at end of file
@@ -0,0 +1,80 @@
+import copy
+import os
+import sqlite3
+import tempfile
+
+from Fixtures.sample_puzzles import SAMPLE_PUZZLE_GRID, SAMPLE_PUZZLE_GRID_NO_SOLUTION
+from src.Cache.puzzle_fingerprint import canonicalize, normalize_grid, transpose_grid
+from src.Cache.results_sink import SqliteResultsSink, decode_solution, encode_solution
+from src.Models.kakuro_model import KakuroModel
+from src.Services.kakuro_service import KakuroService
+from src.Solvers.backtracking_solver import BacktrackingSolver
+
+EXPECTED_GRID = [
+    ['X', (21, None), (6, None), (5, None), (10, None)],
+    [(None, 21), 9, 6, 4, 2],
+    [(None, 6), 6, (4, 4), 1, 3],
+    [(None, 7), 4, 3, (7, 1), 1],
+    [(None, 14), 2, 1, 7, 4]
+]
+
+
+def database_path():
+    return os.path.join(tempfile.mkdtemp(), "results.db")
+
+
+def test_encode_solution_round_trip():
+    canonical, transposed = canonicalize(SAMPLE_PUZZLE_GRID)
+
+    encoded = encode_solution(canonical, transposed, EXPECTED_GRID)
+
+    assert len(encoded) == 14
+    assert sorted(encoded) == sorted("9642" "613" "431" "2174")
+    assert decode_solution(SAMPLE_PUZZLE_GRID, encoded) == EXPECTED_GRID
+
+def test_sink_batches_writes():
+    path = database_path()
+    sink = SqliteResultsSink(path, batch_size=3)
+
+    for _ in range(4):
+        sink.add(SAMPLE_PUZZLE_GRID, EXPECTED_GRID, "solved", "Backtracking Solver", 0.01, 10)
+
+    with sqlite3.connect(path) as reader:
+        assert reader.execute("SELECT COUNT(*) FROM results").fetchone()[0] == 3
+    assert sink.count() == 4
+
+    sink.close()
+
+    with sqlite3.connect(path) as reader:
+        assert reader.execute("SELECT COUNT(*) FROM results").fetchone()[0] == 4
+        assert reader.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        indexes = [row[1] for row in reader.execute("PRAGMA index_list(results)")]
+        assert "results_fingerprint" in indexes
+
+def test_sink_finds_solution_of_transposed_puzzle():
+    with SqliteResultsSink(database_path()) as sink:
+        sink.add(SAMPLE_PUZZLE_GRID, EXPECTED_GRID, "solved")
+        transposed = [list(row) for row in transpose_grid(normalize_grid(SAMPLE_PUZZLE_GRID))]
+
+        assert sink.get_solution(SAMPLE_PUZZLE_GRID) == EXPECTED_GRID
+        assert sink.get_solution(transposed) == [list(row) for row in transpose_grid(normalize_grid(EXPECTED_GRID))]
+        assert sink.get_solution(SAMPLE_PUZZLE_GRID_NO_SOLUTION) is None
+
+def test_sink_add_solve():
+    path = database_path()
+    solver = BacktrackingSolver()
+
+    with SqliteResultsSink(path) as sink:
+        for puzzle in (SAMPLE_PUZZLE_GRID, SAMPLE_PUZZLE_GRID_NO_SOLUTION):
+            kakuro_service = KakuroService(KakuroModel(copy.deepcopy(puzzle)))
+            solved = solver.solve(kakuro_service)
+            sink.add_solve(puzzle, kakuro_service, solver, solved, 0.5, "sample")
+
+    with sqlite3.connect(path) as reader:
+        rows = reader.execute("SELECT status, solver, nodes, source, solution FROM results ORDER BY id").fetchall()
+
+    assert [row[0] for row in rows] == ["solved", "unsolvable"]
+    assert rows[0][1] == str(solver)
+    assert rows[0][2] > 0
+    assert rows[0][3] == "sample"
+    assert rows[1][4] is None
\ No newline at end of file
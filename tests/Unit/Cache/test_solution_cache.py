@@ -0,0 +1,73 @@
+import copy
+import os
+import tempfile
+
+from Fixtures.sample_puzzles import SAMPLE_PUZZLE_GRID, SAMPLE_PUZZLE_GRID_NO_SOLUTION
+from src.Cache.puzzle_fingerprint import normalize_grid, transpose_grid
+from src.Cache.solution_cache import SolutionCache, SqliteCacheBackend
+from src.Solvers.backtracking_solver import BacktrackingSolver
+
+EXPECTED_GRID = [
+    ['X', (21, None), (6, None), (5, None), (10, None)],
+    [(None, 21), 9, 6, 4, 2],
+    [(None, 6), 6, (4, 4), 1, 3],
+    [(None, 7), 4, 3, (7, 1), 1],
+    [(None, 14), 2, 1, 7, 4]
+]
+
+
+class CountingSolver(BacktrackingSolver):
+    def __init__(self):
+        self.calls = 0
+
+    def solve(self, kakuro_service):
+        self.calls += 1
+        return super().solve(kakuro_service)
+
+
+def test_solve_caches_solution():
+    cache = SolutionCache()
+    solver = CountingSolver()
+
+    assert cache.solve(SAMPLE_PUZZLE_GRID, solver) == EXPECTED_GRID
+    assert cache.solve(copy.deepcopy(SAMPLE_PUZZLE_GRID), solver) == EXPECTED_GRID
+    assert solver.calls == 1
+    assert cache.hits == 1
+
+def test_solve_does_not_modify_puzzle():
+    puzzle = copy.deepcopy(SAMPLE_PUZZLE_GRID)
+    SolutionCache().solve(puzzle, BacktrackingSolver())
+
+    assert puzzle == SAMPLE_PUZZLE_GRID
+
+def test_transposed_puzzle_hits_cache():
+    cache = SolutionCache()
+    solver = CountingSolver()
+    cache.solve(SAMPLE_PUZZLE_GRID, solver)
+
+    transposed = [list(row) for row in transpose_grid(normalize_grid(SAMPLE_PUZZLE_GRID))]
+    expected = [list(row) for row in transpose_grid(normalize_grid(EXPECTED_GRID))]
+
+    assert cache.solve(transposed, solver) == expected
+    assert solver.calls == 1
+
+def test_unsolvable_puzzle_is_not_cached():
+    cache = SolutionCache()
+
+    assert cache.solve(SAMPLE_PUZZLE_GRID_NO_SOLUTION, BacktrackingSolver()) is None
+    assert cache.get(SAMPLE_PUZZLE_GRID_NO_SOLUTION) is None
+
+def test_sqlite_backend_persists_solutions():
+    path = os.path.join(tempfile.mkdtemp(), "cache.sqlite")
+
+    backend = SqliteCacheBackend(path)
+    SolutionCache(backend=backend).solve(SAMPLE_PUZZLE_GRID, BacktrackingSolver())
+    backend.close()
+
+    backend = SqliteCacheBackend(path)
+    cache = SolutionCache(backend=backend)
+    solver = CountingSolver()
+
+    assert cache.solve(SAMPLE_PUZZLE_GRID, solver) == EXPECTED_GRID
+    assert solver.calls == 0
+    backend.close()
\ No newline at end of file
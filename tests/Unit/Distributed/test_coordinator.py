@@ -0,0 +1,67 @@
+import copy
+import threading
+
+from Fixtures.sample_puzzles import SAMPLE_PUZZLE_GRID, SAMPLE_PUZZLE_GRID_NO_SOLUTION
+from src.Distributed.coordinator import Coordinator
+from src.Distributed.work_queue import MemoryWorkQueue
+from src.Distributed.worker import Worker
+
+
+def test_workers_drain_the_queue():
+    queue = MemoryWorkQueue()
+    coordinator = Coordinator(queue, unit_size=2)
+    tasks = [(f"{index}.json", copy.deepcopy(SAMPLE_PUZZLE_GRID)) for index in range(4)]
+    tasks.append(("unsolvable.json", copy.deepcopy(SAMPLE_PUZZLE_GRID_NO_SOLUTION)))
+
+    assert coordinator.submit(tasks) == 3
+
+    workers = [Worker(queue, name=f"worker-{index}") for index in range(2)]
+    threads = [threading.Thread(target=worker.run, kwargs={"poll_interval": 0.01}) for worker in workers]
+    for thread in threads:
+        thread.start()
+
+    records = {record["source"]: record for record in coordinator.iter_results(poll_interval=0.01, timeout=30)}
+    for thread in threads:
+        thread.join(10)
+
+    assert len(records) == 5
+    assert records["unsolvable.json"]["status"] == "unsolvable"
+    assert records["0.json"]["status"] == "solved"
+    assert records["0.json"]["grid"][1][0] == (None, 21)
+    assert sum(worker.units for worker in workers) == 3
+    assert sum(stats.puzzles for stats in queue.get_worker_stats()) == 5
+    assert not any(thread.is_alive() for thread in threads)
+
+def test_failed_unit_reports_each_puzzle():
+    queue = MemoryWorkQueue(max_attempts=1)
+    coordinator = Coordinator(queue, unit_size=10)
+    coordinator.submit([("a.json", SAMPLE_PUZZLE_GRID), ("b.json", SAMPLE_PUZZLE_GRID)])
+
+    unit = queue.lease("worker-1", 60)
+    queue.fail("worker-1", unit.unit_id, "out of memory")
+
+    records = list(coordinator.iter_results(poll_interval=0.01, timeout=5))
+
+    assert [(record["source"], record["status"], record["error"]) for record in records] == [
+        ("a.json", "error", "out of memory"), ("b.json", "error", "out of memory")
+    ]
+
+def test_unit_of_dead_worker_fails_while_coordinator_polls():
+    queue = MemoryWorkQueue(max_attempts=1)
+    coordinator = Coordinator(queue, unit_size=10)
+    coordinator.submit([("a.json", SAMPLE_PUZZLE_GRID)])
+    queue.lease("dead", -1)
+
+    records = list(coordinator.iter_results(poll_interval=0.01, timeout=5))
+
+    assert [(record["source"], record["error"]) for record in records] == [("a.json", "lease expired")]
+
+def test_worker_abandons_unit_after_losing_lease():
+    queue = MemoryWorkQueue()
+    queue.submit([("a.json", copy.deepcopy(SAMPLE_PUZZLE_GRID)), ("b.json", copy.deepcopy(SAMPLE_PUZZLE_GRID))])
+    worker = Worker(queue, name="slow", lease_seconds=-1)
+    unit = queue.lease("slow", -1)
+
+    assert queue.lease("fast", 60).unit_id == unit.unit_id
+    assert worker.process(unit) == False
+    assert worker.units == 0
\ No newline at end of file
@@ -0,0 +1,44 @@
+import copy
+
+import pytest
+
+from Fixtures.sample_puzzles import SAMPLE_PUZZLE_GRID
+from src.Distributed.tcp_transport import TcpWorkQueue, WorkQueueServer
+from src.Distributed.work_queue import UNIT_DONE, MemoryWorkQueue
+from src.Distributed.worker import Worker
+
+
+@pytest.fixture
+def server():
+    server = WorkQueueServer(MemoryWorkQueue(), ("127.0.0.1", 0))
+    server.start()
+    yield server
+    server.stop()
+
+
+def test_remote_worker_solves_units(server):
+    client = TcpWorkQueue(server.server_address)
+    unit_id = client.submit([("a.json", copy.deepcopy(SAMPLE_PUZZLE_GRID))])
+    client.close_submissions()
+
+    assert server.queue.units[unit_id]["tasks"] == [("a.json", SAMPLE_PUZZLE_GRID)]
+
+    worker = Worker(TcpWorkQueue(server.server_address), name="remote")
+    assert worker.run(poll_interval=0.01) == 1
+
+    [(finished_id, status, records, error)] = client.take_finished()
+    assert (finished_id, status, error) == (unit_id, UNIT_DONE, None)
+    assert records[0]["status"] == "solved"
+    assert client.get_worker_stats()[0].name == "remote"
+    assert client.get_progress()["open"] == False
+    client.close()
+    worker.queue.close()
+
+def test_unknown_method_is_rejected(server):
+    client = TcpWorkQueue(server.server_address)
+
+    with pytest.raises(ValueError):
+        client.call("close")
+
+    assert client.get_progress()["open"] == True
+    client.close()
\ No newline at end of file
@@ -0,0 +1,94 @@
+import copy
+import os
+import tempfile
+import time
+
+import pytest
+
+from Fixtures.sample_puzzles import SAMPLE_PUZZLE_GRID
+from src.Distributed.work_queue import (
+    UNIT_DONE, UNIT_FAILED, UNIT_LEASED, UNIT_PENDING, MemoryWorkQueue, SqliteWorkQueue, WorkUnit, iter_units
+)
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def work_queue(request):
+    if request.param == "memory":
+        queue = MemoryWorkQueue(max_attempts=2)
+    else:
+        queue = SqliteWorkQueue(os.path.join(tempfile.mkdtemp(), "queue.db"), max_attempts=2)
+    yield queue
+    queue.close()
+
+
+def test_lease_and_complete(work_queue):
+    unit_id = work_queue.submit([("a.json", copy.deepcopy(SAMPLE_PUZZLE_GRID))])
+
+    unit = work_queue.lease("worker-1", 60)
+
+    assert unit.unit_id == unit_id
+    assert unit.attempts == 1
+    assert unit.tasks == [("a.json", SAMPLE_PUZZLE_GRID)]
+    assert work_queue.lease("worker-2", 60) is None
+    assert work_queue.get_progress()[UNIT_LEASED] == 1
+
+    assert work_queue.complete("worker-2", unit_id, [{"source": "a.json"}], 0.5) == False
+    assert work_queue.complete("worker-1", unit_id, [{"source": "a.json"}], 0.5) == True
+    assert work_queue.take_finished() == [(unit_id, UNIT_DONE, [{"source": "a.json"}], None)]
+    assert work_queue.take_finished() == []
+
+    stats = {worker.name: worker for worker in work_queue.get_worker_stats()}
+    assert (stats["worker-1"].units, stats["worker-1"].puzzles, stats["worker-1"].throughput) == (1, 1, 2.0)
+    assert stats["worker-2"].puzzles == 0
+
+def test_expired_lease_is_retried_then_failed(work_queue):
+    unit_id = work_queue.submit([("a.json", SAMPLE_PUZZLE_GRID)])
+
+    assert work_queue.lease("worker-1", -1).attempts == 1
+    assert work_queue.lease("worker-2", -1).attempts == 2
+    assert work_queue.renew("worker-1", unit_id, 60) == False
+    assert work_queue.lease("worker-3", 60) is None
+
+    progress = work_queue.get_progress()
+    assert (progress[UNIT_PENDING], progress[UNIT_LEASED], progress[UNIT_FAILED]) == (0, 0, 1)
+    assert work_queue.take_finished() == [(unit_id, UNIT_FAILED, [], "lease expired")]
+
+def test_expired_lease_is_taken_back_while_polling(work_queue):
+    unit_id = work_queue.submit([("a.json", SAMPLE_PUZZLE_GRID)])
+    work_queue.lease("worker-1", -1)
+
+    progress = work_queue.get_progress()
+    assert (progress[UNIT_PENDING], progress[UNIT_LEASED]) == (1, 0)
+
+    work_queue.lease("worker-2", -1)
+
+    assert work_queue.take_finished() == [(unit_id, UNIT_FAILED, [], "lease expired")]
+
+def test_fail_gives_unit_back(work_queue):
+    unit_id = work_queue.submit([("a.json", SAMPLE_PUZZLE_GRID)])
+    work_queue.close_submissions()
+
+    assert work_queue.fail("worker-1", work_queue.lease("worker-1", 60).unit_id, "boom") == True
+    assert work_queue.renew("worker-2", work_queue.lease("worker-2", 60).unit_id, 60) == True
+    assert work_queue.get_progress() == {UNIT_PENDING: 0, UNIT_LEASED: 1, UNIT_DONE: 0, UNIT_FAILED: 0, "open": False}
+    assert work_queue.fail("worker-2", unit_id, "boom again") == True
+    assert work_queue.take_finished() == [(unit_id, UNIT_FAILED, [], "boom again")]
+
+def test_sqlite_queue_is_shared_between_connections():
+    path = os.path.join(tempfile.mkdtemp(), "queue.db")
+    coordinator = SqliteWorkQueue(path, max_attempts=1)
+    worker = SqliteWorkQueue(path)
+
+    coordinator.submit([("a.json", SAMPLE_PUZZLE_GRID)])
+    unit = worker.lease("worker-1", -1)
+
+    assert worker.lease("worker-2", 60) is None
+    assert coordinator.take_finished() == [(unit.unit_id, UNIT_FAILED, [], "lease expired")]
+    coordinator.close()
+    worker.close()
+
+def test_units_round_trip_and_sharding():
+    unit = WorkUnit(3, [("a.json", SAMPLE_PUZZLE_GRID)], 1)
+
+    assert WorkUnit.from_dict(copy.deepcopy(unit.to_dict())).tasks == unit.tasks
+    assert [len(tasks) for tasks in iter_units(iter([("a", SAMPLE_PUZZLE_GRID)] * 5), 2)] == [2, 2, 1]
\ No newline at end of file
@@ -1,9 +1,12 @@
 import json
+import os
 import tempfile
 import pytest
 
 from Fixtures.sample_puzzles import SAMPLE_PUZZLE_GRID_SMALL
-from src.Loaders.kakuro_loader import load_puzzle_from_path
+from src.Loaders.kakuro_loader import (
+    iter_puzzle_rows_from_path, iter_puzzles_from_text, list_puzzle_paths, load_puzzle_from_path
+)
 
 
 def test_load_puzzle_success():
@@ -38,4 +41,48 @@ def test_load_puzzle_success():
 
 def test_file_not_found():
     with pytest.raises(FileNotFoundError):
-        load_puzzle_from_path("non_existent_file.json")
\ No newline at end of file
+        load_puzzle_from_path("non_existent_file.json")
+
+def test_iter_puzzles_from_text():
+    text = json.dumps(SAMPLE_PUZZLE_GRID_SMALL) + "\n" + json.dumps(SAMPLE_PUZZLE_GRID_SMALL, indent=2)
+
+    puzzles = list(iter_puzzles_from_text(text))
+
+    assert len(puzzles) == 2
+    assert puzzles[0] == puzzles[1]
+    assert puzzles[0][1][1] == (3, 4)
+
+
+def test_iter_puzzles_from_text_invalid():
+    with pytest.raises(ValueError):
+        list(iter_puzzles_from_text('{"not": "a puzzle"}'))
+
+
+def test_list_puzzle_paths():
+    directory = tempfile.mkdtemp()
+    for name in ("b.json", "a.json", "notes.txt"):
+        open(os.path.join(directory, name), "w").close()
+
+    assert list_puzzle_paths(directory) == [os.path.join(directory, "a.json"), os.path.join(directory, "b.json")]
+
+
+def test_iter_puzzle_rows_from_path():
+    with tempfile.NamedTemporaryFile(mode="w+", delete=False) as tmp_file:
+        json.dump(SAMPLE_PUZZLE_GRID_SMALL, tmp_file, indent=1)
+        tmp_file_path = tmp_file.name
+
+    rows = list(iter_puzzle_rows_from_path(tmp_file_path, chunk_size=5))
+
+    assert rows == [["X", "X", [12, None]], ["X", [3, 4], 4], [[None, 11], None, None]]
+
+
+def test_iter_puzzle_rows_from_path_invalid():
+    with tempfile.NamedTemporaryFile(mode="w+", delete=False) as tmp_file:
+        tmp_file.write('[["X", null], 3]')
+        tmp_file_path = tmp_file.name
+
+    with pytest.raises(ValueError):
+        list(iter_puzzle_rows_from_path(tmp_file_path))
+
+    with pytest.raises(FileNotFoundError):
+        list(iter_puzzle_rows_from_path("non_existent_file.json"))
\ No newline at end of file
@@ -0,0 +1,62 @@
+import copy
+import pytest
+
+from Fixtures.sample_puzzles import SAMPLE_PUZZLE_GRID, SAMPLE_PUZZLE_GRID_SMALL
+from src.Models.kakuro_model import KakuroModel
+from src.Models.sparse_kakuro_model import SparseKakuroModel
+from src.Services.kakuro_service import KakuroService
+from src.Solvers.backtracking_solver import BacktrackingSolver
+
+
+def test_sparse_model_matches_dense_service():
+    dense = KakuroService(KakuroModel(copy.deepcopy(SAMPLE_PUZZLE_GRID)))
+    sparse = KakuroService(SparseKakuroModel.from_rows(copy.deepcopy(SAMPLE_PUZZLE_GRID)))
+
+    assert sparse.model.height == 5
+    assert sparse.model.width == 5
+    assert sparse.model.grid == SAMPLE_PUZZLE_GRID
+    assert sparse.clues == dense.clues
+    assert sparse.clue_cells == dense.clue_cells
+    assert sparse.cell_clues == dense.cell_clues
+    assert sorted(sparse.empty_cells) == sorted(dense.empty_cells)
+    assert sparse.filled_cells == dense.filled_cells
+    assert sparse.domains == dense.domains
+
+
+def test_sparse_model_stores_no_black_cells():
+    model = SparseKakuroModel.from_rows(copy.deepcopy(SAMPLE_PUZZLE_GRID_SMALL))
+
+    assert model.grid[0][0] == "X"
+    assert model.grid[1][1] == (3, 4)
+    assert model.grid[0][2] == (12, None)
+    assert 0 not in model.grid[0].cells
+    assert len(model.grid[1].cells) == 2
+
+
+def test_sparse_model_from_cells():
+    cells = [(0, 1, (3, None)), (0, 2, (4, None)), (1, 0, (None, 7)), (1, 1, None), (1, 2, None)]
+
+    model = SparseKakuroModel.from_cells(2, 3, cells)
+    service = KakuroService(model)
+
+    assert model.grid == [["X", (3, None), (4, None)], [(None, 7), None, None]]
+    assert service.clue_cells[(1, 0, 'H')] == [(1, 1), (1, 2)]
+    assert service.cell_clues[(1, 2)] == ((0, 2, 'V'), (1, 0, 'H'))
+    assert BacktrackingSolver().solve(service) == True
+    assert model.grid[1][1:] == [3, 4]
+
+
+def test_sparse_model_rejects_unordered_cells():
+    with pytest.raises(ValueError):
+        SparseKakuroModel.from_cells(2, 3, [(1, 1, None), (0, 1, (3, None))])
+
+    with pytest.raises(ValueError):
+        SparseKakuroModel.from_cells(2, 3, [(2, 0, None)])
+
+
+def test_sparse_model_solved_like_dense():
+    service = KakuroService(SparseKakuroModel.from_rows(copy.deepcopy(SAMPLE_PUZZLE_GRID)))
+
+    assert BacktrackingSolver().solve(service) == True
+    assert service.is_solved() == True
+    assert service.model.grid[4][1:] == [2, 1, 7, 4]
\ No newline at end of file
@@ -0,0 +1,149 @@
+import copy
+import http.client
+import json
+import socket
+import threading
+from concurrent.futures import Future
+
+import pytest
+
+from Fixtures.sample_puzzles import SAMPLE_PUZZLE_GRID, SAMPLE_PUZZLE_GRID_NO_SOLUTION
+from src.Server.http_server import JOB_COUNT, JOB_SOLVE, KakuroHTTPServer, MicroBatcher, ServerMetrics, run_batch
+
+EXPECTED_GRID = [
+    ['X', [21, None], [6, None], [5, None], [10, None]],
+    [[None, 21], 9, 6, 4, 2],
+    [[None, 6], 6, [4, 4], 1, 3],
+    [[None, 7], 4, 3, [7, 1], 1],
+    [[None, 14], 2, 1, 7, 4]
+]
+
+
+@pytest.fixture(scope="module")
+def server():
+    server = KakuroHTTPServer(("127.0.0.1", 0), workers=1, max_delay=0.01, preload_ortools=False)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def request(server, method, path, body=None):
+    connection = http.client.HTTPConnection(*server.server_address, timeout=30)
+    connection.request(method, path, body=None if body is None else json.dumps(body))
+    response = connection.getresponse()
+    result = response.status, json.loads(response.read())
+    connection.close()
+    return result
+
+
+def test_run_batch():
+    results = run_batch([
+        (JOB_SOLVE, {"puzzle": copy.deepcopy(SAMPLE_PUZZLE_GRID)}),
+        (JOB_SOLVE, {"puzzle": copy.deepcopy(SAMPLE_PUZZLE_GRID_NO_SOLUTION)}),
+        (JOB_COUNT, {"puzzle": copy.deepcopy(SAMPLE_PUZZLE_GRID)}),
+        (JOB_SOLVE, {}),
+    ])
+
+    assert results[0]["status"] == "solved"
+    assert results[1] == {"status": "unsolvable", "grid": None}
+    assert results[2] == {"count": 1, "complete": True}
+    assert "error" in results[3]
+
+def test_metrics_snapshot():
+    metrics = ServerMetrics()
+    metrics.record_request("/solve", 0.010, True)
+    metrics.record_request("/solve", 0.030, False)
+    metrics.record_batch(2)
+
+    snapshot = metrics.snapshot()
+
+    assert snapshot["endpoints"]["/solve"]["requests"] == 2
+    assert snapshot["endpoints"]["/solve"]["errors"] == 1
+    assert snapshot["endpoints"]["/solve"]["latency_ms"]["max"] == pytest.approx(30)
+    assert snapshot["average_batch_size"] == 2
+
+def test_solve_endpoint(server):
+    status, body = request(server, "POST", "/solve", {"puzzle": SAMPLE_PUZZLE_GRID})
+
+    assert status == 200
+    assert body == {"status": "solved", "grid": EXPECTED_GRID}
+
+def test_concurrent_requests_are_batched(server):
+    results = []
+
+    def solve():
+        results.append(request(server, "POST", "/solve", {"puzzle": SAMPLE_PUZZLE_GRID}))
+
+    threads = [threading.Thread(target=solve) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert all(status == 200 and body["grid"] == EXPECTED_GRID for status, body in results)
+    assert server.metrics.snapshot()["largest_batch"] > 1
+
+def test_batches_are_split_across_workers():
+    class RecordingExecutor:
+        def __init__(self):
+            self.tasks = []
+
+        def submit(self, function, jobs):
+            self.tasks.append(jobs)
+            future = Future()
+            future.set_result(function(jobs))
+            return future
+
+    executor = RecordingExecutor()
+    batcher = MicroBatcher(executor, ServerMetrics(), max_batch_size=5, max_delay=1, workers=3)
+    futures = [batcher.submit(JOB_SOLVE, {"index": index}) for index in range(5)]
+    results = [future.result(timeout=5) for future in futures]
+    batcher.close()
+
+    assert sorted(len(jobs) for jobs in executor.tasks) == [1, 2, 2]
+    assert all("error" in result for result in results)
+
+def test_validate_endpoint(server):
+    status, body = request(server, "POST", "/validate", {"puzzle": EXPECTED_GRID})
+    assert status == 200
+    assert body == {"solved": True, "violation": None}
+
+    status, body = request(server, "POST", "/validate", {"puzzle": SAMPLE_PUZZLE_GRID})
+    assert status == 200
+    assert body["solved"] == False
+
+def test_count_solutions_endpoint(server):
+    status, body = request(server, "POST", "/count-solutions", {"puzzle": SAMPLE_PUZZLE_GRID, "limit": 10})
+
+    assert status == 200
+    assert body == {"count": 1, "complete": True}
+
+def test_bad_requests(server):
+    assert request(server, "POST", "/solve", {"engine": "backtracking"})[0] == 400
+    assert request(server, "POST", "/unknown", {})[0] == 404
+    assert request(server, "GET", "/unknown")[0] == 404
+
+def test_invalid_content_length(server):
+    with socket.create_connection(server.server_address, timeout=30) as connection:
+        connection.sendall(b"POST /solve HTTP/1.1\r\nHost: localhost\r\nContent-Length: abc\r\n\r\n")
+        response = connection.makefile("rb").readline()
+
+    assert response.split()[1] == b"400"
+
+def test_unknown_paths_share_one_metrics_key(server):
+    request(server, "POST", "/unknown-a", {})
+    request(server, "POST", "/solve?engine=binary", {})
+    endpoints = server.metrics.snapshot()["endpoints"]
+
+    assert endpoints["other"]["requests"] >= 2
+    assert not any(endpoint.startswith("/unknown") or "?" in endpoint for endpoint in endpoints)
+
+def test_metrics_endpoint(server):
+    request(server, "POST", "/solve", {"puzzle": SAMPLE_PUZZLE_GRID})
+    status, body = request(server, "GET", "/metrics")
+
+    assert status == 200
+    assert body["endpoints"]["/solve"]["requests"] >= 1
+    assert body["batches"] >= 1
\ No newline at end of file
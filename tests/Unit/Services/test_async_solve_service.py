@@ -0,0 +1,145 @@
+import asyncio
+import copy
+import threading
+
+import pytest
+
+from Fixtures.sample_puzzles import SAMPLE_PUZZLE_GRID, SAMPLE_PUZZLE_GRID_NO_SOLUTION, SAMPLE_PUZZLE_GRID_ZERO
+from src.Services.async_solve_service import AsyncSolveService
+from src.Services.puzzle_definition import PuzzleDefinition
+from src.Solvers import solver_registry
+
+EXPECTED_GRID = [
+    ['X', (21, None), (6, None), (5, None), (10, None)],
+    [(None, 21), 9, 6, 4, 2],
+    [(None, 6), 6, (4, 4), 1, 3],
+    [(None, 7), 4, 3, (7, 1), 1],
+    [(None, 14), 2, 1, 7, 4]
+]
+
+
+class BlockingSolver:
+    """Waits until it is cancelled, recording how many instances run at the same time."""
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def solve(self, kakuro_service, time_limit=None, cancellation=None):
+        with BlockingSolver.lock:
+            BlockingSolver.running += 1
+            BlockingSolver.peak = max(BlockingSolver.peak, BlockingSolver.running)
+
+        cancellation.event.wait(5)
+
+        with BlockingSolver.lock:
+            BlockingSolver.running -= 1
+
+        self.cancelled = cancellation.is_cancelled()
+        return False
+
+
+class TimedOutSolver:
+    """Stops at its own time limit before the asyncio timeout fires."""
+    def solve(self, kakuro_service, time_limit=None, cancellation=None):
+        self.timed_out = True
+        return False
+
+
+@pytest.fixture
+def blocking_engine():
+    BlockingSolver.running = 0
+    BlockingSolver.peak = 0
+    solver_registry.register_engine("blocking", __name__, "BlockingSolver")
+    yield "blocking"
+    del solver_registry.SOLVER_ENGINES["blocking"]
+    solver_registry._loaded_engines.pop("blocking", None)
+
+
+def test_solve():
+    async def run():
+        async with AsyncSolveService() as service:
+            puzzle = copy.deepcopy(SAMPLE_PUZZLE_GRID)
+            solutions = await asyncio.gather(service.solve(puzzle), service.solve(puzzle, timeout=30))
+            assert puzzle == SAMPLE_PUZZLE_GRID
+            return solutions
+
+    assert asyncio.run(run()) == [EXPECTED_GRID, EXPECTED_GRID]
+
+def test_solve_definition_on_several_engines():
+    async def run():
+        definition = PuzzleDefinition(copy.deepcopy(SAMPLE_PUZZLE_GRID))
+        async with AsyncSolveService() as service:
+            return await asyncio.gather(*(service.solve(definition, engine) for engine in solver_registry.available_engines()))
+
+    assert asyncio.run(run()) == [EXPECTED_GRID] * len(solver_registry.available_engines())
+
+def test_solve_no_solution():
+    async def run():
+        async with AsyncSolveService() as service:
+            return await service.solve(SAMPLE_PUZZLE_GRID_NO_SOLUTION)
+
+    assert asyncio.run(run()) is None
+
+def test_solve_custom_digit_range():
+    async def run():
+        async with AsyncSolveService() as service:
+            return await service.solve(SAMPLE_PUZZLE_GRID_ZERO, min_value=0, max_value=9)
+
+    assert asyncio.run(run())[2][1:] == [1, 3, 0]
+
+def test_solver_time_limit_raises_timeout():
+    solver_registry.register_engine("timed-out", __name__, "TimedOutSolver")
+
+    async def run():
+        async with AsyncSolveService() as service:
+            with pytest.raises(asyncio.TimeoutError):
+                await service.solve(SAMPLE_PUZZLE_GRID, engine="timed-out", timeout=30)
+
+    try:
+        asyncio.run(run())
+    finally:
+        del solver_registry.SOLVER_ENGINES["timed-out"]
+        solver_registry._loaded_engines.pop("timed-out", None)
+
+def test_unknown_engine_creates_no_pool():
+    async def run():
+        async with AsyncSolveService() as service:
+            with pytest.raises(KeyError):
+                await service.solve(SAMPLE_PUZZLE_GRID, engine="missing")
+            return service.executors
+
+    assert asyncio.run(run()) == {}
+
+def test_timeout_cancels_solver(blocking_engine):
+    async def run():
+        async with AsyncSolveService() as service:
+            with pytest.raises(asyncio.TimeoutError):
+                await service.solve(SAMPLE_PUZZLE_GRID, engine=blocking_engine, timeout=0.05)
+
+    asyncio.run(run())
+
+    assert BlockingSolver.running == 0
+
+def test_task_cancellation_stops_solver(blocking_engine):
+    async def run():
+        async with AsyncSolveService() as service:
+            task = asyncio.create_task(service.solve(SAMPLE_PUZZLE_GRID, engine=blocking_engine))
+            await asyncio.sleep(0.05)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+    asyncio.run(run())
+
+    assert BlockingSolver.running == 0
+
+def test_engine_concurrency_limit(blocking_engine):
+    async def run():
+        async with AsyncSolveService(engine_limits={blocking_engine: 2}) as service:
+            tasks = [service.solve(SAMPLE_PUZZLE_GRID, engine=blocking_engine, timeout=0.05) for _ in range(5)]
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            assert all(isinstance(result, asyncio.TimeoutError) for result in results)
+
+    asyncio.run(run())
+
+    assert BlockingSolver.peak == 2
\ No newline at end of file
@@ -0,0 +1,61 @@
+import copy
+
+import pytest
+
+from Fixtures.sample_puzzles import SAMPLE_PUZZLE_GRID, SAMPLE_PUZZLE_GRID_NO_SOLUTION, SAMPLE_PUZZLE_GRID_SMALL
+from src.Models.kakuro_model import KakuroModel
+from src.Services.batch_domains import build_combination_masks, extract_domain_masks, extract_domains_batch
+from src.Services.combination_table import get_combination_table
+from src.Services.kakuro_service import KakuroService
+
+
+def test_build_combination_masks():
+    pytest.importorskip("numpy")
+
+    combination_masks = build_combination_masks(1, 9)
+
+    assert combination_masks.shape[:2] == (10, 46)
+    assert sorted(mask for mask in combination_masks[2, 4] if mask >= 0) == [(1 << 1) | (1 << 3)]
+    assert all(mask < 0 for mask in combination_masks[2, 2])
+
+def test_extract_domains_batch_matches_service():
+    pytest.importorskip("numpy")
+
+    grids = [
+        copy.deepcopy(SAMPLE_PUZZLE_GRID),
+        copy.deepcopy(SAMPLE_PUZZLE_GRID_NO_SOLUTION),
+        [[tuple(cell) if isinstance(cell, list) else cell for cell in row] for row in SAMPLE_PUZZLE_GRID_SMALL],
+    ]
+    grids[1][1][2] = 9
+    grids.append([
+        ["X", (3, None), (4, None)],
+        ["X", 1, None],
+        [(None, 3), None, None],
+    ])
+
+    batch_domains = extract_domains_batch(grids)
+
+    for grid, domains in zip(grids, batch_domains):
+        expected = KakuroService(KakuroModel(copy.deepcopy(grid))).extract_domains()
+        assert domains == expected
+
+def test_extract_domain_masks_zero_outside_empty_cells():
+    pytest.importorskip("numpy")
+
+    domain_masks = extract_domain_masks([SAMPLE_PUZZLE_GRID])
+
+    assert domain_masks[0, 0, 0] == 0
+    assert domain_masks[0, 1, 1] == 0
+    assert domain_masks[0, 1, 2] == 1 << 6
+
+def test_extract_domains_batch_empty():
+    assert extract_domains_batch([]) == []
+def test_combination_masks_follow_combination_table_for_custom_ranges():
+    pytest.importorskip("numpy")
+
+    combination_masks = build_combination_masks(0, 9)
+    table = get_combination_table(0, 9)
+
+    assert sorted(mask for mask in combination_masks[2, 1] if mask >= 0) == sorted(table.get_masks(2, 1))
+    assert sorted(mask for mask in combination_masks[3, 6] if mask >= 0) == sorted(table.get_masks(3, 6))
+    assert combination_masks.shape[:2] == (11, 46)
\ No newline at end of file
@@ -0,0 +1,68 @@
+from itertools import combinations
+
+import pytest
+
+from src.Models.kakuro_model import KakuroModel
+from src.Services.combination_table import CombinationTable, get_combination_table
+from src.Services.kakuro_service import KakuroService
+from src.Solvers.backtracking_solver import BacktrackingSolver
+from src.Solvers.constraint_solver import ConstraintSolver
+
+
+@pytest.mark.parametrize("min_value, max_value", [(1, 9), (0, 9), (1, 12)])
+def test_combination_table_matches_enumeration(min_value, max_value):
+    table = CombinationTable(min_value, max_value)
+    digits = range(min_value, max_value + 1)
+
+    for length in range(1, len(digits) + 1):
+        expected = {}
+        for combination in combinations(digits, length):
+            expected.setdefault(sum(combination), set()).add(combination)
+
+        for target_sum in range(sum(digits) + 2):
+            assert table.get_combinations(length, target_sum) == expected.get(target_sum, set())
+
+def test_combination_table_masks():
+    table = CombinationTable(1, 9)
+
+    assert table.get_masks(2, 3) == (1 << 1 | 1 << 2,)
+    assert table.count(2, 10) == 4
+    assert table.count(9, 45) == 1
+    assert table.count(3, 5) == 0
+
+def test_combination_table_is_lazy():
+    table = CombinationTable(1, 20)
+
+    assert table.masks == {}
+    assert table.count(3, 6) == 1
+    assert list(table.masks) == [(3, 6)]
+
+def test_combination_table_invalid_range():
+    with pytest.raises(ValueError):
+        CombinationTable(5, 4)
+    with pytest.raises(ValueError):
+        CombinationTable(-1, 9)
+
+def test_combination_table_is_shared():
+    assert get_combination_table(1, 9) is get_combination_table(1, 9)
+    assert get_combination_table(1, 9) is not get_combination_table(1, 15)
+
+def test_service_with_custom_digit_range():
+    grid = [["X", (12, None), (3, None)], [(None, 15), None, None]]
+
+    assert BacktrackingSolver().solve(KakuroService(KakuroModel([list(row) for row in grid]))) == False
+
+    service = KakuroService(KakuroModel([list(row) for row in grid]), max_value=15)
+
+    assert service.MAX_SUM == 120
+    assert service.domains[(1, 1)] == [12]
+    assert BacktrackingSolver().solve(service) == True
+    assert service.model.grid[1][1:] == [12, 3]
+    assert KakuroService.MAX_VALUE == 9
+
+def test_constraint_solver_with_custom_digit_range():
+    grid = [["X", (11, None), (1, None)], [(None, 12), None, None]]
+    service = KakuroService(KakuroModel([list(row) for row in grid]), min_value=0, max_value=11)
+
+    assert ConstraintSolver().solve(service) == True
+    assert service.model.grid[1][1:] == [11, 1]
\ No newline at end of file
@@ -0,0 +1,90 @@
+import copy
+
+from Fixtures.sample_puzzles import SAMPLE_PUZZLE_GRID, SAMPLE_PUZZLE_GRID_NO_SOLUTION
+from src.Cache.lru_cache import LRUCache
+from src.Models.kakuro_model import KakuroModel
+from src.Services.difficulty_rater import (
+    LEVEL_COMBINATIONS, LEVEL_INTERSECTIONS, LEVEL_SEARCH, LEVEL_SINGLES, DeductionState, DifficultyRater, rate_puzzle
+)
+from src.Services.kakuro_service import KakuroService
+
+COMBINATIONS_PUZZLE = [
+    ['X', 'X', 'X', 'X', 'X'],
+    ['X', (12, None), (3, None), 'X', 'X'],
+    [(None, 7), None, None, 'X', 'X'],
+    [(None, 8), None, None, 'X', 'X'],
+    ['X', 'X', 'X', 'X', 'X'],
+]
+
+INTERSECTIONS_PUZZLE = [
+    ['X', 'X', 'X', 'X', 'X', 'X'],
+    ['X', 'X', 'X', (21, None), (9, None), 'X'],
+    ['X', 'X', (None, 9), None, None, (4, None)],
+    ['X', 'X', (None, 17), None, None, None],
+    ['X', 'X', (None, 8), None, None, None],
+]
+
+
+def test_rate_singles_puzzle_without_modifying_it():
+    kakuro_service = KakuroService(KakuroModel(copy.deepcopy(SAMPLE_PUZZLE_GRID)))
+    domains = copy.deepcopy(kakuro_service.domains)
+
+    rating = DifficultyRater().rate(kakuro_service)
+
+    assert rating.level == LEVEL_SINGLES
+    assert rating.technique == "singles"
+    assert rating.steps == {"singles": 13, "combinations": 0, "intersections": 0}
+    assert (rating.solved, rating.remaining, rating.branching) == (13, 0, 0.0)
+    assert kakuro_service.model.grid == SAMPLE_PUZZLE_GRID
+    assert kakuro_service.domains == domains
+
+def test_rate_combinations_puzzle():
+    rating = rate_puzzle(COMBINATIONS_PUZZLE)
+
+    assert rating.level == LEVEL_COMBINATIONS
+    assert rating.remaining == 0
+    assert rating.steps["combinations"] > 0
+
+    limited = rate_puzzle(COMBINATIONS_PUZZLE, DifficultyRater(LEVEL_SINGLES))
+
+    assert limited.level == LEVEL_SEARCH
+    assert limited.remaining == 4
+    assert limited.branching > 0
+
+def test_rate_intersections_puzzle():
+    rating = rate_puzzle(INTERSECTIONS_PUZZLE)
+
+    assert rating.level == LEVEL_INTERSECTIONS
+    assert rating.remaining == 0
+
+    limited = rate_puzzle(INTERSECTIONS_PUZZLE, DifficultyRater(LEVEL_COMBINATIONS))
+
+    assert limited.level == LEVEL_SEARCH
+    assert 0 < limited.remaining < 8
+    assert limited.score > rating.score
+
+def test_rate_puzzle_without_solution():
+    rating = rate_puzzle(SAMPLE_PUZZLE_GRID_NO_SOLUTION)
+
+    assert rating.contradiction == True
+    assert rating.level == LEVEL_SEARCH
+    assert rating.to_dict()["technique"] == "search"
+
+def test_ratings_sort_by_expected_cost():
+    puzzles = [INTERSECTIONS_PUZZLE, SAMPLE_PUZZLE_GRID, COMBINATIONS_PUZZLE]
+    rater = DifficultyRater()
+
+    ordered = sorted(puzzles, key=lambda puzzle: rate_puzzle(puzzle, rater).score)
+
+    assert ordered == [SAMPLE_PUZZLE_GRID, COMBINATIONS_PUZZLE, INTERSECTIONS_PUZZLE]
+    assert rater.memo.hits + rater.memo.misses > 0
+
+def test_cell_supports_follow_assignments():
+    state = DeductionState(KakuroService(KakuroModel(copy.deepcopy(SAMPLE_PUZZLE_GRID))), LRUCache())
+
+    # Two cells summing to 4 take 1 and 3; a cell that can only be 3 leaves 1 to the other one.
+    assert state.get_cell_supports(2, 4, 0, (1 << 1 | 1 << 3, 1 << 3)) == (1 << 1, 1 << 3)
+    assert state.get_cell_supports(2, 4, 0, (1 << 1 | 1 << 3, 1 << 1 | 1 << 3)) == (1 << 1 | 1 << 3, 1 << 1 | 1 << 3)
+    assert state.get_cell_supports(2, 4, 0, (1 << 3, 1 << 3)) == (0, 0)
+    assert state.can_match([1 << 1 | 1 << 2, 1 << 2], 1 << 1 | 1 << 2) == True
+    assert state.can_match([1 << 2, 1 << 2], 1 << 1 | 1 << 2) == False
\ No newline at end of file
@@ -0,0 +1,31 @@
+import pytest
+
+from Fixtures.sample_puzzles import SAMPLE_PUZZLE_GRID, SAMPLE_PUZZLE_GRID_SMALL
+from src.Services.grid_arrays import CELL_BLACK, CELL_CLUE, CELL_WHITE, EMPTY_VALUE, encode_grids
+
+
+def test_encode_grids_pads_and_classifies_cells():
+    pytest.importorskip("numpy")
+
+    encoded = encode_grids([SAMPLE_PUZZLE_GRID, SAMPLE_PUZZLE_GRID_SMALL])
+
+    assert encoded.kind.shape == (2, 5, 5)
+    assert encoded.kind[0, 0, 0] == CELL_BLACK
+    assert encoded.kind[0, 2, 2] == CELL_CLUE
+    assert encoded.kind[0, 1, 1] == CELL_WHITE
+    assert encoded.kind[1, 4, 4] == CELL_BLACK
+    assert encoded.value[0, 1, 1] == 9
+    assert encoded.value[0, 1, 2] == EMPTY_VALUE
+    assert encoded.down_sum[0, 2, 2] == 4
+    assert encoded.right_sum[1, 2, 0] == 11
+
+def test_encode_grids_run_ids():
+    pytest.importorskip("numpy")
+
+    encoded = encode_grids([SAMPLE_PUZZLE_GRID, SAMPLE_PUZZLE_GRID_SMALL])
+    size = encoded.height * encoded.width
+
+    assert encoded.right_run[0, 2, 4] == 2 * encoded.width + 2
+    assert encoded.down_run[0, 4, 2] == 2 * encoded.width + 2
+    assert encoded.down_run[1, 1, 2] == size + 2
+    assert encoded.right_run[0, 0, 1] == -1
\ No newline at end of file
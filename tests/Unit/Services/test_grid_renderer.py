@@ -0,0 +1,73 @@
+import io
+import json
+
+import pytest
+
+from Fixtures.sample_puzzles import SAMPLE_PUZZLE_GRID
+from src.Loaders.kakuro_loader import parse_puzzle
+from src.Models.kakuro_model import KakuroModel
+from src.Services.grid_renderer import (
+    FORMAT_COMPACT, FORMAT_JSON, FORMAT_PRETTY, GridRenderer, format_clue, parse_compact_grid
+)
+from src.Services.kakuro_service import KakuroService
+
+SOLVED_GRID = [
+    ['X', (21, None), (6, None), (5, None), (10, None)],
+    [(None, 21), 9, 6, 4, 2],
+    [(None, 6), 6, (4, 4), 1, 3],
+    [(None, 7), 4, 3, (7, 1), 1],
+    [(None, 14), 2, 1, 7, 4],
+]
+
+
+def test_pretty_matches_print_grid(capsys):
+    KakuroService(KakuroModel([list(row) for row in SAMPLE_PUZZLE_GRID])).print_grid()
+    printed = capsys.readouterr().out
+    lines = printed.splitlines()
+
+    assert GridRenderer(FORMAT_PRETTY).render(SAMPLE_PUZZLE_GRID) == printed
+    assert lines[0] == " ███ " + "".join(f"{format_clue(cell):^5}" for cell in SAMPLE_PUZZLE_GRID[0][1:])
+    assert lines[1] == " \\21   9    .    .    .  "
+    assert format_clue((None, None)) == " "
+
+def test_compact_round_trip():
+    renderer = GridRenderer(FORMAT_COMPACT)
+    text = renderer.render(SOLVED_GRID)
+
+    assert text.startswith("X,21\\,6\\,5\\,10\\/\\21,9,6,4,2/")
+    assert text.count("\n") == 1
+    assert parse_compact_grid(text) == SOLVED_GRID
+    assert parse_compact_grid(renderer.render(SAMPLE_PUZZLE_GRID)) == SAMPLE_PUZZLE_GRID
+
+def test_json_format_is_loadable():
+    text = GridRenderer(FORMAT_JSON).render(SOLVED_GRID)
+
+    assert " " not in text
+    assert parse_puzzle(json.loads(text)) == SOLVED_GRID
+
+def test_write_all_batches_grids():
+    stream = io.StringIO()
+
+    assert GridRenderer(FORMAT_COMPACT).write_all([SOLVED_GRID] * 5, stream, batch_size=2) == 5
+    assert [parse_compact_grid(line) for line in stream.getvalue().splitlines()] == [SOLVED_GRID] * 5
+
+    stream = io.StringIO()
+    GridRenderer(FORMAT_PRETTY).write_all([SOLVED_GRID] * 3, stream, batch_size=2)
+    blocks = stream.getvalue().split("\n\n")
+
+    assert blocks == [GridRenderer().render(SOLVED_GRID).rstrip("\n")] * 2 + [GridRenderer().render(SOLVED_GRID)]
+
+def test_write_all_separates_pretty_grids_whatever_the_batch_size():
+    expected = "\n".join([GridRenderer().render(SOLVED_GRID)] * 4)
+
+    for batch_size in (1, 2, 3, 4, 256):
+        stream = io.StringIO()
+        GridRenderer(FORMAT_PRETTY).write_all([SOLVED_GRID] * 4, stream, batch_size=batch_size)
+
+        assert stream.getvalue() == expected
+
+def test_unknown_format_and_invalid_compact_cell():
+    with pytest.raises(ValueError):
+        GridRenderer("html")
+    with pytest.raises(ValueError):
+        parse_compact_grid("X,a")
\ No newline at end of file
@@ -1,3 +1,5 @@
+import copy
+
 import pytest
 
 from Fixtures.sample_puzzles import SAMPLE_PUZZLE_GRID
@@ -302,4 +304,115 @@ def test_is_solved_unsatisfied_clue():
     model = KakuroModel(grid)
     service = KakuroService(model)
 
-    assert service.is_solved() != True
\ No newline at end of file
+    assert service.is_solved() != True
+
+def test_get_run_state():
+    model = KakuroModel(copy.deepcopy(SAMPLE_PUZZLE_GRID))
+    service = KakuroService(model)
+
+    feasible, candidates_mask = service.get_run_state(2, 4, 0)
+    assert feasible == True
+    assert candidates_mask == (1 << 1) | (1 << 3)
+
+    feasible, candidates_mask = service.get_run_state(2, 4, 1 << 2)
+    assert feasible == False
+    assert candidates_mask == 0
+
+def test_run_memo_counts_hits_and_misses():
+    model = KakuroModel(copy.deepcopy(SAMPLE_PUZZLE_GRID))
+    service = KakuroService(model)
+    service.run_memo.clear()
+
+    service.get_run_state(3, 6, 0)
+    service.get_run_state(3, 6, 0)
+
+    assert service.run_memo.misses == 1
+    assert service.run_memo.hits == 1
+
+def test_run_memo_is_bounded():
+    model = KakuroModel(copy.deepcopy(SAMPLE_PUZZLE_GRID))
+    service = KakuroService(model)
+    service.run_memo.capacity = 8
+
+    for used_mask in range(64):
+        service.get_run_state(4, 20, used_mask << 1)
+
+    assert len(service.run_memo) == 8
+
+def test_is_run_feasible():
+    model = KakuroModel(copy.deepcopy(SAMPLE_PUZZLE_GRID))
+    service = KakuroService(model)
+
+    assert service.is_run_feasible((1, 0, 'H')) == True
+
+    service.model.grid[1][2] = 9
+    assert service.is_run_feasible((1, 0, 'H')) == False
+
+def test_assign_updates_only_affected_runs():
+    service = KakuroService(KakuroModel(copy.deepcopy(SAMPLE_PUZZLE_GRID)))
+    untouched = service.domains[(4, 1)]
+
+    changed, conflicts = service.assign((1, 2), 6)
+
+    assert conflicts == []
+    assert (1, 2) not in service.empty_cells and (1, 2) in service.filled_cells
+    assert (1, 2) not in service.domains
+    assert set(changed) <= {(1, 3), (1, 4), (2, 2)}
+    assert service.domains == service.extract_domains()
+    assert service.domains[(4, 1)] is untouched
+
+def test_assign_reports_conflicts():
+    service = KakuroService(KakuroModel(copy.deepcopy(SAMPLE_PUZZLE_GRID)))
+
+    changed, conflicts = service.assign((1, 2), 9)
+
+    assert ((1, 0, 'H'), "repeated digit") in conflicts
+
+    service.unassign((1, 2))
+    service.assign((3, 4), 2)
+    assert service.assign((3, 4), 2)[1] == [((3, 3, 'H'), "no combination left")]
+
+def test_unassign_restores_domains():
+    service = KakuroService(KakuroModel(copy.deepcopy(SAMPLE_PUZZLE_GRID)))
+    domains = service.extract_domains()
+
+    service.assign((1, 2), 6)
+    changed, conflicts = service.unassign((1, 2))
+
+    assert conflicts == []
+    assert changed[(1, 2)] == domains[(1, 2)]
+    assert service.domains == domains
+    assert service.model.grid == SAMPLE_PUZZLE_GRID
+
+def test_assign_rejects_invalid_input():
+    service = KakuroService(KakuroModel(copy.deepcopy(SAMPLE_PUZZLE_GRID)))
+
+    with pytest.raises(ValueError):
+        service.assign((0, 0), 1)
+    with pytest.raises(ValueError):
+        service.assign((1, 2), 10)
+    with pytest.raises(ValueError):
+        service.unassign((2, 2))
+
+def test_hint():
+    service = KakuroService(KakuroModel(copy.deepcopy(SAMPLE_PUZZLE_GRID)))
+
+    cell, value = service.hint()
+
+    assert value in service.domains[cell]
+
+    while service.empty_cells:
+        hint = service.hint()
+        assert hint is not None
+        assert service.assign(*hint)[1] == []
+
+    assert service.is_solved()
+    assert service.hint() is None
+
+def test_hint_hidden_single():
+    grid = [["X", (3, None), (4, None)], [(None, 3), None, None], [(None, 4), None, None]]
+    service = KakuroService(KakuroModel(grid))
+    service.domains = {(1, 1): [1, 2], (1, 2): [1, 3], (2, 1): [1, 2, 3], (2, 2): [1, 3]}
+
+    # The across run 3 needs 1 and 2, and only (1, 1) can take the 2.
+    assert service.hint() == ((1, 1), 2)
\ No newline at end of file
@@ -0,0 +1,72 @@
+import copy
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from Fixtures.sample_puzzles import SAMPLE_PUZZLE_GRID, SAMPLE_PUZZLE_GRID_ZERO
+from src.Models.kakuro_model import KakuroModel
+from src.Services.kakuro_service import KakuroService
+from src.Services.puzzle_definition import PuzzleDefinition
+from src.Solvers.solver_registry import create_solver
+
+DEFINITION = PuzzleDefinition(copy.deepcopy(SAMPLE_PUZZLE_GRID))
+
+
+def test_definition_matches_service():
+    service = KakuroService(KakuroModel(copy.deepcopy(SAMPLE_PUZZLE_GRID)))
+
+    assert dict(DEFINITION.clues) == service.clues
+    assert {clue: list(cells) for clue, cells in DEFINITION.clue_cells.items()} == service.clue_cells
+    assert dict(DEFINITION.cell_clues) == service.cell_clues
+    assert list(DEFINITION.empty_cells) == service.empty_cells
+    assert {cell: list(domain) for cell, domain in DEFINITION.domains.items()} == service.domains
+    assert DEFINITION.new_grid() == SAMPLE_PUZZLE_GRID
+
+def test_definition_is_immutable():
+    with pytest.raises(AttributeError):
+        DEFINITION.clues = {}
+
+    with pytest.raises(TypeError):
+        DEFINITION.clue_cells[(0, 1, 'V')] = []
+
+    with pytest.raises(TypeError):
+        DEFINITION.grid[1][1] = 5
+
+def test_create_service_shares_structure():
+    first = DEFINITION.create_service()
+    second = DEFINITION.create_service()
+
+    assert first.clue_cells is second.clue_cells is DEFINITION.clue_cells
+    assert first.model.grid is not second.model.grid
+    assert first.empty_cells is not second.empty_cells
+    assert first.domains == second.domains
+
+    first.model.grid[1][2] = 6
+    first.empty_cells.remove((1, 2))
+
+    assert second.model.grid[1][2] is None
+    assert (1, 2) in second.empty_cells
+
+def test_concurrent_solves_of_one_definition():
+    def solve(engine):
+        kakuro_service = DEFINITION.create_service()
+        assert create_solver(engine).solve(kakuro_service)
+        return kakuro_service.model.grid
+
+    engines = ["backtracking", "constraint", "binary"] * 3
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        grids = list(executor.map(solve, engines))
+
+    assert all(grid == grids[0] for grid in grids)
+    assert KakuroService(KakuroModel(grids[0])).is_solved()
+    assert DEFINITION.new_grid() == SAMPLE_PUZZLE_GRID
+
+def test_definition_custom_digit_range():
+    definition = PuzzleDefinition(copy.deepcopy(SAMPLE_PUZZLE_GRID_ZERO), 0, 9)
+    kakuro_service = definition.create_service()
+
+    assert (definition.min_value, definition.max_value) == (0, 9)
+    assert kakuro_service.MIN_VALUE == 0
+    assert 0 in definition.domains[(1, 1)]
+    assert create_solver("backtracking").solve(kakuro_service)
+    assert kakuro_service.model.grid[2][1:] == [1, 3, 0]
\ No newline at end of file
@@ -0,0 +1,93 @@
+import copy
+
+import pytest
+
+from Fixtures.sample_puzzles import SAMPLE_PUZZLE_GRID
+from src.Models.kakuro_model import KakuroModel
+from src.Services.kakuro_service import KakuroService
+from src.Services.solution_validator import IncrementalValidator, validate_solutions
+
+SOLVED_GRID = [
+    ['X', (21, None), (6, None), (5, None), (10, None)],
+    [(None, 21), 9, 6, 4, 2],
+    [(None, 6), 6, (4, 4), 1, 3],
+    [(None, 7), 4, 3, (7, 1), 1],
+    [(None, 14), 2, 1, 7, 4]
+]
+
+SOLUTION = {
+    (1, 2): 6, (1, 3): 4, (1, 4): 2,
+    (2, 1): 6, (2, 3): 1, (2, 4): 3,
+    (3, 1): 4, (3, 2): 3, (3, 4): 1,
+    (4, 1): 2, (4, 2): 1, (4, 3): 7, (4, 4): 4,
+}
+
+
+def test_incremental_validator_tracks_assignments():
+    service = KakuroService(KakuroModel(copy.deepcopy(SAMPLE_PUZZLE_GRID)))
+    validator = IncrementalValidator(service)
+
+    assert validator.is_solved() == False
+
+    for cell, value in SOLUTION.items():
+        validator.assign(cell, value)
+
+    assert validator.is_solved() == True
+    assert validator.first_violation() is None
+    assert service.model.grid == SOLVED_GRID
+
+    validator.unassign((2, 3))
+
+    assert validator.is_solved() == False
+    assert validator.first_violation() == ((0, 3, 'V'), "1 empty cell(s)")
+
+def test_incremental_validator_first_violation():
+    service = KakuroService(KakuroModel(copy.deepcopy(SOLVED_GRID)))
+    validator = IncrementalValidator(service)
+
+    assert validator.is_solved() == True
+
+    validator.assign((4, 4), 5)
+    assert validator.first_violation() == ((0, 4, 'V'), "sum 11 does not match clue 10")
+
+    validator.assign((4, 4), 2)
+    assert validator.first_violation() == ((0, 4, 'V'), "repeated digit")
+
+    validator.assign((4, 4), 10)
+    assert validator.first_violation() == ((0, 4, 'V'), "value outside allowed range")
+
+def test_incremental_validator_matches_is_solved():
+    grid = copy.deepcopy(SOLVED_GRID)
+    grid[1][1] = 8
+    service = KakuroService(KakuroModel(grid))
+
+    assert IncrementalValidator(service).is_solved() == service.is_solved()
+
+def test_validate_solutions():
+    pytest.importorskip("numpy")
+
+    repeated = [
+        ["X", (15, None), (11, None)],
+        [(None, 18), 9, 9],
+        [(None, 8), 6, 2],
+    ]
+    not_filled = [
+        ["X", (15, None), (2, None)],
+        [(None, 9), 9, None],
+        [(None, 8), 6, 2],
+    ]
+    correct = [
+        ["X", (15, None), (8, None)],
+        [(None, 15), 9, 6],
+        [(None, 8), 6, 2],
+    ]
+    out_of_range = [
+        ["X", (16, None), (8, None)],
+        [(None, 16), 10, 6],
+        [(None, 8), 6, 2],
+    ]
+
+    assert validate_solutions([SOLVED_GRID, repeated, not_filled, correct, out_of_range, SAMPLE_PUZZLE_GRID]) == [
+        True, False, False, True, False, False
+    ]
+    assert validate_solutions([]) == []
\ No newline at end of file
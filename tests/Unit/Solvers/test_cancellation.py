@@ -0,0 +1,32 @@
+from src.Solvers.cancellation import CancellationToken
+
+
+def test_cancel_runs_callbacks():
+    calls = []
+    token = CancellationToken()
+    token.add_callback(lambda: calls.append("stop"))
+
+    assert token.is_cancelled() == False
+
+    token.cancel()
+
+    assert token.is_cancelled() == True
+    assert calls == ["stop"]
+
+def test_callback_added_after_cancel_runs_immediately():
+    calls = []
+    token = CancellationToken()
+    token.cancel()
+    token.add_callback(lambda: calls.append("stop"))
+
+    assert calls == ["stop"]
+
+def test_removed_callback_is_not_run():
+    calls = []
+    callback = lambda: calls.append("stop")
+    token = CancellationToken()
+    token.add_callback(callback)
+    token.remove_callback(callback)
+    token.cancel()
+
+    assert calls == []
\ No newline at end of file
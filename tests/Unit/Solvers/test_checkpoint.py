@@ -0,0 +1,67 @@
+import copy
+
+from Fixtures.sample_puzzles import SAMPLE_PUZZLE_GRID, SAMPLE_PUZZLE_GRID_ZERO
+from src.Models.kakuro_model import KakuroModel
+from src.Services.kakuro_service import KakuroService
+from src.Solvers.checkpoint import SolveCheckpoint, apply_checkpoint, create_checkpoint
+
+def test_checkpoint_json_round_trip():
+    checkpoint = SolveCheckpoint(
+        copy.deepcopy(SAMPLE_PUZZLE_GRID),
+        {(1, 2): 6},
+        {(1, 3): [4, 5]},
+        [[((1, 3), 4)], [((1, 3), 5), ((1, 4), 1)]],
+        {(1, 3): 4},
+        "backtracking"
+    )
+
+    restored = SolveCheckpoint.from_json(checkpoint.to_json())
+
+    assert restored.grid == SAMPLE_PUZZLE_GRID
+    assert restored.fixed == checkpoint.fixed
+    assert restored.domains == checkpoint.domains
+    assert restored.frontier == checkpoint.frontier
+    assert restored.hints == checkpoint.hints
+    assert restored.engine == "backtracking"
+
+def test_checkpoint_without_frontier():
+    checkpoint = SolveCheckpoint(copy.deepcopy(SAMPLE_PUZZLE_GRID), {}, {}, engine="constraint")
+
+    restored = SolveCheckpoint.from_dict(checkpoint.to_dict())
+
+    assert restored.frontier is None
+    assert restored.hints == {}
+
+def test_create_checkpoint_keeps_grid():
+    service = KakuroService(KakuroModel(copy.deepcopy(SAMPLE_PUZZLE_GRID)))
+
+    checkpoint = create_checkpoint(service, "backtracking")
+
+    assert service.model.grid == SAMPLE_PUZZLE_GRID
+    assert checkpoint.grid == SAMPLE_PUZZLE_GRID
+    assert checkpoint.fixed
+    assert all(service.model.grid[row][column] is None for row, column in checkpoint.fixed)
+    assert all(cell not in checkpoint.fixed for cell in checkpoint.domains)
+
+def test_apply_checkpoint():
+    service = KakuroService(KakuroModel(copy.deepcopy(SAMPLE_PUZZLE_GRID)))
+    checkpoint = SolveCheckpoint(copy.deepcopy(SAMPLE_PUZZLE_GRID), {(1, 2): 6}, {(1, 3): [4, 5]})
+
+    assert apply_checkpoint(service, checkpoint) == True
+    assert service.model.grid[1][2] == 6
+    assert (1, 2) not in service.empty_cells
+    assert set(service.domains[(1, 3)]) <= {4, 5}
+
+def test_apply_checkpoint_contradicting_grid():
+    service = KakuroService(KakuroModel(copy.deepcopy(SAMPLE_PUZZLE_GRID)))
+    checkpoint = SolveCheckpoint(copy.deepcopy(SAMPLE_PUZZLE_GRID), {(1, 1): 8}, {})
+
+    assert apply_checkpoint(service, checkpoint) == False
+
+def test_create_checkpoint_custom_digit_range():
+    service = KakuroService(KakuroModel(copy.deepcopy(SAMPLE_PUZZLE_GRID_ZERO)), 0, 9)
+
+    checkpoint = create_checkpoint(service, "backtracking")
+
+    assert checkpoint.fixed == {(1, 1): 0, (1, 2): 1, (1, 3): 2, (2, 1): 1, (2, 2): 3, (2, 3): 0}
+    assert checkpoint.domains == {}
\ No newline at end of file
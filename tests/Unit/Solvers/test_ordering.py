@@ -0,0 +1,72 @@
+import copy
+
+import pytest
+
+from Fixtures.sample_puzzles import SAMPLE_PUZZLE_GRID
+from src.Models.kakuro_model import KakuroModel
+from src.Services.kakuro_service import KakuroService
+from src.Solvers import ordering
+from src.Solvers.backtracking_solver import BacktrackingSolver
+from src.Solvers.parallel_solver import ParallelBacktrackingSolver
+
+
+def create_service():
+    return KakuroService(KakuroModel(copy.deepcopy(SAMPLE_PUZZLE_GRID)))
+
+
+def test_select_mrv():
+    service = create_service()
+    cell = ordering.select_mrv(service)
+
+    assert len(service.domains[cell]) == min(len(domain) for domain in service.domains.values())
+
+def test_select_mrv_degree_prefers_more_empty_neighbours():
+    service = create_service()
+    service.domains = {cell: [1, 2] for cell in service.empty_cells}
+
+    # (4, 2) shares its row and column with more empty cells than (2, 1).
+    assert ordering.select_mrv_degree(service) in {(4, 1), (4, 2), (4, 3), (4, 4), (1, 2), (1, 3), (1, 4)}
+    assert ordering.get_degree(service, (4, 2), set(service.empty_cells)) > ordering.get_degree(service, (2, 1), set(service.empty_cells))
+
+def test_select_most_constrained_run():
+    service = create_service()
+
+    cell = ordering.select_most_constrained_run(service)
+
+    # The across run of (3, 4) has sum 1 with a single cell: one combination.
+    assert ordering.get_run_combinations(service, (3, 3, 'H')) == 1
+    assert min(ordering.get_run_combinations(service, clue) for clue in service.cell_clues[cell]) == 1
+
+def test_order_by_combinations():
+    service = create_service()
+    service.domains[(2, 1)] = [1, 2, 3, 4, 5, 6]
+
+    values = ordering.order_by_combinations(service, (2, 1))
+    digit_counts = service.get_run_digit_counts(1, 6, 0)[1]
+
+    assert sorted(values) == [1, 2, 3, 4, 5, 6]
+    assert values[0] == 6
+    assert digit_counts[6] == 1
+
+def test_value_orderings():
+    service = create_service()
+    service.domains[(1, 2)] = [3, 1, 2]
+
+    assert ordering.order_descending(service, (1, 2)) == [3, 2, 1]
+    assert ordering.order_ascending(service, (1, 2)) == [1, 2, 3]
+
+def test_unknown_ordering():
+    with pytest.raises(KeyError):
+        ordering.get_variable_ordering("random")
+    with pytest.raises(KeyError):
+        ordering.get_value_ordering("random")
+
+def test_solver_rejects_unknown_ordering_names():
+    with pytest.raises(ValueError):
+        BacktrackingSolver(variable_ordering="mrv_degree")
+    with pytest.raises(ValueError):
+        BacktrackingSolver(value_ordering="random")
+    with pytest.raises(ValueError):
+        ParallelBacktrackingSolver(variable_ordering="mrv_degree")
+
+    assert BacktrackingSolver(variable_ordering="mrv-degree", value_ordering="combinations").variable_ordering == "mrv-degree"
\ No newline at end of file
@@ -0,0 +1,59 @@
+import copy
+
+import pytest
+
+from Fixtures.sample_puzzles import SAMPLE_PUZZLE_GRID
+from src.Models.kakuro_model import KakuroModel
+from src.Services.kakuro_service import KakuroService
+from src.Solvers.solve_result import (
+    EMPTY_VALUE, STATUS_CANCELLED, STATUS_SOLVED, STATUS_TIMEOUT, STATUS_UNSOLVABLE,
+    ServiceSnapshot, SolveResult, get_status, get_white_cells
+)
+
+
+def test_solve_result_from_grid():
+    service = KakuroService(KakuroModel(copy.deepcopy(SAMPLE_PUZZLE_GRID)))
+    cells = get_white_cells(service)
+    result = SolveResult.from_grid(cells, service.model.grid, STATUS_SOLVED, "test")
+
+    assert cells[:3] == [(1, 1), (1, 2), (1, 3)]
+    assert len(result.values) == 14
+    assert result.values[0] == 9
+    assert result.values[1] == EMPTY_VALUE
+    assert result.get((1, 1)) == 9
+    assert result.get((1, 2)) is None
+    assert dict(result.items())[(1, 1)] == 9
+    assert result.solved == True
+
+    with pytest.raises(KeyError):
+        result.get((0, 0))
+
+def test_solve_result_to_grid_copies_rows_only():
+    cells = [(1, 1), (1, 2)]
+    puzzle = [["X", (None, 3)], [(None, 3), None, None]]
+    result = SolveResult(cells, bytes([1, 2]), STATUS_SOLVED)
+
+    grid = result.to_grid(puzzle)
+
+    assert grid == [["X", (None, 3)], [(None, 3), 1, 2]]
+    assert puzzle == [["X", (None, 3)], [(None, 3), None, None]]
+    assert grid[0][1] is puzzle[0][1]
+
+def test_get_status():
+    assert get_status(True, False, False) == STATUS_SOLVED
+    assert get_status(False, True, False) == STATUS_TIMEOUT
+    assert get_status(False, False, True) == STATUS_CANCELLED
+    assert get_status(False, False, False) == STATUS_UNSOLVABLE
+
+def test_service_snapshot_restore():
+    service = KakuroService(KakuroModel(copy.deepcopy(SAMPLE_PUZZLE_GRID)))
+    domains = copy.deepcopy(service.domains)
+    snapshot = ServiceSnapshot(service, get_white_cells(service))
+
+    service.assign((1, 2), 6)
+    service.assign((4, 3), 7)
+    snapshot.restore()
+
+    assert service.model.grid == SAMPLE_PUZZLE_GRID
+    assert (1, 2) in service.empty_cells and (1, 2) not in service.filled_cells
+    assert service.domains == domains
\ No newline at end of file
@@ -0,0 +1,63 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+from src.Solvers import solver_registry
+from src.Solvers.backtracking_solver import BacktrackingSolver
+
+ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+
+def imported_modules(code):
+    code = code + "\nimport sys\nprint(sorted({name.split('.')[0] for name in sys.modules}))\n"
+    output = subprocess.run([sys.executable, "-c", code], cwd=ROOT, capture_output=True, text=True, check=True)
+    return output.stdout
+
+
+def test_available_engines():
+    assert solver_registry.available_engines() == ["backjumping", "backtracking", "binary", "constraint", "parallel"]
+
+def test_create_solver():
+    assert isinstance(solver_registry.create_solver("backtracking"), BacktrackingSolver)
+
+def test_unknown_engine():
+    with pytest.raises(KeyError):
+        solver_registry.get_solver_class("unknown")
+
+def test_register_engine():
+    solver_registry.register_engine("custom", "src.Solvers.backtracking_solver", "BacktrackingSolver")
+
+    try:
+        assert solver_registry.get_solver_class("custom") is BacktrackingSolver
+    finally:
+        del solver_registry.SOLVER_ENGINES["custom"]
+        solver_registry._loaded_engines.pop("custom", None)
+
+def test_imports_do_not_load_ortools():
+    code = (
+        "from src.Loaders.kakuro_loader import load_puzzle_from_path\n"
+        "from src.Services.kakuro_service import KakuroService\n"
+        "from src.Solvers import solver_registry\n"
+        "import src.Solvers.constraint_solver\n"
+        "import src.Solvers.binary_integer_solver\n"
+        "solver_registry.create_solver('backtracking')\n"
+    )
+
+    assert "ortools" not in imported_modules(code)
+
+def test_service_construction_does_not_regenerate_table():
+    code = (
+        "from src.Models.kakuro_model import KakuroModel\n"
+        "from src.Services import combination_table, kakuro_service\n"
+        "calls = []\n"
+        "original = combination_table.CombinationTable.build\n"
+        "combination_table.CombinationTable.build = lambda *args: calls.append(args) or original(*args)\n"
+        "grid = [['X', (3, None)], [(None, 3), None]]\n"
+        "for _ in range(3):\n"
+        "    kakuro_service.KakuroService(KakuroModel([list(row) for row in grid]))\n"
+        "print('calls', len(calls))\n"
+    )
+
+    assert "calls 1" in imported_modules(code)
\ No newline at end of file
@@ -0,0 +1,47 @@
+import json
+import os
+import tempfile
+
+from Fixtures.sample_puzzles import SAMPLE_PUZZLE_GRID, SAMPLE_PUZZLE_GRID_NO_SOLUTION
+from src import corpus_indexer
+from src.Cache.puzzle_fingerprint import normalize_grid, transpose_grid
+
+
+def write_corpus(directory):
+    puzzles = {
+        "a.json": SAMPLE_PUZZLE_GRID,
+        "b.json": SAMPLE_PUZZLE_GRID_NO_SOLUTION,
+        "c.json": transpose_grid(normalize_grid(SAMPLE_PUZZLE_GRID)),
+    }
+    for name, puzzle in puzzles.items():
+        with open(os.path.join(directory, name), "w") as file:
+            json.dump(puzzle, file)
+
+
+def test_main_reports_duplicates(capsys):
+    directory = tempfile.mkdtemp()
+    write_corpus(directory)
+    index = os.path.join(tempfile.mkdtemp(), "index.db")
+
+    exit_code = corpus_indexer.main([directory, "--index", index, "--duplicates", "--unique"])
+    captured = capsys.readouterr()
+    lines = captured.out.splitlines()
+
+    assert exit_code == corpus_indexer.EXIT_OK
+    assert json.loads(lines[0])["paths"] == [os.path.join(directory, "a.json"), os.path.join(directory, "c.json")]
+    assert lines[1:] == [os.path.join(directory, "a.json"), os.path.join(directory, "b.json")]
+    assert "3 puzzles, 2 distinct, 1 duplicates, 0 errors" in captured.err
+
+def test_main_lookup_and_invalid_files(capsys):
+    directory = tempfile.mkdtemp()
+    write_corpus(directory)
+    with open(os.path.join(directory, "broken.json"), "w") as file:
+        file.write("{")
+    index = os.path.join(tempfile.mkdtemp(), "index.db")
+
+    exit_code = corpus_indexer.main([directory, "--index", index, "--lookup", os.path.join(directory, "c.json")])
+    captured = capsys.readouterr()
+
+    assert exit_code == corpus_indexer.EXIT_ERROR
+    assert json.loads(captured.out)["indexed"] == os.path.join(directory, "a.json")
+    assert "broken.json" in captured.err
\ No newline at end of file
@@ -0,0 +1,53 @@
+import json
+import os
+import tempfile
+import threading
+
+import pytest
+
+from Fixtures.sample_puzzles import SAMPLE_PUZZLE_GRID, SAMPLE_PUZZLE_GRID_NO_SOLUTION
+from src import distributed_runner
+
+
+def write_corpus(directory):
+    for name, puzzle in {"a.json": SAMPLE_PUZZLE_GRID, "b.json": SAMPLE_PUZZLE_GRID_NO_SOLUTION}.items():
+        with open(os.path.join(directory, name), "w") as file:
+            json.dump(puzzle, file)
+
+
+def test_coordinator_and_worker_share_sqlite_queue(capsys):
+    directory = tempfile.mkdtemp()
+    write_corpus(directory)
+    queue = "sqlite:" + os.path.join(tempfile.mkdtemp(), "queue.db")
+    worker = threading.Thread(target=distributed_runner.main, args=(["worker", "--queue", queue, "--name", "w1"],))
+
+    worker.start()
+    exit_code = distributed_runner.main(["coordinator", directory, "--queue", queue, "--unit-size", "1"])
+    worker.join(10)
+    captured = capsys.readouterr()
+    records = {os.path.basename(record["source"]): record for record in map(json.loads, captured.out.splitlines())}
+
+    assert exit_code == 1
+    assert (records["a.json"]["status"], records["b.json"]["status"]) == ("solved", "unsolvable")
+    assert "w1" in captured.err
+    assert not worker.is_alive()
+
+def test_coordinator_timeout_reports_unfinished_puzzles(capsys):
+    directory = tempfile.mkdtemp()
+    write_corpus(directory)
+    queue = "sqlite:" + os.path.join(tempfile.mkdtemp(), "queue.db")
+
+    exit_code = distributed_runner.main(["coordinator", directory, "--queue", queue, "--timeout", "0.1"])
+    captured = capsys.readouterr()
+    records = [json.loads(line) for line in captured.out.splitlines()]
+
+    assert exit_code == 3
+    assert [record["status"] for record in records] == ["timeout", "timeout"]
+    assert "gave up" in captured.err
+
+def test_parse_queue_address():
+    assert distributed_runner.parse_queue_address("tcp:127.0.0.1:9000") == ("tcp", ("127.0.0.1", 9000))
+    assert distributed_runner.parse_queue_address("sqlite:/tmp/q.db") == ("sqlite", "/tmp/q.db")
+
+    with pytest.raises(ValueError):
+        distributed_runner.parse_queue_address("redis:host")
\ No newline at end of file
@@ -0,0 +1,149 @@
+import io
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+import pytest
+
+from Fixtures.sample_puzzles import SAMPLE_PUZZLE_GRID, SAMPLE_PUZZLE_GRID_NO_SOLUTION
+from src import kakuro_solver
+from src.Cache.results_sink import SqliteResultsSink
+
+EXPECTED_GRID = [
+    ['X', [21, None], [6, None], [5, None], [10, None]],
+    [[None, 21], 9, 6, 4, 2],
+    [[None, 6], 6, [4, 4], 1, 3],
+    [[None, 7], 4, 3, [7, 1], 1],
+    [[None, 14], 2, 1, 7, 4]
+]
+
+
+def write_puzzles(directory, puzzles):
+    for name, puzzle in puzzles.items():
+        with open(os.path.join(directory, name), "w") as file:
+            json.dump(puzzle, file)
+
+
+def read_records(output):
+    return sorted((json.loads(line) for line in output.splitlines()), key=lambda record: record["source"])
+
+
+def test_main_solves_directory(capsys):
+    directory = tempfile.mkdtemp()
+    write_puzzles(directory, {"a.json": SAMPLE_PUZZLE_GRID, "b.json": SAMPLE_PUZZLE_GRID_NO_SOLUTION})
+
+    exit_code = kakuro_solver.main([directory])
+    records = read_records(capsys.readouterr().out)
+
+    assert exit_code == kakuro_solver.EXIT_UNSOLVABLE
+    assert [record["status"] for record in records] == ["solved", "unsolvable"]
+    assert records[0]["grid"] == EXPECTED_GRID
+    assert records[1]["grid"] is None
+
+def test_main_writes_results_database(capsys):
+    directory = tempfile.mkdtemp()
+    write_puzzles(directory, {"a.json": SAMPLE_PUZZLE_GRID, "b.json": SAMPLE_PUZZLE_GRID_NO_SOLUTION})
+    path = os.path.join(directory, "results.db")
+
+    kakuro_solver.main([directory, "--results-db", path])
+    capsys.readouterr()
+
+    with SqliteResultsSink(path) as sink:
+        assert sink.count() == 2
+        assert sink.get_solution(SAMPLE_PUZZLE_GRID) == [
+            [tuple(cell) if isinstance(cell, list) else cell for cell in row] for row in EXPECTED_GRID
+        ]
+
+def test_main_reads_stdin(capsys, monkeypatch):
+    text = json.dumps(SAMPLE_PUZZLE_GRID) + "\n" + json.dumps(SAMPLE_PUZZLE_GRID) + "\n"
+    monkeypatch.setattr(sys, "stdin", io.StringIO(text))
+
+    exit_code = kakuro_solver.main(["-"])
+    records = read_records(capsys.readouterr().out)
+
+    assert exit_code == kakuro_solver.EXIT_SOLVED
+    assert [record["source"] for record in records] == ["<stdin>:0", "<stdin>:1"]
+
+def test_main_parallel_jobs(capsys):
+    directory = tempfile.mkdtemp()
+    write_puzzles(directory, {f"{index}.json": SAMPLE_PUZZLE_GRID for index in range(4)})
+
+    exit_code = kakuro_solver.main([directory, "--jobs", "2"])
+    records = read_records(capsys.readouterr().out)
+
+    assert exit_code == kakuro_solver.EXIT_SOLVED
+    assert len(records) == 4
+    assert all(record["grid"] == EXPECTED_GRID for record in records)
+
+def test_main_parallel_jobs_bounds_pending_tasks(capsys, monkeypatch):
+    directory = tempfile.mkdtemp()
+    write_puzzles(directory, {f"{index:02}.json": SAMPLE_PUZZLE_GRID for index in range(12)})
+    monkeypatch.setattr(kakuro_solver, "PENDING_TASKS_PER_JOB", 1)
+
+    exit_code = kakuro_solver.main([directory, "--jobs", "2"])
+    records = read_records(capsys.readouterr().out)
+
+    assert exit_code == kakuro_solver.EXIT_SOLVED
+    assert len(records) == 12
+
+def test_main_parallel_task_failure_becomes_error_record(capsys, monkeypatch):
+    directory = tempfile.mkdtemp()
+    write_puzzles(directory, {"a.json": SAMPLE_PUZZLE_GRID, "b.json": SAMPLE_PUZZLE_GRID})
+    # A lambda cannot be sent to a worker process, so every future fails.
+    monkeypatch.setattr(kakuro_solver, "solve_task", lambda *args: None)
+
+    exit_code = kakuro_solver.main([directory, "--jobs", "2"])
+    records = read_records(capsys.readouterr().out)
+
+    assert exit_code == kakuro_solver.EXIT_ERROR
+    assert [record["status"] for record in records] == ["error", "error"]
+
+def test_solve_task_reports_unexpected_errors(monkeypatch):
+    def overflow(self, service):
+        raise RecursionError("maximum recursion depth exceeded")
+
+    monkeypatch.setattr(kakuro_solver.create_solver("backtracking").__class__, "backtracking", overflow)
+
+    record = kakuro_solver.solve_task("a.json", SAMPLE_PUZZLE_GRID, "backtracking", None)
+
+    assert record["status"] == "error"
+    assert record["error"] == "RecursionError: maximum recursion depth exceeded"
+
+def test_main_time_limit(capsys, monkeypatch):
+    directory = tempfile.mkdtemp()
+    write_puzzles(directory, {"a.json": SAMPLE_PUZZLE_GRID})
+
+    solver_class = kakuro_solver.create_solver("backtracking").__class__
+    monkeypatch.setattr(solver_class, "backtracking", lambda self, service: setattr(self, "timed_out", True))
+
+    exit_code = kakuro_solver.main([directory, "--time-limit", "0.5"])
+
+    assert exit_code == kakuro_solver.EXIT_TIMEOUT
+    assert read_records(capsys.readouterr().out)[0]["status"] == "timeout"
+
+def test_main_missing_file(capsys):
+    exit_code = kakuro_solver.main(["non_existent_file.json"])
+    records = read_records(capsys.readouterr().out)
+
+    assert exit_code == kakuro_solver.EXIT_ERROR
+    assert records[0]["status"] == "error"
+
+def test_main_rejects_invalid_jobs():
+    with pytest.raises(SystemExit) as error:
+        kakuro_solver.main(["--jobs", "0"])
+
+    assert error.value.code == kakuro_solver.EXIT_USAGE
+
+def test_backtracking_does_not_import_ortools():
+    root = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    code = (
+        "import sys\n"
+        "from src import kakuro_solver\n"
+        "kakuro_solver.create_solver('backtracking')\n"
+        "print(any(name.startswith('ortools') for name in sys.modules))\n"
+    )
+    output = subprocess.run([sys.executable, "-c", code], cwd=root, capture_output=True, text=True, check=True)
+
+    assert output.stdout.strip() == "False"
\ No newline at end of file